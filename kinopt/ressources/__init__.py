@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Icons and logos of the graphical interface.
+
+The resources are registered from the binary file 'ressources.rcc', which is mapped by Qt
+instead of being imported as Python byte literals (ressources_rc.py). After a change of
+'ressources.qrc', both files are generated with::
+
+    rcc -binary ressources.qrc -o ressources.rcc
+    pyrcc5 ressources.qrc -o ressources_rc.py
+"""
+
+import os
+
+
+def load_ressources():
+    """
+    Register the resources of the graphical interface, from 'ressources.rcc' if it exists, otherwise from ressources_rc.py.
+
+    Returns
+    -------
+    bool
+        True if the binary file was registered, False if the Python module was imported.
+    """
+    from PyQt5.QtCore import QResource
+    rcc_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ressources.rcc")
+    if os.path.exists(rcc_path) and QResource.registerResource(rcc_path):
+        return True
+    from ressources import ressources_rc
+    return False
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+The checkpoint module allows to save the state of an optimization periodically and to resume it.
+
+A long global optimization (hours of basinhopping or differential evolution) is otherwise lost if
+the program crashes, the window is closed or the optimization is cancelled.
+
+The state saved depends on the optimization method:
+
+* differential_evolution: population and energies of the population, best parameters and cost
+* basinhopping: current minimum, best parameters and cost
+* local optimization (scipy.optimize.minimize) and shgo: last and best parameters and cost
+
+The number of iterations done and the state of the random number generator are saved for all methods.
+When resuming, the optimization restarts from the saved state with the remaining number of iterations.
+
+.. note::
+    When differential evolution is resumed, the energies of the saved population are computed again
+    by scipy (one generation), because scipy.optimize.differential_evolution() doesn't accept them.
+    The adaptive step size of basinhopping restarts from the configured step size.
+"""
+
+import json
+import time as time_module
+import numpy as np
+
+import results_storage
+
+
+CHECKPOINT_VERSION = 1
+
+# Default number of iterations of each method, used to compute the remaining iterations
+DEFAULT_NUMBER_OF_ITERATIONS = {"differential_evolution": 1000, "basinhopping": 100}
+
+
+def save_checkpoint(state, checkpoint_path):
+    """
+    Save the state of an optimization (see results_storage.open_atomically).
+
+    Parameters
+    ----------
+    state : dict
+        State of the optimization. Arrays are converted to lists.
+    checkpoint_path : str
+        Path of the checkpoint file.
+    """
+    serializable_state = {key: value.tolist() if isinstance(value, np.ndarray) else value for key, value in state.items()}
+    with results_storage.open_atomically(checkpoint_path) as file:
+        json.dump(serializable_state, file)
+
+
+def load_checkpoint(checkpoint_path):
+    """
+    Load the state of an optimization.
+
+    Parameters
+    ----------
+    checkpoint_path : str
+        Path of the checkpoint file.
+
+    Returns
+    -------
+    dict
+        State of the optimization, see OptimizationCheckpoint.
+
+    Raises
+    ------
+    ValueError
+        If the file isn't a checkpoint of this version of KinOpt.
+    """
+    with open(checkpoint_path, 'r') as file:
+        state = json.load(file)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"The file {checkpoint_path} isn't a valid checkpoint.")
+    for key in ('x', 'best_x', 'population', 'population_energies'):
+        if state.get(key) is not None:
+            state[key] = np.array(state[key])
+    return state
+
+
+class OptimizationCheckpoint:
+    """
+    Record the state of an optimization through its callback and save it periodically.
+
+    Attributes
+    ----------
+    checkpoint_path : str
+        Path of the checkpoint file.
+    interval : float
+        Minimum time between two saves, in seconds.
+    resume_state : dict or None
+        State loaded from the checkpoint file when resuming, None otherwise.
+    state : dict
+        Current state of the optimization.
+    parameter_names : list or None
+        Names of the parameters to optimize, used to check that a checkpoint matches the optimization.
+    random_generator : numpy.random.Generator or None
+        Random number generator given to the global optimization.
+    """
+    def __init__(self, checkpoint_path, interval=60, resume=False, parameter_names=None):
+        self.checkpoint_path = checkpoint_path
+        self.interval = interval
+        self.parameter_names = list(parameter_names) if parameter_names is not None else None
+        self.resume_state = load_checkpoint(checkpoint_path) if resume else None
+        self.state = {}
+        self.random_generator = None
+        self.last_save_time = None
+
+    @property
+    def number_of_iterations(self):
+        """int: Number of iterations done, including the iterations done before resuming."""
+        return self.state.get('nit', 0)
+
+    def prepare(self, method, initial_guess, global_optimization_args_dict, local_optimization_args_dict):
+        """
+        Set up the state and the arguments of the optimization, restoring the checkpoint when resuming.
+
+        Parameters
+        ----------
+        method : str
+            Global optimization method, or 'minimize' if there's only a local optimization.
+        initial_guess : numpy.ndarray
+            Initial guess of the parameters.
+        global_optimization_args_dict : dict
+            Arguments of the global optimization (modified in place).
+        local_optimization_args_dict : dict or None
+            Arguments of scipy.optimize.minimize() (modified in place).
+
+        Returns
+        -------
+        numpy.ndarray
+            Initial guess of the optimization.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint was saved by another method or for other parameters.
+        """
+        self.state = {"version": CHECKPOINT_VERSION, "method": method, "parameter_names": self.parameter_names,
+                      "nit": 0, "x": np.asarray(initial_guess, dtype=float), "fun": None, "best_x": None, "best_fun": None,
+                      "population": None, "population_energies": None, "random_state": None, "finished": False}
+        resume_state = self.resume_state
+        if resume_state is not None:
+            if resume_state['method'] != method:
+                raise ValueError(f"The checkpoint was saved by {resume_state['method']}, not by {method}.")
+            if self.parameter_names is not None and resume_state['parameter_names'] not in (None, self.parameter_names):
+                raise ValueError(f"The checkpoint was saved for the parameters {resume_state['parameter_names']}.")
+            self.state.update({key: resume_state[key] for key in ('nit', 'x', 'fun', 'best_x', 'best_fun', 'population', 'population_energies')})
+
+        if method in ('differential_evolution', 'basinhopping'):
+            # A generator is given as seed so that its state can be saved and restored
+            self.random_generator = np.random.default_rng(global_optimization_args_dict.get('seed'))
+            if resume_state is not None and resume_state['random_state'] is not None:
+                self.random_generator.bit_generator.state = resume_state['random_state']
+            global_optimization_args_dict['seed'] = self.random_generator
+
+        if resume_state is not None:
+            if method == 'differential_evolution':
+                global_optimization_args_dict['init'] = self.state['population']
+            iterations_key = 'niter' if method == 'basinhopping' else 'maxiter'
+            if method in DEFAULT_NUMBER_OF_ITERATIONS:
+                total_number_of_iterations = global_optimization_args_dict.get(iterations_key, DEFAULT_NUMBER_OF_ITERATIONS[method])
+                global_optimization_args_dict[iterations_key] = max(total_number_of_iterations - self.state['nit'], 1)
+            elif method == 'minimize' and 'maxiter' in local_optimization_args_dict.get('options', {}):
+                options = dict(local_optimization_args_dict['options'])
+                options['maxiter'] = max(options['maxiter'] - self.state['nit'], 1)
+                local_optimization_args_dict['options'] = options
+            return np.array(self.state['x'], dtype=float)
+        return np.asarray(initial_guess, dtype=float)
+
+    def record(self, x, fun=None, accept=True, population=None, population_energies=None, is_iteration=True):
+        """
+        Record the state after an iteration and save it if the interval has elapsed.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Parameters at the end of the iteration.
+        fun : float, optional
+            Cost at the end of the iteration. Default is None.
+        accept : bool, optional
+            Whether the minimum found by basinhopping was accepted. Default is True.
+        population : numpy.ndarray, optional
+            Population of differential evolution. Default is None.
+        population_energies : numpy.ndarray, optional
+            Energies of the population of differential evolution. Default is None.
+        is_iteration : bool, optional
+            Whether the call follows an iteration (False for the initial minimization of basinhopping). Default is True.
+        """
+        if is_iteration:
+            self.state['nit'] += 1
+        if accept:
+            self.state['x'] = np.array(x, dtype=float)
+            self.state['fun'] = None if fun is None else float(fun)
+        if fun is not None and (self.state['best_fun'] is None or fun < self.state['best_fun']):
+            self.state['best_x'] = np.array(x, dtype=float)
+            self.state['best_fun'] = float(fun)
+        if population is not None:
+            self.state['population'] = np.array(population, dtype=float)
+            self.state['population_energies'] = np.array(population_energies, dtype=float)
+        if self.last_save_time is None:
+            self.last_save_time = time_module.time()
+        elif time_module.time() - self.last_save_time >= self.interval:
+            self.save()
+
+    def save(self):
+        """Save the current state in the checkpoint file."""
+        state = dict(self.state)
+        if self.random_generator is not None:
+            state['random_state'] = self.random_generator.bit_generator.state
+        save_checkpoint(state, self.checkpoint_path)
+        self.last_save_time = time_module.time()
+
+    def wrap_callback(self, callback=None):
+        """
+        Create a callback recording the state, with the signature expected by the optimization method.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Callback called after the state is recorded, with the usual arguments of the method. Default is None.
+
+        Returns
+        -------
+        callable
+            Callback to give to the optimization.
+        """
+        if self.state['method'] == 'differential_evolution':
+            def checkpoint_callback(intermediate_result):
+                self.record(intermediate_result.x, intermediate_result.fun,
+                            population=intermediate_result.population,
+                            population_energies=intermediate_result.population_energies)
+                if callback is not None:
+                    return callback(intermediate_result.x, intermediate_result.convergence)
+        elif self.state['method'] == 'basinhopping':
+            # The first call follows the minimization of the initial guess, before the first iteration
+            is_first_call = [True]
+
+            def checkpoint_callback(x, f, accept):
+                self.record(x, f, accept, is_iteration=not is_first_call[0])
+                is_first_call[0] = False
+                if callback is not None:
+                    return callback(x, f, accept)
+        else:
+            def checkpoint_callback(xk, *args):
+                self.record(xk)
+                if callback is not None:
+                    return callback(xk, *args)
+        return checkpoint_callback
+
+    def finish(self, result):
+        """
+        Save the final state and keep the best result found before resuming.
+
+        Parameters
+        ----------
+        result : scipy.optimize.OptimizeResult
+            Result of the optimization.
+
+        Returns
+        -------
+        scipy.optimize.OptimizeResult
+            Result, with the best parameters of the checkpoint if they are better.
+        """
+        if self.state['best_fun'] is not None and self.state['best_fun'] < result.fun:
+            result.x = self.state['best_x']
+            result.fun = self.state['best_fun']
+        result.nit = self.state['nit']
+        self.state['finished'] = True
+        self.save()
+        return result
+
+
+if __name__ == "__main__":
+    print("You've run the checkpoint module.")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+The cli module allows to run analyses from the command line, without the graphical interface.
+
+Each configuration file describes one analysis (see the pipeline module). The results of each
+analysis are written in the output folder as '<name>_results.json'.
+
+Example::
+
+    python cli.py ../configs/kamal.json ../configs/autocatalytic.toml --output-directory ../results
+
+A batch of datasets x models (see the scheduler module) is run in parallel processes with::
+
+    python cli.py --manifest ../configs/formulations.json --workers 4 --timeout 600 --retries 1
+
+.. note::
+    The process returns a nonzero exit code if any analysis fails, so that it can be used in scripts.
+"""
+
+import os
+import sys
+import argparse
+import traceback
+
+import pipeline
+import scheduler
+
+
+def parse_arguments(arguments=None):
+    """
+    Parse the arguments of the command line.
+
+    Parameters
+    ----------
+    arguments : list, optional
+        Arguments to parse. Default is None (arguments of the command line).
+
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments.
+    """
+    default_output_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'results'))
+    parser = argparse.ArgumentParser(description="Run KinOpt analyses described in configuration files (JSON or TOML).")
+    parser.add_argument("config_paths", nargs='*', help="Path of the configuration files.")
+    parser.add_argument("--output-directory", default=default_output_directory,
+                        help="Folder where the results are written. Default is the 'results' folder of KinOpt.")
+    parser.add_argument("--manifest", help="Path of a manifest of datasets and models to run as a batch of jobs.")
+    parser.add_argument("--workers", type=int, help="Number of processes of the batch. Default is the value of the manifest.")
+    parser.add_argument("--timeout", type=float, help="Maximum duration of a job of the batch, in seconds.")
+    parser.add_argument("--retries", type=int, help="Number of new attempts of a failed job of the batch.")
+    parsed_arguments = parser.parse_args(arguments)
+    if not parsed_arguments.config_paths and parsed_arguments.manifest is None:
+        parser.error("Please give configuration files or a manifest.")
+    return parsed_arguments
+
+
+def main(arguments=None):
+    """
+    Run the analysis of each configuration file.
+
+    Parameters
+    ----------
+    arguments : list, optional
+        Arguments of the command line. Default is None.
+
+    Returns
+    -------
+    int
+        0 if all analyses (and jobs of the batch) succeeded, 1 otherwise.
+    """
+    parsed_arguments = parse_arguments(arguments)
+    exit_code = 0
+    if parsed_arguments.manifest is not None:
+        state = scheduler.run_batch(parsed_arguments.manifest, parsed_arguments.output_directory,
+                                    parsed_arguments.workers, parsed_arguments.timeout, parsed_arguments.retries)
+        number_of_done_jobs = sum(job_state['status'] == "done" for job_state in state.values())
+        print(f"{parsed_arguments.manifest}: {number_of_done_jobs}/{len(state)} jobs done")
+        if number_of_done_jobs != len(state):
+            exit_code = 1
+    for config_path in parsed_arguments.config_paths:
+        try:
+            config = pipeline.load_config(config_path)
+            results = pipeline.run_pipeline(config, parsed_arguments.output_directory)
+            print(f"{config_path}: done in {results['total_time']:.1f} s, results written in {results['results_path']}")
+        except Exception as e:
+            traceback.print_exc()
+            print(f"{config_path}: failed ({e})")
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,107 +7,518 @@ of provided data.
 
 .. note::
     To improve computational costs, the data is retrieved as numpy arrays.
+    
+.. note::
+    For very large files, the data can be converted once into a binary file and retrieved as
+    memory-mapped arrays (``use_memmap=True``) so that it is paged in on demand instead of being
+    held in memory.
+
+.. note::
+    To follow files that are still being written, ``IncrementalExtraction`` re-extracts only
+    the files whose modification time, size and content changed since the last update.
 """
 
 import numpy as np
 import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
 
-def extract_dsc_data_multiple_files(file_paths, delimiter=',', has_header=False, skip_lines=0):
+def get_memmap_cache_path(file_path, delimiter=',', has_header=False, skip_lines=0, cache_directory=None):
     """
-    Extract DSC data from multiple txt or csv files and perform data validation.
+    Get the path of the binary file used to memory-map the data of an input file.
+
+    The name of the binary file depends on the path of the input file, and on the parsing options and 
+    the modification time and size of the input file, so that a modified file or a file read with different 
+    options is converted again. Binary files that are still memory-mapped are therefore never overwritten.
 
     Parameters
     ----------
-    file_paths : list
-        List of file paths to input txt or csv files containing DSC data.
+    file_path : str
+        File path to the input txt or csv file containing DSC data.
     delimiter : str, optional
-        Delimiter used in the input files. Default is ','.
+        Delimiter used in the input file. Default is ','.
     has_header : bool, optional
-        Whether the input files have headers. Default is False.
+        Whether the input file has headers. Default is False.
     skip_lines : int, optional
-        Number of lines to skip at the beginning of each file. Default is 0.
+        Number of lines to skip at the beginning of the file. Default is 0.
+    cache_directory : str, optional
+        Directory where the binary file is stored. Default is a '.kinopt_cache' folder next to the input file.
 
     Returns
     -------
-    Tuple of concatenated numpy arrays
+    str
+        Path of the binary .npy file.
+    """
+    file_path = os.path.abspath(file_path)
+    if cache_directory is None:
+        cache_directory = os.path.join(os.path.dirname(file_path), ".kinopt_cache")
+    file_stat = os.stat(file_path)
+    path_hash = hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:8]
+    options = f"{file_stat.st_mtime_ns}|{file_stat.st_size}|{delimiter}|{has_header}|{skip_lines}"
+    options_hash = hashlib.sha1(options.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_directory, f"{os.path.basename(file_path)}.{path_hash}.{options_hash}.npy")
+
+
+def read_dsc_file(file_path, delimiter=',', has_header=False, skip_lines=0):
+    """
+    Read the values of a txt or csv file containing DSC data.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to the input txt or csv file containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input file. Default is ','.
+    has_header : bool, optional
+        Whether the input file has headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of the file. Default is 0.
+
+    Returns
+    -------
+    numpy.ndarray
+        Values of the file (one column per column of the file).
+
+    Raises
+    ------
+    ValueError
+        If a value of the file is missing or isn't a number.
+    """
+    if has_header:
+        return np.loadtxt(file_path, delimiter=delimiter, skiprows=1 + skip_lines)  # Skip the header and specified lines
+    return np.loadtxt(file_path, delimiter=delimiter, skiprows=skip_lines)
+
+
+def convert_to_memmap(file_path, delimiter=',', has_header=False, skip_lines=0, cache_directory=None):
+    """
+    Convert a txt or csv file containing DSC data into a binary file that can be memory-mapped.
+
+    The data is stored as a (4, number_of_points) float64 array so that each column 
+    (time, temperature, rate and extent) is contiguous on disk. The conversion is only 
+    performed if no binary file exists for the current version of the input file.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to the input txt or csv file containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input file. Default is ','.
+    has_header : bool, optional
+        Whether the input file has headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of the file. Default is 0.
+    cache_directory : str, optional
+        Directory where the binary file is stored. Default is a '.kinopt_cache' folder next to the input file.
+
+    Returns
+    -------
+    str
+        Path of the binary .npy file.
+    """
+    cache_path = get_memmap_cache_path(file_path, delimiter, has_header, skip_lines, cache_directory)
+    if os.path.exists(cache_path):
+        return cache_path
+    
+    # Same parser as the extraction in memory, so that both accept and reject the same files
+    data = read_dsc_file(file_path, delimiter, has_header, skip_lines)[:, :4]
+    
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Write in a temporary file first so that an interrupted conversion never leaves a corrupted cache
+    temporary_path = cache_path + ".tmp.npy"
+    memmap = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=np.float64, shape=(4, data.shape[0]))
+    memmap[:] = data.T
+    memmap.flush()
+    del memmap
+    os.replace(temporary_path, cache_path)
+    remove_stale_memmaps(cache_path)
+    return cache_path
+
+
+def remove_stale_memmaps(cache_path_to_keep):
+    """
+    Remove the binary files of the previous versions of an input file, which are never used again.
+
+    Parameters
+    ----------
+    cache_path_to_keep : str
+        Path of the binary file of the current version of the input file (see get_memmap_cache_path).
+
+    Returns
+    -------
+    None
+    """
+    cache_directory, cache_name = os.path.split(cache_path_to_keep)
+    # The binary files of the same input file only differ by the hash of the options
+    prefix = cache_name.rsplit(".", 2)[0] + "."
+    for file_name in os.listdir(cache_directory):
+        cache_path = os.path.join(cache_directory, file_name)
+        if (file_name.startswith(prefix) and file_name.endswith(".npy") and ".tmp." not in file_name
+                and cache_path != cache_path_to_keep):
+            try:
+                os.remove(cache_path)
+            except OSError:
+                # The file is still mapped (e.g. on Windows), it is removed at the next conversion
+                pass
+
+
+def load_memmap(file_path, delimiter=',', has_header=False, skip_lines=0, cache_directory=None):
+    """
+    Load the data of a txt or csv file as a read-only memory-mapped array.
+
+    The file is converted into a binary file on first use (see :func:`convert_to_memmap`).
+
+    Parameters
+    ----------
+    file_path : str
+        File path to the input txt or csv file containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input file. Default is ','.
+    has_header : bool, optional
+        Whether the input file has headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of the file. Default is 0.
+    cache_directory : str, optional
+        Directory where the binary file is stored. Default is a '.kinopt_cache' folder next to the input file.
+
+    Returns
+    -------
+    numpy.memmap
+        Array of shape (4, number_of_points) with rows (time, temperature, rate_of_reaction, extent_of_reaction).
+    """
+    cache_path = convert_to_memmap(file_path, delimiter, has_header, skip_lines, cache_directory)
+    return np.load(cache_path, mmap_mode='r')
+
+
+def get_complete_reaction_index(extent_of_reaction):
+    """
+    Get the number of points to keep so that data after the extent reaches 1 is removed.
+
+    Parameters
+    ----------
+    extent_of_reaction : numpy.ndarray
+        Extent of reaction.
+
+    Returns
+    -------
+    int
+        Index (excluded) of the last point to keep.
+    """
+    complete = extent_of_reaction >= 1
+    if np.any(complete):
+        return np.argmax(complete) + 1
+    return len(extent_of_reaction)
+
+
+def concatenate_in_memmap(arrays_lists, cache_path):
+    """
+    Concatenate the data of multiple files into a single memory-mapped binary file.
+
+    If the binary file already exists, it is loaded without being written again.
+
+    Parameters
+    ----------
+    arrays_lists : list
+        List of (time, temperature, rate_of_reaction, extent_of_reaction) tuples, one per file.
+    cache_path : str
+        Path of the binary .npy file to create.
+
+    Returns
+    -------
+    Tuple of numpy.memmap
         (time, temperature, rate_of_reaction, extent_of_reaction)
     """
+    if not os.path.exists(cache_path):
+        write_concatenated_memmap(arrays_lists, cache_path)
+        remove_concatenated_memmaps(os.path.dirname(cache_path), cache_path)
+    data = np.load(cache_path, mmap_mode='r')
+    return data[0], data[1], data[2], data[3]
+
+
+def remove_concatenated_memmaps(cache_directory, cache_path_to_keep):
+    """
+    Remove the concatenated binary files of the previous selections of files, which would duplicate the data on disk.
+
+    The binary files of each input file are kept, the concatenation of a selection can be rebuilt from them.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Directory of the binary files.
+    cache_path_to_keep : str
+        Path of the concatenated binary file of the current selection.
+
+    Returns
+    -------
+    None
+    """
+    for file_name in os.listdir(cache_directory):
+        cache_path = os.path.join(cache_directory, file_name)
+        if file_name.startswith("concatenated.") and file_name.endswith(".npy") and cache_path != cache_path_to_keep:
+            try:
+                os.remove(cache_path)
+            except OSError:
+                # The file is still mapped (e.g. on Windows), it is removed at the next selection
+                pass
+
+
+def write_concatenated_memmap(arrays_lists, cache_path):
+    """
+    Write the data of multiple files one after the other in a binary .npy file.
+
+    Parameters
+    ----------
+    arrays_lists : list
+        List of (time, temperature, rate_of_reaction, extent_of_reaction) tuples, one per file.
+    cache_path : str
+        Path of the binary .npy file to create.
+
+    Returns
+    -------
+    None
+    """
+    total_number_of_points = sum(len(arrays[0]) for arrays in arrays_lists)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temporary_path = cache_path + ".tmp.npy"
+    memmap = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=np.float64, shape=(4, total_number_of_points))
+    start = 0
+    for arrays in arrays_lists:
+        end = start + len(arrays[0])
+        for column, array in enumerate(arrays):
+            memmap[column, start:end] = array
+        start = end
+    memmap.flush()
+    del memmap
+    os.replace(temporary_path, cache_path)
+
+
+class ValidationReport:
+    """
+    Result of the validation of the data contained in one input file.
+
+    Attributes
+    ----------
+    file_name : str
+        Name of the validated file.
+    errors : list
+        Messages of the checks that failed. The data shouldn't be used if there's any error.
+    warnings : list
+        Messages of the checks that indicate a probable issue with the data.
+    infos : list
+        Informative messages about the data.
+    """
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.errors = []
+        self.warnings = []
+        self.infos = []
+    
+    @property
+    def is_valid(self):
+        """bool: True if no error was found in the file."""
+        return len(self.errors) == 0
+    
+    def to_text(self):
+        """
+        Format the messages of the report.
+
+        Returns
+        -------
+        str
+            One line per message, errors first, then warnings and infos.
+        """
+        messages = [f"Error in file {self.file_name}: {message}" for message in self.errors]
+        messages += [f"Warning in file {self.file_name}: {message}" for message in self.warnings]
+        messages += [f"Info in file {self.file_name}: {message}" for message in self.infos]
+        return "\n".join(messages)
+
+
+def validate_dsc_data(time, temperature, rate_of_reaction, extent_of_reaction, file_name=""):
+    """
+    Check the validity of the data of one DSC experiment.
+
+    The checks are vectorized passes over the arrays and don't rely on any global state, 
+    so multiple files can be validated concurrently.
+
+    Parameters
+    ----------
+    time : numpy.ndarray
+        Time of the experiment.
+    temperature : numpy.ndarray
+        Temperature of the experiment.
+    rate_of_reaction : numpy.ndarray
+        Rate of reaction of the experiment.
+    extent_of_reaction : numpy.ndarray
+        Extent of reaction of the experiment.
+    file_name : str, optional
+        Name of the file the data comes from. Default is "".
+
+    Returns
+    -------
+    ValidationReport
+        Report containing the errors, warnings and infos found in the data.
+    """
+    report = ValidationReport(file_name)
+    
+    if len(time) < 2:
+        report.errors.append("The file should contain at least two data points.")
+        return report
+    
+    # Check if extent of reaction is within [0, 1] range
+    initial_extent = extent_of_reaction[0]
+    final_extent = extent_of_reaction[-1]
+    if initial_extent < 0 or initial_extent > 1 or final_extent < 0 or final_extent > 1:
+        report.errors.append(f"Extent of reaction should be between 0 and 1. Initial extent: {initial_extent}, Final extent: {final_extent}")
+    else:
+        report.infos.append(f"Initial extent: {initial_extent}, Final extent: {final_extent}")
+    
+    # Warn about issues with initial extent being zero
+    if initial_extent == 0:
+        report.infos.append("Initial extent being zero can lead to issues for some kinetic models.")
+    
+    # Check if extent of reaction is non-decreasing
+    if np.any(extent_of_reaction[1:] < extent_of_reaction[:-1]):
+        report.errors.append("Extent of reaction is not non-decreasing.")
+    
+    # Check temperature unit
+    if temperature[0] < 173.15:
+        report.warnings.append("Starting temperature should be in Kelvin not Celsius. Make sure you're using the appropriate units.")
+    
+    # Integral of reaction rate (trapezoidal rule) should be equal to extent of reaction recorded
+    integral_rate = 0.5 * np.dot(time[1:] - time[:-1], rate_of_reaction[1:] + rate_of_reaction[:-1])
+    if not np.isclose(integral_rate, final_extent - initial_extent):
+        report.errors.append("Integral of rate of reaction is not equal to the final extent.")
+    
+    return report
+
+
+def extract_and_validate_dsc_data(file_path, delimiter=',', has_header=False, skip_lines=0, use_memmap=False, cache_directory=None):
+    """
+    Extract DSC data from one txt or csv file and validate it.
+
+    Errors happening while reading the file are stored in the report instead of being raised.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to input txt or csv file containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input file. Default is ','.
+    has_header : bool, optional
+        Whether the input file has headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of the file. Default is 0.
+    use_memmap : bool, optional
+        Whether to return memory-mapped arrays instead of loading the data in memory. Default is False.
+    cache_directory : str, optional
+        Directory where the binary file is stored when use_memmap is True.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - tuple or None: (time, temperature, rate_of_reaction, extent_of_reaction) with data 
+              after extent reaches 1 removed, or None if the file couldn't be read.
+            - ValidationReport: Report of the validation of the file.
+    """
+    file_name = os.path.basename(file_path)
     try:
-        concatenated_time = []
-        concatenated_temperature = []
-        concatenated_rate_of_reaction = []
-        concatenated_extent_of_reaction = []
-        
-        for file_path in file_paths:
-            # Load data from the file
-            if has_header:
-                data = np.genfromtxt(file_path, delimiter=delimiter, skip_header=1 + skip_lines)  # Skip the header and specified lines
-            else:
-                data = np.genfromtxt(file_path, delimiter=delimiter, skip_header=skip_lines)
+        if use_memmap:
+            data = load_memmap(file_path, delimiter, has_header, skip_lines, cache_directory)
+            time, temperature, rate_of_reaction, extent_of_reaction = data[0], data[1], data[2], data[3]
+        else:
+            data = read_dsc_file(file_path, delimiter, has_header, skip_lines)
             
             # Separate columns from the data
             time = data[:, 0]
             temperature = data[:, 1]
             rate_of_reaction = data[:, 2]
             extent_of_reaction = data[:, 3]
-            
-            # Check if extent of reaction is within [0, 1] range
-            initial_extent = extent_of_reaction[0]
-            final_extent = extent_of_reaction[-1]
-            
-            # Integral of reaction rate should be equal to extent of reaction
-            extent_of_reaction_recorded = extent_of_reaction[-1]-extent_of_reaction[0]
-            
-            if initial_extent < 0 or initial_extent > 1 or final_extent < 0 or final_extent > 1:
-                print(f"Error in file {os.path.basename(file_path)}: Extent of reaction should be between 0 and 1. Initial extent: {initial_extent}, Final extent: {final_extent}")
-            else:
-                print(f"Info in file {os.path.basename(file_path)}:\n Initial extent: {initial_extent}, Final extent: {final_extent}")
-            
-            # Warn about issues with initial extent being zero
-            if initial_extent == 0:
-                print(f"Info: in file {os.path.basename(file_path)}: Initial extent being zero can lead to issues for some kinetic models.")
-            
-            # Check if extent of reaction is non-decreasing
-            if not np.all(np.diff(extent_of_reaction) >= 0):
-                print(f"Error in file {os.path.basename(file_path)}: Extent of reaction is not non-decreasing.")
-            
-            # Check temperature unit
-            if temperature[0] < 173.15:
-                print(f"Warning in file {os.path.basename(file_path)}: Starting temperature should be in Kelvin not Celsius.\n Make sure you're using the appropriate units.")
-            
-            # Calculate the integral of rate of reaction and compare with global extent
-            integral_rate = np.trapz(rate_of_reaction, time)
-            if not np.isclose(integral_rate, extent_of_reaction_recorded):
-                print(f"Error in file {os.path.basename(file_path)}: Integral of rate of reaction is not equal to the final extent.")
-            
-            #Check if there's extent equal or greater than 1
-            if np.any(extent_of_reaction >= 1):
-                # Remove data after extent reaches 1
-                complete_reaction_index = np.argmax(extent_of_reaction >= 1) + 1
-            else:
-                complete_reaction_index = len(extent_of_reaction)
-            
-            time = time[:complete_reaction_index]
-            temperature = temperature[:complete_reaction_index]
-            rate_of_reaction = rate_of_reaction[:complete_reaction_index]
-            extent_of_reaction = extent_of_reaction[:complete_reaction_index]
-            
-            concatenated_time.extend(time)
-            concatenated_temperature.extend(temperature)
-            concatenated_rate_of_reaction.extend(rate_of_reaction)
-            concatenated_extent_of_reaction.extend(extent_of_reaction)
-        
-        concatenated_time = np.array(concatenated_time)
-        concatenated_temperature = np.array(concatenated_temperature)
-        concatenated_rate_of_reaction = np.array(concatenated_rate_of_reaction)
-        concatenated_extent_of_reaction = np.array(concatenated_extent_of_reaction)
-
-        return concatenated_time, concatenated_temperature, concatenated_rate_of_reaction, concatenated_extent_of_reaction
     except Exception as e:
-        print(f"Error in file {os.path.basename(file_path)}:{e}")
+        report = ValidationReport(file_name)
+        report.errors.append(f"The file couldn't be read: {e}")
+        return None, report
+    
+    report = validate_dsc_data(time, temperature, rate_of_reaction, extent_of_reaction, file_name)
+    
+    # Remove data after extent reaches 1
+    complete_reaction_index = get_complete_reaction_index(extent_of_reaction)
+    arrays = (time[:complete_reaction_index],
+              temperature[:complete_reaction_index],
+              rate_of_reaction[:complete_reaction_index],
+              extent_of_reaction[:complete_reaction_index])
+    return arrays, report
+
+
+def extract_dsc_data_multiple_files(file_paths, delimiter=',', has_header=False, skip_lines=0, use_memmap=False, cache_directory=None, return_reports=False, workers=1):
+    """
+    Extract DSC data from multiple txt or csv files and perform data validation.
+
+    Parameters
+    ----------
+    file_paths : list
+        List of file paths to input txt or csv files containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input files. Default is ','.
+    has_header : bool, optional
+        Whether the input files have headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of each file. Default is 0.
+    use_memmap : bool, optional
+        Whether to convert the files into binary files and return memory-mapped arrays 
+        instead of loading the data in memory. Default is False.
+    cache_directory : str, optional
+        Directory where the binary files are stored when use_memmap is True.
+        Default is a '.kinopt_cache' folder next to each input file.
+    return_reports : bool, optional
+        Whether to return the validation report of each file. If False, the validation messages 
+        are printed instead. Default is False.
+    workers : int, optional
+        Number of threads used to read and validate the files concurrently. Default is 1.
+
+    Returns
+    -------
+    Tuple of concatenated numpy arrays (numpy.memmap if use_memmap is True)
+        (time, temperature, rate_of_reaction, extent_of_reaction), followed by the list of 
+        ValidationReport (one per file) if return_reports is True.
+        If a file couldn't be read, the arrays are replaced by None (0 if return_reports is False).
+    """
+    def extract_file(file_path):
+        return extract_and_validate_dsc_data(file_path, delimiter, has_header, skip_lines, use_memmap, cache_directory)
+    
+    if workers > 1 and len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            extracted_files = list(executor.map(extract_file, file_paths))
+    else:
+        extracted_files = [extract_file(file_path) for file_path in file_paths]
+    
+    arrays_lists = [arrays for arrays, _ in extracted_files]
+    reports = [report for _, report in extracted_files]
+    
+    if not return_reports:
+        for report in reports:
+            print(report.to_text())
+    
+    if any(arrays is None for arrays in arrays_lists) or len(arrays_lists) == 0:
+        if return_reports:
+            return None, None, None, None, reports
         return 0,0,0,0
+    
+    if use_memmap:
+        # The concatenated data is also stored on disk so that it is paged in on demand
+        per_file_cache_paths = [get_memmap_cache_path(file_path, delimiter, has_header, skip_lines, cache_directory) for file_path in file_paths]
+        files_hash = hashlib.sha1("|".join(per_file_cache_paths).encode("utf-8")).hexdigest()[:12]
+        cache_path = os.path.join(os.path.dirname(per_file_cache_paths[0]), f"concatenated.{files_hash}.npy")
+        concatenated_arrays = concatenate_in_memmap(arrays_lists, cache_path)
+    else:
+        concatenated_arrays = tuple(np.concatenate([arrays[column] for arrays in arrays_lists]) for column in range(4))
+    
+    if return_reports:
+        return (*concatenated_arrays, reports)
+    return concatenated_arrays
 
-def extract_dsc_data_single_file(file_path, delimiter=',', has_header=False, skip_lines=0):
+
+def extract_dsc_data_single_file(file_path, delimiter=',', has_header=False, skip_lines=0, use_memmap=False, cache_directory=None):
     """
     Extract DSC data from multiple txt or csv files and perform data validation.
 
@@ -121,31 +532,33 @@ def extract_dsc_data_single_file(file_path, delimiter=',', has_header=False, ski
         Whether the input file has headers. Default is False.
     skip_lines : int, optional
         Number of lines to skip at the beginning of the file. Default is 0.
+    use_memmap : bool, optional
+        Whether to convert the file into a binary file and return memory-mapped arrays 
+        instead of loading the data in memory. Default is False.
+    cache_directory : str, optional
+        Directory where the binary file is stored when use_memmap is True.
+        Default is a '.kinopt_cache' folder next to the input file.
 
     Returns
     -------
-    Tuple of numpy arrays
+    Tuple of numpy arrays (numpy.memmap if use_memmap is True)
         (time, temperature, rate_of_reaction, extent_of_reaction)
     """
     # Load data from the file
-    if has_header:
-        data = np.loadtxt(file_path, delimiter=delimiter, skiprows=1 + skip_lines)  # Skip the header and specified lines
+    if use_memmap:
+        data = load_memmap(file_path, delimiter, has_header, skip_lines, cache_directory)
+        time, temperature, rate_of_reaction, extent_of_reaction = data[0], data[1], data[2], data[3]
     else:
-        data = np.loadtxt(file_path, delimiter=delimiter, skiprows=skip_lines)
-    
-    # Separate columns from the data
-    time = data[:, 0]
-    temperature = data[:, 1]
-    rate_of_reaction = data[:, 2]
-    extent_of_reaction = data[:, 3]
-    
+        data = read_dsc_file(file_path, delimiter, has_header, skip_lines)
+        
+        # Separate columns from the data
+        time = data[:, 0]
+        temperature = data[:, 1]
+        rate_of_reaction = data[:, 2]
+        extent_of_reaction = data[:, 3]
     
-    #Check if there's extent equal or greater than 1
-    if np.any(extent_of_reaction >= 1):
-        # Remove data after extent reaches 1
-        complete_reaction_index = np.argmax(extent_of_reaction >= 1) + 1
-    else:
-        complete_reaction_index = len(extent_of_reaction)
+    # Remove data after extent reaches 1
+    complete_reaction_index = get_complete_reaction_index(extent_of_reaction)
         
     time = time[:complete_reaction_index]
     temperature = temperature[:complete_reaction_index]
@@ -155,6 +568,269 @@ def extract_dsc_data_single_file(file_path, delimiter=',', has_header=False, ski
     
     return time, temperature, rate_of_reaction, extent_of_reaction
 
+
+def get_file_signature(file_path):
+    """
+    Get a cheap signature of a file to detect modifications.
+
+    Parameters
+    ----------
+    file_path : str
+        File path.
+
+    Returns
+    -------
+    tuple or None
+        (modification time in ns, size in bytes), or None if the file doesn't exist.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_file_hash(file_path, chunk_size=1 << 20):
+    """
+    Compute the hash of the content of a file.
+
+    Parameters
+    ----------
+    file_path : str
+        File path.
+    chunk_size : int, optional
+        Size of the chunks read from the file. Default is 1 MiB.
+
+    Returns
+    -------
+    str
+        SHA-1 hash of the content of the file.
+    """
+    file_hash = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class IncrementalExtraction:
+    """
+    Extraction of a set of files re-extracting only the files that changed since the last update.
+
+    A file is considered changed if its modification time or size changed and, when 
+    compare_content is True, if the hash of its content changed as well (e.g. a file touched 
+    without modification is not re-extracted). 
+    If the re-extraction of a file fails (e.g. the instrument is still writing it), the previously 
+    extracted data of this file is kept and the error is stored in its report.
+    The files added to the folders are only followed once they are read and validated successfully 
+    (see add_new_files). The files are always re-extracted in memory: memory-mapping a file that changes 
+    would write a new binary file at each change.
+
+    Parameters
+    ----------
+    file_paths : list
+        List of file paths to input txt or csv files containing DSC data.
+    delimiter : str, optional
+        Delimiter used in the input files. Default is ','.
+    has_header : bool, optional
+        Whether the input files have headers. Default is False.
+    skip_lines : int, optional
+        Number of lines to skip at the beginning of each file. Default is 0.
+    compare_content : bool, optional
+        Whether to compare the hash of the content of the files whose signature changed. Default is True.
+
+    Attributes
+    ----------
+    arrays : dict
+        Extracted (time, temperature, rate_of_reaction, extent_of_reaction) of each file.
+    reports : dict
+        ValidationReport of the last extraction of each file.
+    rejected_files : dict
+        Signature of the new files that couldn't be read or validated, which are only extracted again once they change.
+    """
+    def __init__(self, file_paths, delimiter=',', has_header=False, skip_lines=0, compare_content=True):
+        self.file_paths = list(file_paths)
+        self.delimiter = delimiter
+        self.has_header = has_header
+        self.skip_lines = skip_lines
+        self.compare_content = compare_content
+        self.signatures = {}
+        self.hashes = {}
+        self.arrays = {}
+        self.reports = {}
+        self.rejected_files = {}
+        self._concatenated_arrays = None
+
+    def add_extracted_files(self, file_paths, arrays_lists):
+        """
+        Follow files that are already extracted, without extracting them again.
+
+        Parameters
+        ----------
+        file_paths : list
+            File paths of the extracted files.
+        arrays_lists : list
+            Extracted (time, temperature, rate_of_reaction, extent_of_reaction) of each file.
+        """
+        for file_path, arrays in zip(file_paths, arrays_lists):
+            if file_path not in self.file_paths:
+                self.file_paths.append(file_path)
+            self.signatures[file_path] = get_file_signature(file_path)
+            self.hashes[file_path] = get_file_hash(file_path) if self.compare_content else None
+            self.arrays[file_path] = tuple(arrays)
+        self._concatenated_arrays = None
+
+    def get_changed_files(self):
+        """
+        Get the files that are new or changed since the last update.
+
+        Returns
+        -------
+        list
+            File paths to re-extract.
+        """
+        changed_files = []
+        for file_path in self.file_paths:
+            signature = get_file_signature(file_path)
+            if signature is None or signature == self.signatures.get(file_path):
+                continue
+            if self.compare_content and file_path in self.hashes:
+                file_hash = get_file_hash(file_path)
+                if file_hash == self.hashes[file_path]:
+                    # Content unchanged, only the signature is updated
+                    self.signatures[file_path] = signature
+                    continue
+            changed_files.append(file_path)
+        return changed_files
+
+    def find_new_files(self):
+        """
+        Find the files added to the folders of the followed files, with the same extensions.
+
+        Returns
+        -------
+        list
+            Sorted file paths not followed yet.
+        """
+        directories = {os.path.dirname(file_path) for file_path in self.file_paths}
+        extensions = {os.path.splitext(file_path)[1].lower() for file_path in self.file_paths}
+        followed_files = {os.path.normcase(os.path.abspath(file_path)) for file_path in self.file_paths}
+        new_files = []
+        for directory in directories:
+            for entry in os.scandir(directory or '.'):
+                if (entry.is_file()
+                        and os.path.splitext(entry.name)[1].lower() in extensions
+                        and os.path.normcase(os.path.abspath(entry.path)) not in followed_files):
+                    new_files.append(os.path.join(directory, entry.name))
+        return sorted(new_files)
+
+    def add_new_files(self):
+        """
+        Extract the files added to the folders (see find_new_files) and follow the ones that are valid.
+
+        A file that can't be read or isn't valid (e.g. an unrelated file, or a run still being written) 
+        isn't followed, and is only extracted again once its signature changed.
+
+        Returns
+        -------
+        list
+            File paths added to the followed files.
+        """
+        added_files = []
+        for file_path in self.find_new_files():
+            signature = get_file_signature(file_path)
+            if signature is None or self.rejected_files.get(file_path) == signature:
+                continue
+            file_hash = get_file_hash(file_path) if self.compare_content else None
+            arrays, report = extract_and_validate_dsc_data(file_path, self.delimiter, self.has_header, self.skip_lines)
+            if arrays is None or not report.is_valid:
+                self.rejected_files[file_path] = signature
+                continue
+            self.rejected_files.pop(file_path, None)
+            self.file_paths.append(file_path)
+            self.signatures[file_path] = signature
+            self.hashes[file_path] = file_hash
+            self.arrays[file_path] = arrays
+            self.reports[file_path] = report
+            added_files.append(file_path)
+        if added_files:
+            self._concatenated_arrays = None
+        return added_files
+
+    def update(self, file_paths=None):
+        """
+        Re-extract the new and changed files.
+
+        Parameters
+        ----------
+        file_paths : list, optional
+            New set of files to follow. Files that are no longer in the set are forgotten. 
+            Default is None (same set of files).
+
+        Returns
+        -------
+        list
+            File paths that were re-extracted successfully.
+        """
+        if file_paths is not None:
+            self.file_paths = list(file_paths)
+            for dictionary in (self.signatures, self.hashes, self.arrays, self.reports):
+                for file_path in list(dictionary):
+                    if file_path not in self.file_paths:
+                        del dictionary[file_path]
+            self._concatenated_arrays = None
+
+        updated_files = []
+        for file_path in self.get_changed_files():
+            # The signature is read before the file so that a write during the extraction is detected at the next update
+            signature = get_file_signature(file_path)
+            file_hash = get_file_hash(file_path) if self.compare_content else None
+            arrays, report = extract_and_validate_dsc_data(file_path, self.delimiter, self.has_header, self.skip_lines)
+            self.reports[file_path] = report
+            if arrays is None:
+                continue
+            self.signatures[file_path] = signature
+            self.hashes[file_path] = file_hash
+            self.arrays[file_path] = arrays
+            updated_files.append(file_path)
+
+        if updated_files:
+            self._concatenated_arrays = None
+        return updated_files
+
+    @property
+    def is_complete(self):
+        """bool: True if all the files were extracted at least once."""
+        return all(file_path in self.arrays for file_path in self.file_paths)
+
+    def get_arrays_lists(self):
+        """
+        Get the extracted data separated by files, in the order of the file paths.
+
+        Returns
+        -------
+        tuple
+            A tuple containing lists of time, temperature, rate_of_reaction and extent_of_reaction arrays.
+        """
+        arrays_lists = [self.arrays[file_path] for file_path in self.file_paths if file_path in self.arrays]
+        return tuple([arrays[column] for arrays in arrays_lists] for column in range(4))
+
+    def get_concatenated_arrays(self):
+        """
+        Get the concatenated data of all extracted files. The concatenation is only recomputed after a change.
+
+        Returns
+        -------
+        Tuple of concatenated numpy arrays or None
+            (time, temperature, rate_of_reaction, extent_of_reaction), or None if no file was extracted.
+        """
+        if not self.arrays:
+            return None
+        if self._concatenated_arrays is None:
+            self._concatenated_arrays = tuple(np.concatenate(column) for column in self.get_arrays_lists())
+        return self._concatenated_arrays
+
+
 if __name__=="__main__":
     print("You've run the data extraction module.")
     
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+The decimation module allows to reduce the number of points of oversampled experiments.
+
+DSC exports often contain many more points than needed to describe the kinetics, while the cost
+of each evaluation of a cost function grows linearly with the number of points.
+The decimation is applied after the data extraction and keeps the points where the curves change
+the most (error-bounded selection), instead of keeping one point out of N.
+
+Two complementary selections are available:
+
+* a selection based on the increments of extent, rate and temperature, to reach a target number of points
+* a refinement adding points until the linear reconstruction of the curves is within a tolerance
+"""
+
+import numpy as np
+
+
+class DecimationReport:
+    """
+    Summary of the decimation of a set of experiments.
+
+    Attributes
+    ----------
+    original_number_of_points : list
+        Number of points of each experiment before decimation.
+    decimated_number_of_points : list
+        Number of points of each experiment after decimation.
+    max_errors : list
+        Maximum error of each experiment, relative to the range of each column.
+    rms_errors : list
+        Root mean square error of each experiment, relative to the range of each column.
+    """
+    def __init__(self):
+        self.original_number_of_points = []
+        self.decimated_number_of_points = []
+        self.max_errors = []
+        self.rms_errors = []
+
+    @property
+    def speedup(self):
+        """float: Expected speedup of the cost function evaluations, proportional to the number of points."""
+        return sum(self.original_number_of_points) / max(sum(self.decimated_number_of_points), 1)
+
+    @property
+    def max_error(self):
+        """float: Maximum relative error over all experiments."""
+        return max(self.max_errors, default=0.0)
+
+    def to_text(self):
+        """
+        Format the report.
+
+        Returns
+        -------
+        str
+            Summary of the decimation.
+        """
+        return (f"Decimation: {sum(self.original_number_of_points)} -> {sum(self.decimated_number_of_points)} points "
+                f"(speedup x{self.speedup:.1f}), maximum relative error: {self.max_error:.2e}")
+
+
+def normalize(column):
+    """
+    Normalize a column by its range.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+        Data to normalize.
+
+    Returns
+    -------
+    numpy.ndarray
+        Column divided by its range (unchanged if the range is 0).
+    """
+    column_range = np.ptp(column)
+    if column_range == 0:
+        return np.asarray(column, dtype=float)
+    return np.asarray(column, dtype=float) / column_range
+
+
+def select_points_by_increments(time, columns, number_of_points):
+    """
+    Select points so that the increments of the normalized columns between two kept points are equal.
+
+    The cumulative sum of the normalized increments acts like a curve length:
+    more points are kept where the curves vary quickly (e.g. around the peak of rate)
+    and fewer where they are flat.
+
+    Parameters
+    ----------
+    time : numpy.ndarray
+        Time of the experiment.
+    columns : list
+        List of arrays (e.g. rate, extent, temperature) sharing the time axis.
+    number_of_points : int
+        Target number of points to keep.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the kept points, including the first and last points.
+    """
+    length = len(time)
+    if number_of_points >= length:
+        return np.arange(length)
+
+    # Time is included so that long flat regions still receive a few points
+    increments = np.abs(np.diff(normalize(time)))
+    for column in columns:
+        increments += np.abs(np.diff(normalize(column)))
+    cumulative_increments = np.concatenate(([0.0], np.cumsum(increments)))
+
+    targets = np.linspace(0, cumulative_increments[-1], number_of_points)
+    indices = np.searchsorted(cumulative_increments, targets)
+    indices = np.clip(indices, 0, length - 1)
+    indices[0] = 0
+    indices[-1] = length - 1
+    return np.unique(indices)
+
+
+def compute_reconstruction_errors(time, columns, indices):
+    """
+    Compute the error of the linear reconstruction of the columns from the kept points.
+
+    Parameters
+    ----------
+    time : numpy.ndarray
+        Time of the experiment.
+    columns : list
+        List of arrays sharing the time axis.
+    indices : numpy.ndarray
+        Sorted indices of the kept points.
+
+    Returns
+    -------
+    numpy.ndarray
+        Maximum error over the normalized columns, for each point of the experiment.
+    """
+    errors = np.zeros(len(time))
+    kept_time = time[indices]
+    for column in columns:
+        normalized_column = normalize(column)
+        reconstruction = np.interp(time, kept_time, normalized_column[indices])
+        np.maximum(errors, np.abs(reconstruction - normalized_column), out=errors)
+    return errors
+
+
+def refine_points_within_tolerance(time, columns, indices, tolerance, max_iterations=100):
+    """
+    Add points until the linear reconstruction of all columns is within the tolerance.
+
+    At each pass, the point with the largest error is added in every segment where
+    the error exceeds the tolerance. Each pass is vectorized over all segments.
+
+    Parameters
+    ----------
+    time : numpy.ndarray
+        Time of the experiment.
+    columns : list
+        List of arrays sharing the time axis.
+    indices : numpy.ndarray
+        Sorted indices of the initially kept points, including the first and last points.
+    tolerance : float
+        Maximum error allowed, relative to the range of each column.
+    max_iterations : int, optional
+        Maximum number of refinement passes. Default is 100.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the kept points.
+    """
+    for _ in range(max_iterations):
+        errors = compute_reconstruction_errors(time, columns, indices)
+        if np.max(errors) <= tolerance:
+            break
+        # Index of the worst point of each segment between two kept points
+        segment_max_errors = np.maximum.reduceat(errors, indices[:-1])
+        segment_lengths = np.diff(np.append(indices[:-1], len(errors)))
+        segment_ids = np.repeat(np.arange(len(segment_lengths)), segment_lengths)
+        is_worst = errors == segment_max_errors[segment_ids]
+        worst_in_segment = np.flatnonzero(is_worst & (errors > tolerance))
+        indices = np.union1d(indices, worst_in_segment)
+    return indices
+
+
+def decimate_experiment(time, temperature, rate, extent, number_of_points=None, tolerance=None):
+    """
+    Decimate the data of one experiment.
+
+    Parameters
+    ----------
+    time : numpy.ndarray
+        Time of the experiment.
+    temperature : numpy.ndarray
+        Temperature of the experiment.
+    rate : numpy.ndarray
+        Rate of reaction of the experiment.
+    extent : numpy.ndarray
+        Extent of reaction of the experiment.
+    number_of_points : int, optional
+        Target number of points to keep. Default is None.
+    tolerance : float, optional
+        Maximum error of the linear reconstruction of rate, extent and temperature,
+        relative to their range. If both number_of_points and tolerance are given, points
+        are added to the target number of points until the tolerance is met. Default is None.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - numpy.ndarray: Sorted indices of the kept points.
+            - numpy.ndarray: Relative error of the reconstruction for each point of the experiment.
+
+    Raises
+    ------
+    ValueError
+        If neither number_of_points nor tolerance is given.
+    """
+    if number_of_points is None and tolerance is None:
+        raise ValueError("Please give a target number of points or a tolerance for the decimation.")
+
+    time = np.asarray(time)
+    columns = [np.asarray(rate), np.asarray(extent), np.asarray(temperature)]
+
+    if number_of_points is not None:
+        indices = select_points_by_increments(time, columns, int(number_of_points))
+    else:
+        indices = np.array([0, len(time) - 1])
+
+    if tolerance is not None:
+        indices = refine_points_within_tolerance(time, columns, indices, tolerance)
+
+    errors = compute_reconstruction_errors(time, columns, indices)
+    return indices, errors
+
+
+def decimate_experiments(time_lists, temperature_lists, rate_lists, extent_lists, number_of_points=None, tolerance=None):
+    """
+    Decimate the data of multiple experiments.
+
+    Parameters
+    ----------
+    time_lists : list
+        List of time arrays.
+    temperature_lists : list
+        List of temperature arrays.
+    rate_lists : list
+        List of rate arrays.
+    extent_lists : list
+        List of extent arrays.
+    number_of_points : int, optional
+        Target number of points to keep for each experiment. Default is None.
+    tolerance : float, optional
+        Maximum error of the linear reconstruction, relative to the range of each column. Default is None.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - list: Decimated time arrays.
+            - list: Decimated temperature arrays.
+            - list: Decimated rate arrays.
+            - list: Decimated extent arrays.
+            - DecimationReport: Number of points, speedup and errors of the decimation.
+    """
+    new_times = []
+    new_temperatures = []
+    new_rates = []
+    new_extents = []
+    report = DecimationReport()
+
+    for time, temperature, rate, extent in zip(time_lists, temperature_lists, rate_lists, extent_lists):
+        indices, errors = decimate_experiment(time, temperature, rate, extent, number_of_points, tolerance)
+
+        new_times.append(np.asarray(time)[indices])
+        new_temperatures.append(np.asarray(temperature)[indices])
+        new_rates.append(np.asarray(rate)[indices])
+        new_extents.append(np.asarray(extent)[indices])
+
+        report.original_number_of_points.append(len(time))
+        report.decimated_number_of_points.append(len(indices))
+        report.max_errors.append(float(np.max(errors)))
+        report.rms_errors.append(float(np.sqrt(np.mean(errors**2))))
+
+    return new_times, new_temperatures, new_rates, new_extents, report
+
+
+if __name__ == "__main__":
+    print("You've run the decimation module.")
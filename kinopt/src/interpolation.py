@@ -9,14 +9,168 @@ interpolation is usually more than enough.
 
 For experimental data with scarce data points (e.g. FTIR experiments) 
 a cubic spline interpolation might be more appropriate.
+A monotone cubic spline (PCHIP) avoids the overshoots of the cubic spline around sharp variations.
+
+.. note::
+    ``BatchedSpline`` keeps the spline coefficients of all experiments, so that the data can be 
+    re-interpolated on another grid (e.g. another number of points) without building the splines again.
+    The splines are cached (``spline_cache``) by data and method, so that the spline interpolation functions 
+    only evaluate them when the number of points changes.
+
+.. note::
+    The results of the interpolation functions are cached (``interpolation_cache``), so that going back 
+    to previous settings (number of points, method) doesn't recompute the interpolation. 
+    The size of the cache is set with ``interpolation_cache.max_bytes`` (0 disables it).
 """
 
 import numpy as np
 from scipy import interpolate
+import hashlib
+import functools
+from collections import OrderedDict
 
 
 
 
+class InterpolationCache:
+    """
+    Least recently used cache of interpolation results, limited in bytes.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum size of the stored results. The least recently used results are evicted 
+        when it is exceeded. 0 disables the cache. Default is 256 MiB.
+    """
+    def __init__(self, max_bytes=256 * 1024**2):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def get(self, key):
+        """
+        Get a stored result and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the call.
+
+        Returns
+        -------
+        tuple or None
+            Stored result, or None if it isn't stored.
+        """
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result[0]
+
+    def put(self, key, value):
+        """
+        Store a result, evicting the least recently used results if needed.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the call.
+        value : tuple
+            Result to store.
+        """
+        size = sum(getattr(item, 'nbytes', 0) for item in value)
+        if size > self.max_bytes:
+            return
+        if key in self._results:
+            self.current_bytes -= self._results.pop(key)[1]
+        self._results[key] = (value, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._results.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def clear(self):
+        """Remove all stored results."""
+        self._results.clear()
+        self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._results)
+
+
+interpolation_cache = InterpolationCache()
+spline_cache = InterpolationCache(max_bytes=64 * 1024**2)
+
+
+def fingerprint(*args, **kwargs):
+    """
+    Compute a fingerprint of the arguments of a call, based on the content of the arrays.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Arguments (arrays, lists of arrays, numbers, strings or None).
+
+    Returns
+    -------
+    str
+        BLAKE2b hash of the arguments.
+    """
+    key_hash = hashlib.blake2b(digest_size=20)
+    
+    def update(item):
+        if isinstance(item, (list, tuple)):
+            key_hash.update(f"[{len(item)}".encode())
+            for element in item:
+                update(element)
+            key_hash.update(b"]")
+        elif isinstance(item, np.ndarray):
+            item = np.ascontiguousarray(item)
+            key_hash.update(f"{item.dtype.str}{item.shape}".encode())
+            key_hash.update(item.data)
+        else:
+            key_hash.update(repr(item).encode())
+    
+    update(args)
+    update(sorted(kwargs.items()))
+    return key_hash.hexdigest()
+
+
+def cached_interpolation(function):
+    """
+    Memoize an interpolation function in interpolation_cache.
+
+    The key is the fingerprint of the input arrays and of the other parameters (number of points, 
+    method, tolerance...), so that changing back to previous settings doesn't recompute the interpolation.
+    Copies of the stored arrays are returned, so that the stored results can't be modified.
+
+    Parameters
+    ----------
+    function : callable
+        Interpolation function returning a tuple of arrays.
+
+    Returns
+    -------
+    callable
+        Memoized function.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if interpolation_cache.max_bytes <= 0:
+            return function(*args, **kwargs)
+        key = fingerprint(function.__name__, *args, **kwargs)
+        result = interpolation_cache.get(key)
+        if result is None:
+            result = function(*args, **kwargs)
+            interpolation_cache.put(key, result)
+        return tuple(item.copy() if isinstance(item, np.ndarray) else item for item in result)
+    return wrapper
+
+
 def limit_of_interpolation(conversions_lists):
     """
     Find the minimum and maximum values in a list of conversion lists.
@@ -61,9 +215,10 @@ def check_increase_and_remove_if_not(conversions, times, temperatures, rates):
     new_rates = [] if rates else None
     
     for i in range(len(conversions)):
-        conv = np.array(conversions[i])
-        time = np.array(times[i])
-        temp = np.array(temperatures[i])
+        # np.asarray doesn't copy arrays that are already numpy arrays
+        conv = np.asarray(conversions[i])
+        time = np.asarray(times[i])
+        temp = np.asarray(temperatures[i])
         
         increasing_indices = np.where(conv[:-1] < conv[1:])[0]
         increasing_indices = np.append(increasing_indices, len(conv) - 1)
@@ -73,7 +228,7 @@ def check_increase_and_remove_if_not(conversions, times, temperatures, rates):
         new_temperatures.append(temp[increasing_indices])
         
         if rates:
-            rate = np.array(rates[i])
+            rate = np.asarray(rates[i])
             new_rates.append(rate[increasing_indices])
     
     if rates:
@@ -81,7 +236,343 @@ def check_increase_and_remove_if_not(conversions, times, temperatures, rates):
     else:
         return new_conversions, new_times, new_temperatures
 
-def linear_interpolation(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points):
+def flatten_experiments(arrays, mask=None):
+    """
+    Flatten ragged or padded experiments into one contiguous array.
+
+    Parameters
+    ----------
+    arrays : list or numpy.ndarray
+        List of 1-D arrays (ragged), or 2-D array (experiments x points) padded with NaN.
+    mask : numpy.ndarray, optional
+        Mask of the valid points of a padded 2-D array. Default is None (non-NaN points).
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - numpy.ndarray: Values of all experiments, one after the other.
+            - numpy.ndarray: Number of points of each experiment.
+    """
+    if isinstance(arrays, np.ndarray) and arrays.ndim == 2:
+        if mask is None:
+            mask = ~np.isnan(arrays)
+        return arrays[mask].astype(float, copy=False), np.count_nonzero(mask, axis=1)
+    lengths = np.array([len(array) for array in arrays])
+    return np.concatenate(arrays).astype(float, copy=False), lengths
+
+
+def locate_in_experiments(flat_conversion, lengths, new_conversions):
+    """
+    Find the interval of each new conversion in the conversion of its experiment.
+
+    The experiments are shifted by an offset larger than the span of all conversions, 
+    so that they follow each other in one sorted array and a single np.searchsorted is needed.
+
+    Parameters
+    ----------
+    flat_conversion : numpy.ndarray
+        Increasing conversion of each experiment, one experiment after the other.
+    lengths : numpy.ndarray
+        Number of points of each experiment.
+    new_conversions : numpy.ndarray
+        Conversion at which to interpolate, with shape (experiments, new points).
+
+    Returns
+    -------
+    numpy.ndarray
+        Index in flat_conversion of the lower bound of the interval of each new conversion, 
+        clipped to the first and last interval of its experiment (extrapolation).
+    """
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    ends = starts + lengths - 1
+    
+    offset = (max(np.max(flat_conversion), np.max(new_conversions))
+              - min(np.min(flat_conversion), np.min(new_conversions)) + 1.0)
+    experiment_offsets = offset * np.arange(len(lengths))
+    shifted_conversion = flat_conversion + np.repeat(experiment_offsets, lengths)
+    shifted_new_conversions = new_conversions + experiment_offsets[:, None]
+    
+    indices = np.searchsorted(shifted_conversion, shifted_new_conversions, side='right') - 1
+    np.clip(indices, starts[:, None], np.maximum(ends - 1, starts)[:, None], out=indices)
+    return indices
+
+
+class BatchedSpline:
+    """
+    Cubic or monotone (PCHIP) splines of several columns for all experiments.
+
+    The coefficients are computed once per experiment at construction, for all columns at once, 
+    and kept. The splines can then be evaluated on any grid, shared by all experiments or 
+    different for each experiment, in one vectorized pass.
+
+    Parameters
+    ----------
+    conversions : list
+        List of increasing conversion arrays.
+    columns : list
+        Columns to interpolate (e.g. [times_lists, temperatures_lists, rates_lists]).
+    method : str, optional
+        'cubic' for a cubic spline (scipy.interpolate.CubicSpline) or 'pchip' for a 
+        monotone cubic spline (scipy.interpolate.PchipInterpolator). Default is 'cubic'.
+
+    Attributes
+    ----------
+    breakpoints : numpy.ndarray
+        Conversion of all experiments, one experiment after the other.
+    lengths : numpy.ndarray
+        Number of points of each experiment.
+    coefficients : numpy.ndarray
+        Polynomial coefficients with shape (4, number of intervals, number of columns), 
+        the intervals of all experiments following each other.
+    """
+    def __init__(self, conversions, columns, method='cubic'):
+        if method == 'cubic':
+            spline_class = interpolate.CubicSpline
+        elif method == 'pchip':
+            spline_class = interpolate.PchipInterpolator
+        else:
+            raise ValueError(f"Unknown spline method: {method}. Use 'cubic' or 'pchip'.")
+        self.method = method
+        
+        coefficients = []
+        for i, conversion in enumerate(conversions):
+            # One spline per experiment for all columns
+            values = np.column_stack([np.asarray(column[i], dtype=float) for column in columns])
+            coefficients.append(spline_class(conversion, values, axis=0).c)
+        
+        self.breakpoints, self.lengths = flatten_experiments(conversions)
+        self.coefficients = np.concatenate(coefficients, axis=1)
+
+    @property
+    def nbytes(self):
+        """int: Size of the breakpoints and coefficients."""
+        return self.breakpoints.nbytes + self.lengths.nbytes + self.coefficients.nbytes
+
+    @property
+    def limits(self):
+        """tuple: First and last conversion of each experiment."""
+        ends = np.cumsum(self.lengths) - 1
+        return self.breakpoints[ends - self.lengths + 1], self.breakpoints[ends]
+
+    def __call__(self, new_conversions, out=None):
+        """
+        Evaluate the splines. Values outside of the conversion range of an experiment are extrapolated.
+
+        Parameters
+        ----------
+        new_conversions : numpy.ndarray
+            Conversion at which the splines are evaluated, shared by all experiments (1-D) 
+            or given for each experiment (2-D, experiments x new points).
+        out : list, optional
+            Preallocated arrays (experiments x new points) receiving each column. Default is None.
+
+        Returns
+        -------
+        list
+            Interpolated columns, each with shape (experiments, new points).
+        """
+        new_conversions = np.broadcast_to(np.asarray(new_conversions, dtype=float),
+                                          (len(self.lengths), np.shape(new_conversions)[-1]))
+        indices = locate_in_experiments(self.breakpoints, self.lengths, new_conversions)
+        dx = (new_conversions - self.breakpoints[indices])[..., None]
+        
+        # Each experiment has one interval less than points
+        intervals = indices - np.arange(len(self.lengths))[:, None]
+        c = self.coefficients[:, intervals]
+        values = ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
+        
+        if out is None:
+            return [values[..., k] for k in range(values.shape[-1])]
+        for k, interpolated_column in enumerate(out):
+            interpolated_column[:] = values[..., k]
+        return out
+
+
+def get_batched_spline(conversions, columns, method='cubic'):
+    """
+    Get the BatchedSpline of the data from spline_cache, or build and store it.
+
+    The key is the fingerprint of the data and of the method only, so that the splines are reused 
+    whatever the grid on which they are evaluated.
+
+    Parameters
+    ----------
+    conversions : list
+        List of increasing conversion arrays.
+    columns : list
+        Columns to interpolate (e.g. [times_lists, temperatures_lists, rates_lists]).
+    method : str, optional
+        'cubic' or 'pchip'. Default is 'cubic'.
+
+    Returns
+    -------
+    BatchedSpline
+        Splines of the columns.
+    """
+    if spline_cache.max_bytes <= 0:
+        return BatchedSpline(conversions, columns, method)
+    key = fingerprint(conversions, columns, method)
+    result = spline_cache.get(key)
+    if result is None:
+        result = (BatchedSpline(conversions, columns, method),)
+        spline_cache.put(key, result)
+    return result[0]
+
+
+def batched_linear_interpolation(conversions, columns, new_conversions, remove_non_increasing=True, sort=False, out=None):
+    """
+    Linearly interpolate columns of all experiments at once.
+
+    The experiments are flattened into one array and shifted by an offset per experiment, so that 
+    the bracketing points of all experiments are found with a single np.searchsorted, 
+    and all columns are resampled with one gather and multiply-add.
+
+    Parameters
+    ----------
+    conversions : list or numpy.ndarray
+        Conversion of each experiment, as a list of 1-D arrays or as a 2-D array padded with NaN.
+    columns : list
+        Columns to interpolate (e.g. [times_lists, temperatures_lists, rates_lists]), 
+        each with the same layout as conversions.
+    new_conversions : numpy.ndarray
+        Conversion at which the columns are interpolated, shared by all experiments (1-D) 
+        or given for each experiment (2-D, experiments x new points).
+    remove_non_increasing : bool, optional
+        Whether to remove non-increasing points of conversion as in check_increase_and_remove_if_not. Default is True.
+    sort : bool, optional
+        Whether to sort the points of each experiment by conversion first (stable sort), as scipy.interpolate.interp1d does. 
+        Default is False.
+    out : list, optional
+        Preallocated arrays (experiments x new points) receiving each interpolated column. Default is None.
+
+    Returns
+    -------
+    list
+        Interpolated columns, each with shape (experiments, new points).
+
+    Raises
+    ------
+    ValueError
+        If a value of new_conversions is outside of the range of the conversion of its experiment.
+    """
+    mask = ~np.isnan(conversions) if isinstance(conversions, np.ndarray) and conversions.ndim == 2 else None
+    flat_conversion, lengths = flatten_experiments(conversions, mask)
+    flat_columns = [flatten_experiments(column, mask)[0] for column in columns]
+    number_of_experiments = len(lengths)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    ends = starts + lengths - 1
+    
+    if sort:
+        # A stable sort keeps the order of the points with the same conversion
+        order = np.lexsort((flat_conversion, np.repeat(np.arange(number_of_experiments), lengths)))
+        flat_conversion = flat_conversion[order]
+        flat_columns = [flat_column[order] for flat_column in flat_columns]
+    
+    if remove_non_increasing:
+        # Keep points followed by a greater conversion, and the last point of each experiment
+        keep = np.empty(len(flat_conversion), dtype=bool)
+        keep[:-1] = flat_conversion[:-1] < flat_conversion[1:]
+        keep[ends] = True
+        if not np.all(keep):
+            flat_conversion = flat_conversion[keep]
+            flat_columns = [flat_column[keep] for flat_column in flat_columns]
+            lengths = np.add.reduceat(keep, starts)
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            ends = starts + lengths - 1
+    
+    new_conversions = np.broadcast_to(np.asarray(new_conversions, dtype=float), 
+                                      (number_of_experiments, np.shape(new_conversions)[-1]))
+    if np.any(new_conversions < flat_conversion[starts][:, None]):
+        raise ValueError("A value in new_conversions is below the interpolation range.")
+    if np.any(new_conversions > flat_conversion[ends][:, None]):
+        raise ValueError("A value in new_conversions is above the interpolation range.")
+    
+    indices = locate_in_experiments(flat_conversion, lengths, new_conversions)
+    
+    lower_conversion = flat_conversion[indices]
+    widths = flat_conversion[indices + 1] - lower_conversion
+    # The upper point is used in intervals of zero width (repeated conversion)
+    weights = np.divide(new_conversions - lower_conversion, widths, out=np.ones(new_conversions.shape), where=widths != 0)
+    
+    if out is None:
+        out = [np.empty(new_conversions.shape) for _ in flat_columns]
+    for flat_column, interpolated_column in zip(flat_columns, out):
+        lower = flat_column[indices]
+        np.subtract(flat_column[indices + 1], lower, out=interpolated_column)
+        interpolated_column *= weights
+        interpolated_column += lower
+    return out
+
+
+def adaptive_conversion_grid(conversions_lists, columns, tolerance, minimum=None, maximum=None, initial_number_of_points=17, max_number_of_points=5000):
+    """
+    Create a conversion grid, shared by all experiments, with points placed to meet a tolerance.
+
+    Starting from a coarse uniform grid, every interval whose midpoint is not reproduced by the 
+    linear interpolation between its bounds is split in two (bisection), until the error of all 
+    columns of all experiments is below the tolerance. Intervals narrower than 1e-6 of the range 
+    of conversion are not split further. Points are thus concentrated where the curves 
+    change fastest (e.g. around the peak of rate and at the ends) and few are used in flat regions.
+
+    Parameters
+    ----------
+    conversions_lists : list
+        List of conversion arrays.
+    columns : list
+        Columns whose interpolation must meet the tolerance (e.g. [temperatures_lists, rates_lists]).
+    tolerance : float
+        Maximum error at the midpoints, relative to the range of each column of each experiment.
+    minimum : float, optional
+        First conversion of the grid. Default is None (minimum of all conversions).
+    maximum : float, optional
+        Last conversion of the grid. Default is None (maximum of all conversions).
+    initial_number_of_points : int, optional
+        Number of points of the initial uniform grid. Default is 17.
+    max_number_of_points : int, optional
+        Maximum number of points of the grid. When reached, only the intervals with the largest errors are split. Default is 5000.
+
+    Returns
+    -------
+    numpy.ndarray
+        Increasing conversion grid.
+    """
+    flat_conversions = np.concatenate(conversions_lists)
+    minimum = np.min(flat_conversions) if minimum is None else minimum
+    maximum = np.max(flat_conversions) if maximum is None else maximum
+    
+    # Errors are relative to the range of each column of each experiment
+    ranges = np.array([[np.ptp(array) for array in column] for column in columns], dtype=float)
+    ranges[ranges == 0] = 1.0
+    
+    def interpolate_columns(grid):
+        values = batched_linear_interpolation(conversions_lists, columns, grid)
+        return np.array(values) / ranges[:, :, None]
+    
+    minimum_interval = (maximum - minimum) * 1e-6
+    grid = np.linspace(minimum, maximum, initial_number_of_points)
+    values = interpolate_columns(grid)
+    while len(grid) < max_number_of_points:
+        midpoints = 0.5 * (grid[:-1] + grid[1:])
+        midpoint_values = interpolate_columns(midpoints)
+        errors = np.abs(midpoint_values - 0.5 * (values[..., :-1] + values[..., 1:])).max(axis=(0, 1))
+        
+        # Intervals around discontinuities (e.g. at the end of the reaction) are not split indefinitely
+        intervals_to_split = np.flatnonzero((errors > tolerance) & (np.diff(grid) > minimum_interval))
+        if len(intervals_to_split) == 0:
+            break
+        budget = max_number_of_points - len(grid)
+        if len(intervals_to_split) > budget:
+            intervals_to_split = np.sort(intervals_to_split[np.argsort(errors[intervals_to_split])[-budget:]])
+        
+        # Midpoints are inserted after the lower bound of their interval
+        grid = np.insert(grid, intervals_to_split + 1, midpoints[intervals_to_split])
+        values = np.insert(values, intervals_to_split + 1, midpoint_values[..., intervals_to_split], axis=2)
+    return grid
+
+
+@cached_interpolation
+def linear_interpolation(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points, tolerance=None):
     """
     Perform linear interpolation on conversion, time, temperature, and rate data.
 
@@ -96,7 +587,11 @@ def linear_interpolation(conversions_lists, times_lists, temperatures_lists, rat
     rates_lists : list
         List of rate arrays.
     number_of_points : int
-        Number of points for interpolation.
+        Number of points for interpolation. If tolerance is given, maximum number of points of the adaptive grid.
+    tolerance : float, optional
+        If given, the points are placed with an adaptive grid (see adaptive_conversion_grid) so that 
+        temperature and rate are interpolated within this tolerance, relative to their range. 
+        Default is None (uniform grid).
 
     Returns
     -------
@@ -105,28 +600,29 @@ def linear_interpolation(conversions_lists, times_lists, temperatures_lists, rat
     """
     flat_conversions = np.concatenate(conversions_lists)
     minimum, maximum = np.min(flat_conversions), np.max(flat_conversions)
-    global_conversion = np.linspace(minimum, maximum, number_of_points)
-    
-    conv, time, temp, rates = check_increase_and_remove_if_not(conversions_lists, times_lists, temperatures_lists, rates_lists)
+    if tolerance is None:
+        global_conversion = np.linspace(minimum, maximum, number_of_points)
+    else:
+        error_columns = [temperatures_lists, rates_lists] if rates_lists else [temperatures_lists]
+        global_conversion = adaptive_conversion_grid(conversions_lists, error_columns, tolerance, minimum, maximum,
+                                                     initial_number_of_points=min(17, number_of_points),
+                                                     max_number_of_points=number_of_points)
+        number_of_points = len(global_conversion)
     
     new_conversions = np.empty((len(conversions_lists), number_of_points))
     new_times = np.empty((len(conversions_lists), number_of_points))
     new_temperatures = np.empty((len(conversions_lists), number_of_points))
     new_rates = np.empty((len(conversions_lists), number_of_points)) if rates_lists else None
     
-    for i in range(len(conversions_lists)):
-        f = interpolate.interp1d(conv[i], time[i])
-        g = interpolate.interp1d(conv[i], temp[i])
-        h = interpolate.interp1d(conv[i], rates[i])
-        
-        new_times[i] = f(global_conversion)
-        new_temperatures[i] = g(global_conversion)  
-        new_rates[i] = h(global_conversion)
-        
-        new_conversions[i] = global_conversion
+    # Non-increasing points are removed and all experiments are interpolated at once
+    columns = [times_lists, temperatures_lists, rates_lists] if rates_lists else [times_lists, temperatures_lists]
+    out = [new_times, new_temperatures, new_rates] if rates_lists else [new_times, new_temperatures]
+    batched_linear_interpolation(conversions_lists, columns, global_conversion, out=out)
+    new_conversions[:] = global_conversion
     
     return new_conversions, new_times, new_temperatures, new_rates
 
+@cached_interpolation
 def linear_interpolation_multiple_limits(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points):
     """
     Perform linear interpolation on conversion, time, temperature, and rate data with multiple limits.
@@ -149,29 +645,23 @@ def linear_interpolation_multiple_limits(conversions_lists, times_lists, tempera
     tuple
         Interpolated conversion, time, temperature, and rate arrays.
     """
-    new_conversions = np.empty((len(conversions_lists), number_of_points))
     new_times = np.empty((len(conversions_lists), number_of_points))
     new_temperatures = np.empty((len(conversions_lists), number_of_points))
     new_rates = np.empty((len(conversions_lists), number_of_points))
     
-    for i, conv_list in enumerate(conversions_lists):
-        minimum = conv_list[0]
-        maximum = conv_list[-1]
-        global_conversion = np.linspace(minimum, maximum, number_of_points)
-        
-        f = interpolate.interp1d(conv_list, times_lists[i])
-        g = interpolate.interp1d(conv_list, temperatures_lists[i])
-        h = interpolate.interp1d(conv_list, rates_lists[i])
-        
-        new_times[i] = f(global_conversion)
-        new_temperatures[i] = g(global_conversion)            
-        new_rates[i] = h(global_conversion)
-        
-        new_conversions[i] = global_conversion
+    # Each experiment is interpolated between its first and last conversion, 
+    # with its points sorted by conversion as interp1d does
+    minimums = np.array([conv_list[0] for conv_list in conversions_lists], dtype=float)
+    maximums = np.array([conv_list[-1] for conv_list in conversions_lists], dtype=float)
+    new_conversions = np.linspace(minimums, maximums, number_of_points, axis=1)
+    
+    batched_linear_interpolation(conversions_lists, [times_lists, temperatures_lists, rates_lists], new_conversions,
+                                 remove_non_increasing=False, sort=True, out=[new_times, new_temperatures, new_rates])
     
     return new_conversions, new_times, new_temperatures, new_rates
     
-def cubic_spline_interpolation(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points):
+@cached_interpolation
+def cubic_spline_interpolation(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points, method='cubic'):
     """
     Perform cubic spline interpolation on conversion, time, temperature, and rate data.
 
@@ -187,6 +677,8 @@ def cubic_spline_interpolation(conversions_lists, times_lists, temperatures_list
         List of rate arrays.
     number_of_points : int
         Number of points for interpolation.
+    method : str, optional
+        'cubic' or 'pchip' (monotone cubic spline, without overshoot). Default is 'cubic'.
 
     Returns
     -------
@@ -202,24 +694,18 @@ def cubic_spline_interpolation(conversions_lists, times_lists, temperatures_list
     new_conversions = np.empty((len(conversions_lists), number_of_points))
     new_times = np.empty((len(conversions_lists), number_of_points))
     new_temperatures = np.empty((len(conversions_lists), number_of_points))
-    new_rates = np.empty((len(conversions_lists), number_of_points)) if rates_lists else None
+    new_rates = np.empty((len(conversions_lists), number_of_points))
     
-    for i in range(len(conversions_lists)):
-        f = interpolate.CubicSpline(conv[i], time[i])
-        g = interpolate.CubicSpline(conv[i], temp[i])
-        h = interpolate.CubicSpline(conv[i], rates[i])
-        
-        new_times[i] = f(global_conversion)
-        new_temperatures[i] = g(global_conversion)
-        new_rates[i] = h(global_conversion)
-        
-        new_conversions[i] = global_conversion
+    spline = get_batched_spline(conv, [time, temp, rates], method)
+    spline(global_conversion, out=[new_times, new_temperatures, new_rates])
+    new_conversions[:] = global_conversion
     
     return new_conversions, new_times, new_temperatures, new_rates
 
-def cubic_spline_interpolation_multiple_limits(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points):
+@cached_interpolation
+def cubic_spline_interpolation_multiple_limits(conversions_lists, times_lists, temperatures_lists, rates_lists, number_of_points, method='cubic'):
     """
-    Perform cubic spline interpolation on conversion, time, and temperature data with multiple limits.
+    Perform cubic spline interpolation on conversion, time, temperature, and rate data with multiple limits.
 
     Parameters
     ----------
@@ -229,43 +715,30 @@ def cubic_spline_interpolation_multiple_limits(conversions_lists, times_lists, t
         List of time arrays.
     temperatures_lists : list
         List of temperature arrays.
+    rates_lists : list
+        List of rate arrays.
     number_of_points : int
         Number of points for interpolation.
+    method : str, optional
+        'cubic' or 'pchip' (monotone cubic spline, without overshoot). Default is 'cubic'.
 
     Returns
     -------
     tuple
-        Interpolated conversion, time, and temperature arrays.
+        Interpolated conversion, time, temperature, and rate arrays.
     """
-    # Preallocate arrays for interpolated values
-    new_conversions = np.empty((len(conversions_lists), number_of_points))
     new_times = np.empty((len(conversions_lists), number_of_points))
     new_temperatures = np.empty((len(conversions_lists), number_of_points))
     new_rates = np.empty((len(conversions_lists), number_of_points))
     
-    for i, conv_list in enumerate(conversions_lists):
-        minimum = conv_list[0]
-        maximum = conv_list[-1]
-        global_conversion = np.linspace(minimum, maximum, number_of_points)
-        
-        # Perform cubic spline interpolation
-        f = interpolate.CubicSpline(conversions_lists[i], times_lists[i])
-        g = interpolate.CubicSpline(conversions_lists[i], temperatures_lists[i])
-        h = interpolate.CubicSpline(conv_list, rates_lists[i])
-        
-        # Evaluate interpolations at global conversion points
-        new_conv = global_conversion
-        new_time = f(global_conversion)
-        new_temp = g(global_conversion)
-        new_rate = h(global_conversion)
-        
-        # Append to results
-        new_conversions.append(new_conv)
-        new_times.append(new_time)
-        new_temperatures.append(new_temp)
-        new_rates.append(new_rate)
+    spline = get_batched_spline(conversions_lists, [times_lists, temperatures_lists, rates_lists], method)
+    
+    # Each experiment is interpolated between its first and last conversion
+    minimums, maximums = spline.limits
+    new_conversions = np.linspace(minimums, maximums, number_of_points, axis=1)
+    spline(new_conversions, out=[new_times, new_temperatures, new_rates])
 
-    return np.array(new_conversions), np.array(new_times), np.array(new_temperatures)
+    return new_conversions, new_times, new_temperatures, new_rates
 
 
 
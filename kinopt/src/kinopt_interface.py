@@ -20,9 +20,15 @@ from PyQt5.QtCore import (QCoreApplication, QMetaObject, QObject, QPoint,
 from PyQt5.QtGui import (QBrush, QColor, QConicalGradient, QCursor, QFont,
     QFontDatabase, QIcon, QLinearGradient, QPalette, QPainter, QPixmap,
     QRadialGradient)
-from PyQt5.QtWidgets import *
+from PyQt5.QtWidgets import (QAbstractItemView, QAction, QCheckBox, QComboBox,
+    QDockWidget, QFormLayout, QFrame, QGridLayout, QHBoxLayout, QLabel, QLayout,
+    QLineEdit, QListView, QMenu, QMenuBar, QProgressBar, QPushButton, QScrollArea,
+    QSizePolicy, QSpacerItem, QStackedWidget, QStatusBar, QTabWidget, QTextEdit,
+    QToolBox, QVBoxLayout, QWidget)
 
-from ressources import ressources_rc
+from ressources import load_ressources
+
+load_ressources()
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -2,37 +2,78 @@
 """
 This script is used to define the graphical interface and its main functions.
 
+The heavy modules (SciPy, matplotlib, the isoconversional methods and the optimization pipeline) are only
+imported when they are first used, so that the window opens quickly. The startup time can be measured with::
+
+    python main.py --benchmark-startup
+
 @author: alan.tabore
 """
    
+import time as time_module
+start_time_of_kinopt = time_module.perf_counter()
     
 import sys
 import os
+import ast
 import traceback
+import json
+import importlib.util
 
 # Get the absolute path of the 'Kinopt' folder
 kinopt_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 # Add the 'Kinopt' folder to the Python path
 sys.path.append(kinopt_path)
 
-from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QComboBox, QLabel, QLineEdit
-from PyQt5.QtCore import QStringListModel, QThread, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QComboBox, QLabel, QLineEdit, QCheckBox, QPushButton
+from PyQt5.QtCore import QStringListModel, QThread, pyqtSignal, QSize, QTimer
 from PyQt5.QtGui import QTextCursor
 from kinopt_interface import Ui_MainWindow
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
+
+def lazy_import(module_name):
+    """
+    Import a module when one of its attributes is used for the first time.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module.
+
+    Returns
+    -------
+    module
+        The module, loaded at the first access to one of its attributes.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.find_spec(module_name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+    return module
 
 
 import data_extraction
-import isoconversional_methods as icm
+import decimation
 import kinetic_models as km
 import optimization as opt 
-
+import checkpoint
+import optimization_trace
+import plot_decimation
+import results_storage
+import results_database
+import warm_start
+# These modules import scipy.optimize and scipy.stats
+icm = lazy_import("isoconversional_methods")
+pipeline = lazy_import("pipeline")
+optimization_worker = lazy_import("optimization_worker")
+
+# SciPy loads its submodules (e.g. scipy.optimize) when they are first used
 import scipy
 import numpy as np
-import time as time_module
 import datetime
 
 
@@ -48,6 +89,30 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_add_files.clicked.connect(self.browse_files)
         self.ui.pushButton_clear_all_files.clicked.connect(self.clear_files)
         self.ui.pushButton_extract_data.clicked.connect(self.extract_data)
+        # Add an option to memory-map large input files instead of loading them in memory
+        self.checkBox_use_memmap = QCheckBox("Memory-map input files")
+        self.ui.formLayout.addRow(self.checkBox_use_memmap)
+        # Add an optional decimation of oversampled data, applied before analysis and optimization
+        self.checkBox_decimation = QCheckBox("Decimate data")
+        self.lineEdit_decimation_number_of_points = QLineEdit()
+        self.lineEdit_decimation_number_of_points.setPlaceholderText("Number of points per file")
+        self.lineEdit_decimation_tolerance = QLineEdit()
+        self.lineEdit_decimation_tolerance.setPlaceholderText("Relative tolerance (e.g. 1e-3)")
+        self.ui.formLayout.addRow(self.checkBox_decimation, self.lineEdit_decimation_number_of_points)
+        self.ui.formLayout.addRow("Decimation tolerance", self.lineEdit_decimation_tolerance)
+        self.checkBox_decimation.toggled.connect(self.apply_decimation)
+        self.lineEdit_decimation_number_of_points.editingFinished.connect(self.apply_decimation)
+        self.lineEdit_decimation_tolerance.editingFinished.connect(self.apply_decimation)
+        # Add a watch mode re-extracting only the selected files that changed (e.g. during a running experiment)
+        self.checkBox_watch_files = QCheckBox("Watch files for changes")
+        self.checkBox_watch_files.setToolTip("The files that change are re-extracted in memory, even if the input files are memory-mapped.")
+        self.ui.formLayout.addRow(self.checkBox_watch_files)
+        self.ui.widget_data_extraction.setMaximumSize(QSize(16777215, 250))
+        self.incremental_extraction = None
+        self.timer_watch_files = QTimer(self)
+        self.timer_watch_files.setInterval(1000)
+        self.timer_watch_files.timeout.connect(self.check_for_file_changes)
+        self.checkBox_watch_files.toggled.connect(self.toggle_watch_files)
         
         # Connect isoconversional analysis elements
         self.selected_isoconversional_method = ''
@@ -62,6 +127,9 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_load_result_files.clicked.connect(self.load_results_files)
         self.ui.pushButton_clear_result_files.clicked.connect(self.clear_results_files)
         self.ui.pushButton_display_result_files.clicked.connect(self.display_selected_result_file)
+        # The text of a result file is displayed page by page, the next page is read when the end is reached
+        self.result_file_next_offset = None
+        self.ui.textEdit_result_file_content.verticalScrollBar().valueChanged.connect(self.display_next_page_of_result_file)
         
         # Connect models and parameters elements
         self.selected_rate = ''
@@ -96,6 +164,13 @@ class MainWindow(QMainWindow):
         
         self.ui.pushButton_clear_models_and_parameters.clicked.connect(self.clear_models_and_parameters_forms_and_combobox)
         self.ui.pushButton_autofill_models_and_parameters.clicked.connect(self.autofill_models_parameters)
+        # Add a warm start filling the parameters from the previous optimizations of the same laws on similar data
+        self.pushButton_warm_start_models_and_parameters = QPushButton("Warm start")
+        self.ui.horizontalLayout_3.insertWidget(self.ui.horizontalLayout_3.indexOf(self.ui.pushButton_autofill_models_and_parameters) + 1,
+                                                self.pushButton_warm_start_models_and_parameters)
+        self.pushButton_warm_start_models_and_parameters.clicked.connect(self.warm_start_models_parameters)
+        self.warm_start = None
+        self.warm_start_of_optimization = None
         
         # Connect optimization parameters elements
         self.selected_global_optimization = ''
@@ -121,11 +196,65 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_clear_optimization.clicked.connect(self.clear_optimization_grids_and_combobox)
         self.ui.pushButton_autofill_optimization.clicked.connect(self.autofill_optimization_parameters)
         self.ui.pushButton_launch_optimization.clicked.connect(self.launch_optimization)
+        # Add periodic checkpoints of the optimization, allowing to resume a long optimization after a crash or a cancellation
+        self.checkBox_checkpoint = QCheckBox("Save checkpoints (interval in s)")
+        self.lineEdit_checkpoint_interval = QLineEdit("60")
+        self.pushButton_resume_optimization = QPushButton("Resume from checkpoint")
+        index_of_launch_button = self.ui.verticalLayout.indexOf(self.ui.pushButton_launch_optimization)
+        self.ui.verticalLayout.insertWidget(index_of_launch_button, self.checkBox_checkpoint)
+        self.ui.verticalLayout.insertWidget(index_of_launch_button + 1, self.lineEdit_checkpoint_interval)
+        self.ui.verticalLayout.insertWidget(index_of_launch_button + 2, self.pushButton_resume_optimization)
+        self.pushButton_resume_optimization.clicked.connect(self.resume_optimization)
+        self.checkpoint_path_to_resume = None
+        
+        self.ui.pushButton_data_extraction_rate.clicked.connect(self.show_extracted_rate)
+        self.ui.pushButton_data_extraction_extent.clicked.connect(self.show_extracted_extent)
+        self.ui.pushButton_data_extraction_temperature.clicked.connect(self.show_extracted_temperature)
+
+        # Live plot of the optimization: the experimental curves are cached and only the model lines are redrawn
+        self.live_optimization_artists = None
+        self.live_optimization_background = None
+        self.live_optimization_split_indices = None
+        self.minimum_time_between_live_plot_updates = 0.2 # in seconds
+        # Log of the optimization: the lines are buffered and appended in batches, the oldest lines are removed
+        # The full history of the iterations is written in a file (see OptimizationThread)
+        self.optimization_log_lines = []
+        self.maximum_number_of_log_lines = 5000
+        self.timer_optimization_log = QTimer(self)
+        self.timer_optimization_log.setInterval(250)
+        self.timer_optimization_log.timeout.connect(self.flush_optimization_log)
+        
+        # The canvases are created once the window is shown, so that matplotlib isn't imported before the window opens
+        self.time_to_first_window = None
+        self.time_to_interactive_window = None
+        QTimer.singleShot(0, self.create_canvases)
+        
+        self.ui.pushButton_results_viewer_rate.clicked.connect(self.show_extracted_result_rate)
+        self.ui.pushButton_results_viewer_extent.clicked.connect(self.show_extracted_result_extent)
+        self.ui.pushButton_results_viewer_temperature.clicked.connect(self.show_extracted_result_temperature)
+        
+        
+    def create_canvases(self):
+        """
+        Create the matplotlib figures, canvases and toolbars of the plots.
+        
+        This method is called by the event loop once the window is shown, since importing matplotlib
+        and creating the canvases take most of the startup time.
+        
+        Returns
+        -------
+        None
+        """
+        self.time_to_first_window = time_module.perf_counter() - start_time_of_kinopt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
         
         # Create a Matplotlib figure and canvas to plot the rate from extracted data
         self.figure_data_extraction_rate = Figure()
         self.canvas_data_extraction_rate = FigureCanvas(self.figure_data_extraction_rate)
         self.ax_data_extraction_rate = self.figure_data_extraction_rate.add_subplot(111)
+        self.level_of_detail_data_extraction_rate = plot_decimation.LevelOfDetail(self.ax_data_extraction_rate)
         self.ui.verticalLayout_data_extraction_rate.addWidget(self.canvas_data_extraction_rate)
         self.ui.verticalLayout_data_extraction_rate.addWidget(NavigationToolbar(self.canvas_data_extraction_rate, self))
         
@@ -133,6 +262,7 @@ class MainWindow(QMainWindow):
         self.figure_data_extraction_extent = Figure()
         self.canvas_data_extraction_extent = FigureCanvas(self.figure_data_extraction_extent)
         self.ax_data_extraction_extent = self.figure_data_extraction_extent.add_subplot(111)
+        self.level_of_detail_data_extraction_extent = plot_decimation.LevelOfDetail(self.ax_data_extraction_extent)
         self.ui.verticalLayout_data_extraction_extent.addWidget(self.canvas_data_extraction_extent)
         self.ui.verticalLayout_data_extraction_extent.addWidget(NavigationToolbar(self.canvas_data_extraction_extent,self))
         
@@ -140,13 +270,10 @@ class MainWindow(QMainWindow):
         self.figure_data_extraction_temperature = Figure()
         self.canvas_data_extraction_temperature = FigureCanvas(self.figure_data_extraction_temperature)
         self.ax_data_extraction_temperature = self.figure_data_extraction_temperature.add_subplot(111)
+        self.level_of_detail_data_extraction_temperature = plot_decimation.LevelOfDetail(self.ax_data_extraction_temperature)
         self.ui.verticalLayout_data_extraction_temperature.addWidget(self.canvas_data_extraction_temperature)
         self.ui.verticalLayout_data_extraction_temperature.addWidget(NavigationToolbar(self.canvas_data_extraction_temperature,self))
         
-        self.ui.pushButton_data_extraction_rate.clicked.connect(self.show_extracted_rate)
-        self.ui.pushButton_data_extraction_extent.clicked.connect(self.show_extracted_extent)
-        self.ui.pushButton_data_extraction_temperature.clicked.connect(self.show_extracted_temperature)
-
         # Create a Matplotlib figure and canvas to plot the evolution of activation energy from isoconversional analysis
         self.figure_isoconversional_analysis = Figure()
         self.canvas_isoconversional_analysis = FigureCanvas(self.figure_isoconversional_analysis)
@@ -158,13 +285,16 @@ class MainWindow(QMainWindow):
         self.figure_optimization = Figure()
         self.canvas_optimization = FigureCanvas(self.figure_optimization)
         self.ax_optimization = self.figure_optimization.add_subplot(111)
+        self.level_of_detail_optimization = plot_decimation.LevelOfDetail(self.ax_optimization)
         self.ui.verticalLayout_optimization.addWidget(self.canvas_optimization)
         self.ui.verticalLayout_optimization.addWidget(NavigationToolbar(self.canvas_optimization,self))
+        self.canvas_optimization.mpl_connect('draw_event', self.on_optimization_canvas_draw)
         
         # Create a Matplotlib figure and canvas to plot the rate from result file
         self.figure_results_viewer_rate = Figure()
         self.canvas_results_viewer_rate = FigureCanvas(self.figure_results_viewer_rate)
         self.ax_results_viewer_rate = self.figure_results_viewer_rate.add_subplot(111)
+        self.level_of_detail_results_viewer_rate = plot_decimation.LevelOfDetail(self.ax_results_viewer_rate)
         self.ui.verticalLayout_results_viewer_rate.addWidget(self.canvas_results_viewer_rate)
         self.ui.verticalLayout_results_viewer_rate.addWidget(NavigationToolbar(self.canvas_results_viewer_rate, self))
         
@@ -172,6 +302,7 @@ class MainWindow(QMainWindow):
         self.figure_results_viewer_extent = Figure()
         self.canvas_results_viewer_extent = FigureCanvas(self.figure_results_viewer_extent)
         self.ax_results_viewer_extent = self.figure_results_viewer_extent.add_subplot(111)
+        self.level_of_detail_results_viewer_extent = plot_decimation.LevelOfDetail(self.ax_results_viewer_extent)
         self.ui.verticalLayout_results_viewer_extent.addWidget(self.canvas_results_viewer_extent)
         self.ui.verticalLayout_results_viewer_extent.addWidget(NavigationToolbar(self.canvas_results_viewer_extent,self))
         
@@ -179,13 +310,10 @@ class MainWindow(QMainWindow):
         self.figure_results_viewer_temperature = Figure()
         self.canvas_results_viewer_temperature = FigureCanvas(self.figure_results_viewer_temperature)
         self.ax_results_viewer_temperature = self.figure_results_viewer_temperature.add_subplot(111)
+        self.level_of_detail_results_viewer_temperature = plot_decimation.LevelOfDetail(self.ax_results_viewer_temperature)
         self.ui.verticalLayout_results_viewer_temperature.addWidget(self.canvas_results_viewer_temperature)
         self.ui.verticalLayout_results_viewer_temperature.addWidget(NavigationToolbar(self.canvas_results_viewer_temperature,self))
-        
-        self.ui.pushButton_results_viewer_rate.clicked.connect(self.show_extracted_result_rate)
-        self.ui.pushButton_results_viewer_extent.clicked.connect(self.show_extracted_result_extent)
-        self.ui.pushButton_results_viewer_temperature.clicked.connect(self.show_extracted_result_temperature)
-        
+        self.time_to_interactive_window = time_module.perf_counter() - start_time_of_kinopt
         
     def browse_files(self):
         """Open a file dialog to browse and select multiple files. Update the file paths list widget."""
@@ -198,6 +326,9 @@ class MainWindow(QMainWindow):
                 "Text Files (*.txt);;CSV Files (*.csv);;All Files (*)"
             )
             if file_paths:
+                # Stop watching the previous files
+                self.checkBox_watch_files.setChecked(False)
+                
                 # Clear the data extraction plots in case previous files were extracted
                 self.clear_data_extraction_plots()
                 
@@ -235,12 +366,38 @@ class MainWindow(QMainWindow):
         self.selected_shortened_file_paths = None
         # Reset the bool to indicate successful extraction
         self.successful_extraction = None
+        # Stop watching the files
+        self.checkBox_watch_files.setChecked(False)
         
         # Update listView background in white to indicate no extraction was performed
         self.ui.listView_files.viewport().setStyleSheet("background-color: white")
         
         self.clear_data_extraction_plots()
         
+    def get_extraction_options(self):
+        """
+        Get the options of the extraction from the GUI.
+
+        Returns
+        -------
+        tuple
+            A tuple containing the delimiter, whether the files have headers and the number of lines to skip.
+        """
+        # Get the delimiter entry from the line edit field
+        delimiter_entry = self.ui.lineEdit_delimiter.text()
+        if delimiter_entry == "":
+            delimiter_entry = ","
+        elif delimiter_entry.lower() == "tab" or delimiter_entry == "\\t":
+            delimiter_entry = "\t"
+
+        # Get the value of the file_has_header_var (Int variable indicating if files have headers)
+        has_header_entry = self.ui.checkBox_file_has_headers.isChecked()
+        
+        # Get the number of lines to skip from the line edit field and convert to integer
+        number_of_lines_to_skip = int(self.ui.lineEdit_number_of_lines_to_skip.text())
+        
+        return delimiter_entry, has_header_entry, number_of_lines_to_skip
+    
     def extract_data(self):
         """Extract data from selected files and update GUI elements based on extraction results."""
         try:
@@ -254,25 +411,18 @@ class MainWindow(QMainWindow):
                     self, "No File Selected", "Please select a file before extracting.")
                 return
     
-            # Get the delimiter entry from the line edit field
-            delimiter_entry = self.ui.lineEdit_delimiter.text()
-            if delimiter_entry == "":
-                delimiter_entry = ","
-            elif delimiter_entry.lower() == "tab" or delimiter_entry == "\\t":
-                delimiter_entry = "\t"
-    
-            # Get the value of the file_has_header_var (Int variable indicating if files have headers)
-            has_header_entry = self.ui.checkBox_file_has_headers.isChecked()
+            delimiter_entry, has_header_entry, number_of_lines_to_skip = self.get_extraction_options()
             
-            # Get the number of lines to skip from the line edit field and convert to integer
-            number_of_lines_to_skip = int(self.ui.lineEdit_number_of_lines_to_skip.text())
+            # Get whether the files should be memory-mapped instead of loaded in memory
+            use_memmap_entry = self.checkBox_use_memmap.isChecked()
                 
             # Launch the extraction process with provided parameters
             self.successful_extraction, message, time_array, temp_array, rate_array, extent_array = launch_extraction(
                 file_paths_list,
                 delimiter=delimiter_entry,
                 has_header=has_header_entry,
-                skip_lines=number_of_lines_to_skip
+                skip_lines=number_of_lines_to_skip,
+                use_memmap=use_memmap_entry
             )
             
             self.ax_data_extraction_rate.clear()
@@ -283,10 +433,10 @@ class MainWindow(QMainWindow):
             # Check if the extraction was successful
             if self.successful_extraction:
                 # Update experimental data arrays in the class instance
-                self.experimental_time = time_array
-                self.experimental_temperature = temp_array
-                self.experimental_rate = rate_array
-                self.experimental_extent = extent_array
+                self.raw_experimental_time = time_array
+                self.raw_experimental_temperature = temp_array
+                self.raw_experimental_rate = rate_array
+                self.raw_experimental_extent = extent_array
     
                 # Update listView background in green to indicate a successful extraction
                 self.ui.listView_files.viewport().setStyleSheet("background-color: #C8FFC8")
@@ -294,23 +444,24 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "Extraction Successful", f"Successful extraction! \n {message}")
     
                
+                self.clear_live_optimization_plot()
                 self.ax_optimization.clear()
                 # Create lists with data separated by files
-                self.experimental_times = []
-                self.experimental_temperatures = []
-                self.experimental_rates = []
-                self.experimental_extents = []
+                self.raw_experimental_times = []
+                self.raw_experimental_temperatures = []
+                self.raw_experimental_rates = []
+                self.raw_experimental_extents = []
+                # Lines of each file, updated in place when watching the files
+                self.data_extraction_lines = []
                 for index, filepath in enumerate(self.selected_full_file_paths):
                     time, temperature, rate, extent = data_extraction.extract_dsc_data_single_file(
-                        filepath, delimiter=delimiter_entry, has_header=has_header_entry, skip_lines=number_of_lines_to_skip)
-                    self.experimental_times.append(time)
-                    self.experimental_temperatures.append(temperature)
-                    self.experimental_rates.append(rate)
-                    self.experimental_extents.append(extent)
+                        filepath, delimiter=delimiter_entry, has_header=has_header_entry, skip_lines=number_of_lines_to_skip, use_memmap=use_memmap_entry)
+                    self.raw_experimental_times.append(time)
+                    self.raw_experimental_temperatures.append(temperature)
+                    self.raw_experimental_rates.append(rate)
+                    self.raw_experimental_extents.append(extent)
                     
-                    self.ax_data_extraction_rate.plot(time,rate,label=f'{self.selected_shortened_file_paths[index]}')
-                    self.ax_data_extraction_extent.plot(time,extent,label=f'{self.selected_shortened_file_paths[index]}')
-                    self.ax_data_extraction_temperature.plot(time,temperature,label=f'{self.selected_shortened_file_paths[index]}')
+                    self.plot_extracted_file(index, time, temperature, rate, extent)
                     
                 self.ax_data_extraction_rate.legend()
                 self.ax_data_extraction_extent.legend()
@@ -327,6 +478,9 @@ class MainWindow(QMainWindow):
                 self.canvas_data_extraction_extent.draw_idle()
                 self.canvas_data_extraction_temperature.draw_idle()
                 
+                # Data used for analysis and optimization, decimated if the option is selected
+                self.apply_decimation()
+                
                 self.ui.tabWidget_visualization.setCurrentIndex(0)
                 
 
@@ -351,7 +505,185 @@ class MainWindow(QMainWindow):
                 self, "Error", f"An error occurred: {str(e)}")
             traceback.print_exc()
             
+    def plot_extracted_file(self, index, time, temperature, rate, extent):
+        """
+        Plot the extracted data of one file, or update its lines in place if they already exist.
+
+        Parameters
+        ----------
+        index : int
+            Index of the file in the selected files.
+        time : numpy.ndarray
+            Time of the file.
+        temperature : numpy.ndarray
+            Temperature of the file.
+        rate : numpy.ndarray
+            Rate of reaction of the file.
+        extent : numpy.ndarray
+            Extent of reaction of the file.
+        """
+        if index < len(self.data_extraction_lines):
+            line_rate, line_extent, line_temperature = self.data_extraction_lines[index]
+            self.level_of_detail_data_extraction_rate.set_data(line_rate, time, rate)
+            self.level_of_detail_data_extraction_extent.set_data(line_extent, time, extent)
+            self.level_of_detail_data_extraction_temperature.set_data(line_temperature, time, temperature)
+        else:
+            label = f'{self.selected_shortened_file_paths[index]}'
+            # The curves are plotted at the resolution of the canvas, and plotted again from the full data after a zoom or pan
+            line_rate = self.level_of_detail_data_extraction_rate.plot(time,rate,label=label)
+            line_extent = self.level_of_detail_data_extraction_extent.plot(time,extent,label=label)
+            line_temperature = self.level_of_detail_data_extraction_temperature.plot(time,temperature,label=label)
+            self.data_extraction_lines.append((line_rate, line_extent, line_temperature))
+    
+    def toggle_watch_files(self, checked):
+        """
+        Start or stop watching the selected files for changes.
+
+        Parameters
+        ----------
+        checked : bool
+            Whether the watch mode is selected.
+        """
+        try:
+            if not checked:
+                self.timer_watch_files.stop()
+                self.incremental_extraction = None
+                return
+            
+            if not self.successful_extraction:
+                QMessageBox.warning(self, "No Extraction", "Please extract the data before watching the files.")
+                self.checkBox_watch_files.setChecked(False)
+                return
+            
+            delimiter_entry, has_header_entry, number_of_lines_to_skip = self.get_extraction_options()
+            # The files that change are re-extracted in memory, even if "Memory-map input files" is selected
+            self.incremental_extraction = data_extraction.IncrementalExtraction([],
+                                                                                 delimiter=delimiter_entry,
+                                                                                 has_header=has_header_entry,
+                                                                                 skip_lines=number_of_lines_to_skip)
+            # The data is already extracted, only the signatures of the files are read
+            self.incremental_extraction.add_extracted_files(self.selected_full_file_paths,
+                                                            zip(self.raw_experimental_times,
+                                                                self.raw_experimental_temperatures,
+                                                                self.raw_experimental_rates,
+                                                                self.raw_experimental_extents))
+            self.timer_watch_files.start()
+        except Exception as e:
+            # Handle other exceptions with a generic error message
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            traceback.print_exc()
+    
+    def check_for_file_changes(self):
+        """Re-extract the selected files that changed and update the data and plots in place."""
+        try:
+            if self.incremental_extraction is None:
+                return
+            
+            # Runs appended to the folders of the selected files are added to the selection once they are valid
+            updated_files = self.incremental_extraction.update()
+            added_files = self.incremental_extraction.add_new_files()
+            if added_files:
+                self.selected_full_file_paths = list(self.incremental_extraction.file_paths)
+                self.selected_shortened_file_paths = [os.path.basename(fp) for fp in self.selected_full_file_paths]
+                self.ui.listView_files.setModel(QStringListModel(self.selected_shortened_file_paths))
+            updated_files = updated_files + added_files
+            
+            errors = [report.to_text() for report in self.incremental_extraction.reports.values() if not report.is_valid]
+            if errors:
+                self.ui.statusbar.showMessage("\n".join(errors))
+            if not updated_files:
+                return
+            
+            (self.raw_experimental_times,
+             self.raw_experimental_temperatures,
+             self.raw_experimental_rates,
+             self.raw_experimental_extents) = self.incremental_extraction.get_arrays_lists()
+            (self.raw_experimental_time,
+             self.raw_experimental_temperature,
+             self.raw_experimental_rate,
+             self.raw_experimental_extent) = self.incremental_extraction.get_concatenated_arrays()
+            
+            for file_path in updated_files:
+                index = self.selected_full_file_paths.index(file_path)
+                self.plot_extracted_file(index,
+                                         self.raw_experimental_times[index],
+                                         self.raw_experimental_temperatures[index],
+                                         self.raw_experimental_rates[index],
+                                         self.raw_experimental_extents[index])
+            
+            for ax, canvas in ((self.ax_data_extraction_rate, self.canvas_data_extraction_rate),
+                               (self.ax_data_extraction_extent, self.canvas_data_extraction_extent),
+                               (self.ax_data_extraction_temperature, self.canvas_data_extraction_temperature)):
+                ax.relim()
+                ax.autoscale_view()
+                ax.legend()
+                canvas.draw_idle()
+            
+            self.apply_decimation()
+            if not errors:
+                self.ui.statusbar.showMessage(f"Re-extracted {len(updated_files)} changed file(s).", 5000)
+        except Exception as e:
+            # Stop watching to avoid repeating the error at each check
+            self.checkBox_watch_files.setChecked(False)
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            traceback.print_exc()
+    
+    def apply_decimation(self):
+        """
+        Set the data used for analysis and optimization from the extracted data.
+        
+        If the decimation is selected, each experiment is decimated to the given number of points 
+        and/or tolerance and the resulting speedup and error are displayed in the status bar.
+        Otherwise, or if neither the number of points nor the tolerance is given, the extracted data is used as is.
+        """
+        try:
+            if not getattr(self, 'successful_extraction', None):
+                return
+            
+            number_of_points, tolerance = None, None
+            if self.checkBox_decimation.isChecked():
+                number_of_points = self.lineEdit_decimation_number_of_points.text()
+                tolerance = self.lineEdit_decimation_tolerance.text()
+                number_of_points = int(number_of_points) if number_of_points != '' else None
+                tolerance = float(tolerance) if tolerance != '' else None
+            
+            if number_of_points is not None or tolerance is not None:
+                (self.experimental_times,
+                 self.experimental_temperatures,
+                 self.experimental_rates,
+                 self.experimental_extents,
+                 decimation_report) = decimation.decimate_experiments(self.raw_experimental_times,
+                                                                      self.raw_experimental_temperatures,
+                                                                      self.raw_experimental_rates,
+                                                                      self.raw_experimental_extents,
+                                                                      number_of_points,
+                                                                      tolerance)
+                self.experimental_time = np.concatenate(self.experimental_times)
+                self.experimental_temperature = np.concatenate(self.experimental_temperatures)
+                self.experimental_rate = np.concatenate(self.experimental_rates)
+                self.experimental_extent = np.concatenate(self.experimental_extents)
+                self.ui.statusbar.showMessage(decimation_report.to_text())
+            else:
+                self.experimental_times = self.raw_experimental_times
+                self.experimental_temperatures = self.raw_experimental_temperatures
+                self.experimental_rates = self.raw_experimental_rates
+                self.experimental_extents = self.raw_experimental_extents
+                self.experimental_time = self.raw_experimental_time
+                self.experimental_temperature = self.raw_experimental_temperature
+                self.experimental_rate = self.raw_experimental_rate
+                self.experimental_extent = self.raw_experimental_extent
+                if self.checkBox_decimation.isChecked():
+                    # The extracted data is used as is until the decimation is parameterized
+                    self.ui.statusbar.showMessage("Decimation: please indicate a number of points per file or a tolerance. The extracted data is used without decimation.")
+                else:
+                    self.ui.statusbar.clearMessage()
+        except Exception as e:
+            # Handle other exceptions with a generic error message
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            traceback.print_exc()
+    
     def clear_data_extraction_plots(self):
+        self.data_extraction_lines = []
         self.ax_data_extraction_rate.clear()
         self.ax_data_extraction_extent.clear()
         self.ax_data_extraction_temperature.clear()
@@ -725,7 +1057,70 @@ class MainWindow(QMainWindow):
         self.tg_law_parameters_to_optimize = []
         self.selected_tg_law = ''
         
+        self.warm_start = None
+        
+    def warm_start_models_parameters(self):
+        """
+        Fill the initial guesses, and the bounds of the global optimization, from the previous optimizations of the same laws on similar data.
+        
+        The previous optimizations are looked up in the results database (see warm_start). If differential evolution
+        is selected, its initial population is created from the previous results when the optimization is launched.
         
+        Returns
+        -------
+        None
+        """
+        try:
+            if not hasattr(self, 'successful_extraction') or not self.successful_extraction:
+                QMessageBox.critical(self, "Error", "Please, make sure you extracted the data successfully.")
+                return
+            laws, parameter_names, experiments = self.get_warm_start_problem()
+            line_edit_dicts = {"rate": self.line_edit_dict_rate_model, "vitrification": self.line_edit_dict_vitrification_model,
+                               "coupling": self.line_edit_dict_coupling_law}
+            # The bounds of the global optimization, if they are filled, limit the tightened bounds
+            parameters_to_optimize = self.line_edit_dict_rate_model | self.line_edit_dict_vitrification_model | self.line_edit_dict_coupling_law
+            bound_entries = [(self.entries_dict_global_optimization.get("min" + parameter), self.entries_dict_global_optimization.get("max" + parameter))
+                             for parameter in parameters_to_optimize]
+            bounds = None
+            if bound_entries and all(min_entry is not None and max_entry is not None for min_entry, max_entry in bound_entries):
+                bounds = [(float(min_entry.text()), float(max_entry.text())) if min_entry.text() != '' and max_entry.text() != '' else (-np.inf, np.inf)
+                          for min_entry, max_entry in bound_entries]
+            
+            self.warm_start = warm_start.propose_warm_start(results_database.get_default_database_path(), laws, parameter_names, experiments, bounds)
+            if self.warm_start is None:
+                QMessageBox.information(self, "Warm start", "No previous optimization of these laws on similar data was found.")
+                return
+            line_edits = [line_edit for line_edit_dict in line_edit_dicts.values() for line_edit in line_edit_dict.values()]
+            for line_edit, value in zip(line_edits, self.warm_start.initial_guess):
+                line_edit.setText(str(value))
+            if bounds is not None:
+                for (min_entry, max_entry), (min_value, max_value) in zip(bound_entries, self.warm_start.bounds):
+                    min_entry.setText(str(min_value))
+                    max_entry.setText(str(max_value))
+            QMessageBox.information(self, "Warm start", f"Parameters filled from the previous optimization {self.warm_start.run_ids[0]} "
+                                                        f"({len(self.warm_start.run_ids)} similar optimizations found).")
+        except Exception as e:
+            # Handle other exceptions with a generic error message
+            QMessageBox.critical(self,"Error", f"An error occurred: {str(e)}")
+            traceback.print_exc()
+    
+    def get_warm_start_problem(self):
+        """
+        Describe the optimization problem a warm start is proposed for.
+        
+        Returns
+        -------
+        tuple
+            Selected laws, names of the parameters to optimize of each section and experimental data (dicts).
+        """
+        laws = {"rate": self.selected_rate, "vitrification": self.selected_vitrification,
+                "coupling": self.selected_coupling_law, "tg": self.selected_tg_law}
+        parameter_names = {"rate": list(self.line_edit_dict_rate_model), "vitrification": list(self.line_edit_dict_vitrification_model),
+                           "coupling": list(self.line_edit_dict_coupling_law)}
+        experiments = {"time": self.experimental_times, "temperature": self.experimental_temperatures,
+                       "rate": self.experimental_rates, "extent": self.experimental_extents}
+        return laws, parameter_names, experiments
+    
     def autofill_models_parameters(self):
         """
         Autofill parameters in line edits for rate, vitrification, and coupling law models.
@@ -1303,21 +1698,64 @@ class MainWindow(QMainWindow):
                     raise AttributeError( f" An error occurred:\n The parameter {key} is not handled.\n Please modify the 'get_local_optimization_args_dict' function in main.py.")
                     traceback.print_exc()
                     
-            main_args_dict_for_local_optimization = {"jac": None, "hess": None, "hessp": None, "bounds": None,"constraints": (), "tol": None, "callback": None}
-            keys_to_remove_from_option_dict = []
-            for key, value in options_dict.items():
-                if key in main_args_dict_for_local_optimization.keys():
-                    main_args_dict_for_local_optimization[key] = options_dict[key]
-                    keys_to_remove_from_option_dict.append(key)
-            for key in keys_to_remove_from_option_dict:
-                del options_dict[key]
-            main_args_dict_for_local_optimization['options'] = options_dict  
+            main_args_dict_for_local_optimization = pipeline.split_local_optimization_options(options_dict)
             return main_args_dict_for_local_optimization
         except Exception as e:
             # Handle other exceptions with a generic error message
             QMessageBox.critical(self,"Error", f"An error occurred: {str(e)}")
             traceback.print_exc()   
 
+    def closeEvent(self, event):
+        """
+        Stop the running optimization before closing the window, instead of killing its thread.
+
+        Parameters
+        ----------
+        event : QCloseEvent
+            The close event.
+        """
+        if hasattr(self, 'optimization_thread') and self.optimization_thread.isRunning():
+            self.optimization_thread.request_cancellation()
+            self.optimization_thread.wait(5000)
+        super().closeEvent(event)
+    
+    def get_optimization_checkpoint(self):
+        """
+        Create the checkpoint of the optimization, if checkpoints are enabled or an optimization is resumed.
+
+        Returns
+        -------
+        checkpoint.OptimizationCheckpoint or None
+            Checkpoint given to the optimization thread.
+        """
+        parameter_names = list(self.line_edit_dict_rate_model | self.line_edit_dict_vitrification_model | self.line_edit_dict_coupling_law)
+        interval = float(self.lineEdit_checkpoint_interval.text()) if self.lineEdit_checkpoint_interval.text() != '' else 60
+        if self.checkpoint_path_to_resume is not None:
+            checkpoint_path = self.checkpoint_path_to_resume
+            self.checkpoint_path_to_resume = None
+            return checkpoint.OptimizationCheckpoint(checkpoint_path, interval, resume=True, parameter_names=parameter_names)
+        if self.checkBox_checkpoint.isChecked():
+            current_date = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            results_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "results")
+            checkpoint_path = os.path.join(results_dir, f"{current_date}_checkpoint_of_optimization.json")
+            return checkpoint.OptimizationCheckpoint(checkpoint_path, interval, parameter_names=parameter_names)
+        return None
+    
+    def resume_optimization(self):
+        """
+        Select a checkpoint and launch the optimization from the state it contains.
+
+        The models, methods and parameters of the optimization must be the same as when the checkpoint was saved.
+        """
+        results_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "results")
+        checkpoint_path, _ = QFileDialog.getOpenFileName(self, "Select a checkpoint", results_dir, "Checkpoints (*.json)")
+        if checkpoint_path == '':
+            return
+        self.checkpoint_path_to_resume = checkpoint_path
+        self.launch_optimization()
+        # The path is only used by this launch, even if it failed
+        self.checkpoint_path_to_resume = None
+    
     def launch_optimization(self):
         """
         Launch the optimization process.
@@ -1423,6 +1861,17 @@ class MainWindow(QMainWindow):
             else:
                 self.global_optimization = None
                 self.global_optimization_args_dict = None
+            # The warm start is only used if the laws, the parameters to optimize and the data didn't change since it was proposed
+            self.warm_start_of_optimization = None
+            if self.warm_start is not None and not self.warm_start.matches(*self.get_warm_start_problem()):
+                self.warm_start = None
+                self.ui.statusbar.showMessage("Warm start: the laws or the data changed since it was proposed, the optimization is started cold.")
+            if self.warm_start is not None:
+                self.warm_start_of_optimization = self.warm_start
+                if self.global_optimization is not None:
+                    # The tightened bounds are already in the bounds of the form, only the initial population is added
+                    self.global_optimization_args_dict = warm_start.apply_warm_start(self.selected_global_optimization, self.global_optimization_args_dict,
+                                                                                     self.warm_start, tighten_bounds=False)
             if self.selected_local_optimization != '':
                 self.local_optimization = getattr(scipy.optimize, 'minimize')
                 
@@ -1453,7 +1902,25 @@ class MainWindow(QMainWindow):
                         self.max_iter = self.local_optimization_args_dict['options'][key]
 
             
+            self.optimization_checkpoint = self.get_optimization_checkpoint()
+            
+            current_date = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            results_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "results")
+            os.makedirs(results_dir, exist_ok=True)
+            history_path = os.path.join(results_dir, f"{current_date}_history_of_optimization.jsonl")
+            # The trace (cost, evaluations and parameters with respect to time) allows to compare the convergence of the methods
+            parameter_names = list(self.line_edit_dict_rate_model | self.line_edit_dict_vitrification_model | self.line_edit_dict_coupling_law)
+            self.optimization_trace = optimization_trace.OptimizationTrace(os.path.join(results_dir, f"{current_date}_trace_of_optimization.npz"),
+                                                                           parameter_names=parameter_names,
+                                                                           method=self.selected_global_optimization or self.selected_local_optimization)
+            
             self.ui.textEdit_output_of_optimization.clear()
+            self.ui.textEdit_output_of_optimization.document().setMaximumBlockCount(self.maximum_number_of_log_lines)
+            self.optimization_log_lines = []
+            self.add_to_optimization_log(f"History of the iterations written in {history_path}\n")
+            self.add_to_optimization_log(f"Trace of the optimization written in {self.optimization_trace.trace_path}\n")
+            self.timer_optimization_log.start()
+            self.setup_live_optimization_plot()
             
             # =============================================================================
             # Start a thread to perform optimization without blocking the GUI         
@@ -1480,7 +1947,11 @@ class MainWindow(QMainWindow):
                                                           self.tg_args, 
                                                           self.cost_function_args,                                                          
                                                           self.experimental_args_for_cost_function,
-                                                          self.max_iter
+                                                          self.max_iter,
+                                                          self.optimization_checkpoint,
+                                                          self.minimum_time_between_live_plot_updates,
+                                                          history_path,
+                                                          self.optimization_trace
                                                           )
             self.ui.pushButton_launch_optimization.setText("Cancel optimization")
             self.ui.pushButton_launch_optimization.clicked.disconnect()
@@ -1488,13 +1959,16 @@ class MainWindow(QMainWindow):
             self.optimization_thread.start()
             self.optimization_thread.update_progress_bar_signal.connect(self.update_progress_bar)
             self.optimization_thread.update_graph_signal.connect(self.update_graph)
+            self.optimization_thread.update_model_signal.connect(self.update_live_optimization_plot)
             self.optimization_thread.end_of_optimization.connect(self.update_GUI_at_end_of_optimization)
             self.optimization_thread.error_in_optimization_thread.connect(self.display_error_in_optimization_thread)
         except Exception as e:
             # Handle other exceptions with a generic error message
             traceback.print_exc() 
             QMessageBox.critical(self,"Error", f"An error occurred: {str(e)}")
-            self.optimization_thread.terminate()
+            if hasattr(self, 'optimization_thread') and self.optimization_thread.isRunning():
+                self.optimization_thread.request_cancellation()
+            self.stop_optimization_log()
             self.ui.pushButton_launch_optimization.setEnabled(True)
             self.ui.progressBar.setValue(0)
             self.ui.label_remaing_time.setText("Remaining time: (No optimization runnning)")
@@ -1517,17 +1991,11 @@ class MainWindow(QMainWindow):
         """
         try:
             if hasattr(self, 'optimization_thread') and self.optimization_thread.isRunning():
-                self.ui.pushButton_launch_optimization.setText("Start optimization")
-                self.ui.pushButton_launch_optimization.clicked.disconnect()
-                self.ui.pushButton_launch_optimization.clicked.connect(self.launch_optimization)
-                self.optimization_thread.terminate()
-                self.ui.pushButton_launch_optimization.setEnabled(True)
-                self.ui.progressBar.setValue(0)
-                self.ui.label_remaing_time.setText("Remaining time: (No optimization runnning)")
-                self.ui.textEdit_output_of_optimization.insertPlainText("Optimization cancelled.\n")
-                self.ui.textEdit_output_of_optimization.moveCursor(QTextCursor.End)
-                self.ax_optimization.clear()
-                self.canvas_optimization.draw_idle()
+                # The thread stops by itself and returns the best result found so far, see update_GUI_at_end_of_optimization
+                self.ui.pushButton_launch_optimization.setText("Cancelling optimization...")
+                self.ui.pushButton_launch_optimization.setEnabled(False)
+                self.optimization_thread.request_cancellation()
+                self.add_to_optimization_log("Cancelling optimization...\n")
         except Exception as e:
             # Handle other exceptions with a generic error message
             QMessageBox.critical(self,"Error", f"An error occurred: {str(e)}")
@@ -1577,99 +2045,215 @@ class MainWindow(QMainWindow):
         increment_info += '\n'
         increment_info += '\n'.join([f"- {key}: {value}" for key, value in kwargs.items()])
         increment_info += '\n'
-        self.ui.textEdit_output_of_optimization.insertPlainText(increment_info)
-        self.ui.textEdit_output_of_optimization.moveCursor(QTextCursor.End)
+        self.add_to_optimization_log(increment_info)
         
         # Convert remaining seconds to hours, minutes, and seconds
         remaining_hours, remaining_seconds = divmod(estimated_remaining_seconds, 3600)
         remaining_minutes, remaining_seconds = divmod(remaining_seconds, 60)
         remaining_time_str = "{:02}hours:{:02}min:{:02}s".format(int(remaining_hours), int(remaining_minutes), int(remaining_seconds))
         self.ui.label_remaing_time.setText(f"Remaining time: {remaining_time_str}")
+    
+    def add_to_optimization_log(self, text):
+        """
+        Add text to the log of the optimization. It's displayed at the next flush of the log.
+        
+        Parameters
+        ----------
+        text : str
+            Text to add.
         
-        rate_opti = opt.model(x,
-                              self.rate_law,
-                              self.experimental_args_for_rate,
-                              self.number_of_parameters_to_optimize_for_rate,
-                              self.vitrification_law,
-                              self.experimental_args_for_vitrification,
-                              self.number_of_parameters_to_optimize_for_vitrification,
-                              self.coupling_law,
-                              self.experimental_args_for_coupling,
-                              self.tg_law,
-                              self.experimental_args_for_tg,
-                              self.tg_args)
+        Returns
+        -------
+        None
+        """
+        self.optimization_log_lines.append(text)
+    
+    def flush_optimization_log(self):
+        """
+        Append the buffered text to the log of the optimization in a single insertion.
+        
+        The document of the log keeps at most maximum_number_of_log_lines lines, so that insertions stay fast during long optimizations.
+        
+        Returns
+        -------
+        None
+        """
+        if not self.optimization_log_lines:
+            return
+        text = ''.join(self.optimization_log_lines)
+        self.optimization_log_lines = []
+        self.ui.textEdit_output_of_optimization.moveCursor(QTextCursor.End)
+        self.ui.textEdit_output_of_optimization.insertPlainText(text)
+        self.ui.textEdit_output_of_optimization.moveCursor(QTextCursor.End)
+    
+    def stop_optimization_log(self):
+        """
+        Stop the periodic flush of the log and display the remaining buffered text.
         
+        Returns
+        -------
+        None
+        """
+        self.timer_optimization_log.stop()
+        self.flush_optimization_log()
+    
+    def update_live_optimization_plot(self, increment, rate_opti):
+        """
+        Update the model lines of the live plot with the rate computed by the optimization process.
+        
+        The rate is computed by the worker process at most every minimum_time_between_live_plot_updates seconds,
+        so that the model is never evaluated in the GUI thread.
+    
+        Parameters
+        ----------
+        increment : int
+            The increment of the optimization process at which the rate was computed.
+        rate_opti : numpy.ndarray
+            Rate of the model for all the selected files.
+    
+        Returns
+        -------
+        None
+        """
         # The result of the "opt.model" function contained in "rate_opti" are an aggregation of the rates contained in all the files.
-        # Since we want to display a curve for each, we split the data thanks to "range_of_plot"
-        range_of_plot = [0, 0]
+        # Since we want to display a curve for each, we split the data at the first index of each file
+        if self.live_optimization_artists is None:
+            self.setup_live_optimization_plot()
+        *model_lines, title = self.live_optimization_artists
+        for model_line, time, model_rate in zip(model_lines, self.experimental_times, np.split(rate_opti, self.live_optimization_split_indices)):
+            self.level_of_detail_optimization.set_data(model_line, time, model_rate)
+        title.set_text(f'Optimization at increment:{increment}')
+        
+        if self.live_optimization_background is None:
+            # The canvas was never drawn (e.g. hidden tab), the background is cached by the next full draw
+            self.canvas_optimization.draw_idle()
+            return
+        # Only the model lines and the title are redrawn over the cached background (blitting)
+        self.canvas_optimization.restore_region(self.live_optimization_background)
+        for artist in self.live_optimization_artists:
+            self.ax_optimization.draw_artist(artist)
+        self.canvas_optimization.blit(self.figure_optimization.bbox)
+    
+    def setup_live_optimization_plot(self):
+        """
+        Draw the experimental rates once and create the model lines updated during the optimization.
+        
+        The experimental curves, axes and legend are cached as a background by on_optimization_canvas_draw.
+        During the optimization, only the model lines and the title are redrawn over it (see update_live_optimization_plot).
+        
+        Returns
+        -------
+        None
+        """
+        self.live_optimization_artists = None
+        self.live_optimization_background = None
         self.ax_optimization.clear()
-        self.ax_optimization.set_title(f'Optimization at increment:{increment}')
         self.ax_optimization.set_xlabel("Time (s)")
         self.ax_optimization.set_ylabel("Rate (s-1)")
         
+        model_lines = []
         for index, filepath in enumerate(self.selected_shortened_file_paths):
-            # Extend the plot range according to the number of experimental points
-            range_of_plot[1] = range_of_plot[1] + len(self.experimental_times[index])
             # Plot the experimental rate with respect to time
-            curve1 = self.ax_optimization.plot(self.experimental_times[index], self.experimental_rates[index], label=f"Experimental rate for {self.selected_shortened_file_paths[index]}", alpha=0.8)
+            curve1 = self.level_of_detail_optimization.plot(self.experimental_times[index], self.experimental_rates[index], label=f"Experimental rate for {filepath}", alpha=0.8)
             # Get the color of curve1 so that experimental and optimized rate have the same color
-            color_of_first_curve = curve1[0].get_color()
-            # Plot the optimized rate with respect to time
-            self.ax_optimization.plot(self.experimental_times[index], rate_opti[range_of_plot[0]:range_of_plot[1]], label=f"Model rate for {self.selected_shortened_file_paths[index]}", linestyle='dashed', color=color_of_first_curve, linewidth=2)
-            # Modify the initial range of plot so that it corresponds to the initial index of next file data in "rate_opti" 
-            range_of_plot[0] = range_of_plot[0] + len(self.experimental_times[index])
-
+            color_of_first_curve = curve1.get_color()
+            # The model line is animated: it's excluded from full draws and drawn by blitting
+            model_line = self.level_of_detail_optimization.plot(self.experimental_times[index], np.full(len(self.experimental_times[index]), np.nan), label=f"Model rate for {filepath}", linestyle='dashed', color=color_of_first_curve, linewidth=2, animated=True)
+            model_lines.append(model_line)
+        title = self.ax_optimization.set_title('Optimization in progress', animated=True)
         self.ax_optimization.legend()
-        self.canvas_optimization.draw_idle()
         
+        self.live_optimization_split_indices = np.cumsum([len(time) for time in self.experimental_times])[:-1]
+        self.live_optimization_artists = model_lines + [title]
         self.ui.tabWidget_visualization.setCurrentIndex(2)
+        self.canvas_optimization.draw()
+    
+    def on_optimization_canvas_draw(self, event):
+        """
+        Cache the background of the live plot after each full draw (e.g. first draw, resize or zoom) and draw the model lines on it.
+        
+        Parameters
+        ----------
+        event : matplotlib.backend_bases.DrawEvent
+            The draw event.
+        
+        Returns
+        -------
+        None
+        """
+        if self.live_optimization_artists is None:
+            return
+        self.live_optimization_background = self.canvas_optimization.copy_from_bbox(self.figure_optimization.bbox)
+        for artist in self.live_optimization_artists:
+            self.ax_optimization.draw_artist(artist)
     
-    def update_GUI_at_end_of_optimization(self,results,total_optimization_time):
+    def clear_live_optimization_plot(self):
+        """
+        Stop the live plot of the optimization, so that the axes can be used for a full plot.
+        
+        Returns
+        -------
+        None
+        """
+        self.live_optimization_artists = None
+        self.live_optimization_background = None
+    
+    def update_GUI_at_end_of_optimization(self,results,total_optimization_time,rate_opti):
         try:
-            self.optimization_thread.terminate()
+            # The thread has emitted its last signal, it only needs to return
+            self.optimization_thread.wait()
+            self.ui.pushButton_launch_optimization.setText("Start optimization")
+            self.ui.pushButton_launch_optimization.clicked.disconnect()
+            self.ui.pushButton_launch_optimization.clicked.connect(self.launch_optimization)
             self.ui.pushButton_launch_optimization.setEnabled(True)
+            if results.get('cancelled', False):
+                self.add_to_optimization_log("Optimization cancelled, the results below are the best found so far.\n")
+                if self.optimization_thread.optimization_checkpoint is not None:
+                    self.add_to_optimization_log(f"Checkpoint saved in {self.optimization_thread.optimization_checkpoint.checkpoint_path}\n")
+            self.stop_optimization_log()
             self.ui.progressBar.setValue(100)
             self.ui.label_remaing_time.setText("Remaining time: (No optimization runnning)")
             
             self.total_time_for_optimization = total_optimization_time
             self.results = results
-            print("final x used for plot:", self.results.x)
-            rate_opti = opt.model(self.results.x,
-                                  self.rate_law,
-                                  self.experimental_args_for_rate,
-                                  self.number_of_parameters_to_optimize_for_rate,
-                                  self.vitrification_law,
-                                  self.experimental_args_for_vitrification,
-                                  self.number_of_parameters_to_optimize_for_vitrification,
-                                  self.coupling_law,
-                                  self.experimental_args_for_coupling,
-                                  self.tg_law,
-                                  self.experimental_args_for_tg,
-                                  self.tg_args)
+            # The rate of the model for the final parameters is computed by the optimization process
             
             dif = rate_opti-self.experimental_rate
             self.mean_rss = np.dot(dif, dif)/len(dif)
             
-            # Update output textEdit widget with
-            summary_info = self.get_summary_info()
-            self.ui.textEdit_output_of_optimization.insertPlainText(summary_info)
-            
             current_date = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
             src_dir = os.path.dirname(os.path.realpath(__file__))
             results_dir = os.path.join(src_dir, "..", "results")
             filename = f"{current_date}_results_of_optimization.txt"
             file_path = os.path.join(results_dir, filename)
+            data_file_path = results_storage.get_data_path(file_path)
+            
+            # Update output textEdit widget with
+            summary_info = self.get_summary_info(os.path.basename(data_file_path))
+            # The summary is displayed entirely, the log is bounded again at the next optimization
+            self.ui.textEdit_output_of_optimization.document().setMaximumBlockCount(0)
+            self.ui.textEdit_output_of_optimization.insertPlainText(summary_info)
             
             # Create the 'results' folder if it doesn't exist
             if not os.path.exists(results_dir):
                 os.makedirs(results_dir)
+            # The data and results are saved at full precision in a binary file, next to the text summary
+            results_metadata = self.get_results_metadata()
+            experiments = {"time": self.experimental_times,
+                           "temperature": self.experimental_temperatures,
+                           "rate": self.experimental_rates,
+                           "extent": self.experimental_extents}
+            results_storage.save_results(data_file_path, results_metadata, experiments, self.results.x, rate_opti)
             with open(file_path, 'w') as file:
                 file.write(summary_info)
+            # The results are also added to the database of all the optimizations, to compare them
+            results_database.add_run(results_database.get_default_database_path(), results_metadata, experiments, file_path)
             
             # The result of the "opt.model" function contained in "rate_opti" are an aggregation of the rates contained in all the files.
             # Since we want to display a curve for each, we split the data thanks to "range_of_plot"
             range_of_plot = [0, 0]
             
+            self.clear_live_optimization_plot()
             self.ax_optimization.clear()
             self.ax_optimization.set_title('Final result of optimization')
             self.ax_optimization.set_xlabel("Time (s)")
@@ -1679,11 +2263,11 @@ class MainWindow(QMainWindow):
                 # Extend the plot range according to the number of experimental points
                 range_of_plot[1] = range_of_plot[1] + len(self.experimental_times[index])
                 # Plot the experimental rate with respect to time
-                curve1 = self.ax_optimization.plot(self.experimental_times[index], self.experimental_rates[index], label=f"Experimental rate for {self.selected_shortened_file_paths[index]}", alpha=0.8)
+                curve1 = self.level_of_detail_optimization.plot(self.experimental_times[index], self.experimental_rates[index], label=f"Experimental rate for {self.selected_shortened_file_paths[index]}", alpha=0.8)
                 # Get the color of curve1 so that experimental and optimized rate have the same color
-                color_of_first_curve = curve1[0].get_color()
+                color_of_first_curve = curve1.get_color()
                 # Plot the optimized rate with respect to time
-                self.ax_optimization.plot(self.experimental_times[index], rate_opti[range_of_plot[0]:range_of_plot[1]], label=f"Model rate for {self.selected_shortened_file_paths[index]}", linestyle='dashed', color=color_of_first_curve, linewidth=2)
+                self.level_of_detail_optimization.plot(self.experimental_times[index], rate_opti[range_of_plot[0]:range_of_plot[1]], label=f"Model rate for {self.selected_shortened_file_paths[index]}", linestyle='dashed', color=color_of_first_curve, linewidth=2)
                 # Modify the initial range of plot so that it corresponds to the initial index of next file data in "rate_opti" 
                 range_of_plot[0] = range_of_plot[0] + len(self.experimental_times[index])
     
@@ -1707,9 +2291,12 @@ class MainWindow(QMainWindow):
         -------
         None
         """
-        print("error detected in optimization thread")
-        self.optimization_thread.terminate()
+        self.optimization_thread.wait()
+        self.stop_optimization_log()
         # Handle other exceptions with a generic error message
+        self.ui.pushButton_launch_optimization.setText("Start optimization")
+        self.ui.pushButton_launch_optimization.clicked.disconnect()
+        self.ui.pushButton_launch_optimization.clicked.connect(self.launch_optimization)
         self.ui.pushButton_launch_optimization.setEnabled(True)
         QMessageBox.critical(self,"Error", f"An error occurred: {str(error_message)}")
         traceback.print_exc() 
@@ -1755,7 +2342,49 @@ class MainWindow(QMainWindow):
     
         return tuple(experimental_args)
     
-    def get_summary_info(self):
+    def get_results_metadata(self):
+        """
+        Describe the optimization and its results, to save them with the data (see results_storage).
+        
+        Returns
+        -------
+        dict
+            Files, laws, optimization methods, cost function and results of the optimization.
+        """
+        def describe_law(selected_law, experimental_parameters, line_edit_dict, first_index):
+            if not selected_law:
+                return None
+            return {"law": selected_law,
+                    "experimental_parameters": list(experimental_parameters),
+                    "initial_guess": {key: line_edit.text() for key, line_edit in line_edit_dict.items()},
+                    "results": {key: float(self.results.x[first_index + index]) for index, key in enumerate(line_edit_dict)}}
+        
+        number_of_parameters_for_rate_and_vitrification = self.number_of_parameters_to_optimize_for_rate + self.number_of_parameters_to_optimize_for_vitrification
+        return {"files": list(self.selected_shortened_file_paths),
+                "full_file_paths": list(self.selected_full_file_paths),
+                "rate": describe_law(self.selected_rate, self.rate_parameters_experimental, self.line_edit_dict_rate_model, 0),
+                "vitrification": describe_law(self.selected_vitrification, self.vitrification_parameters_experimental, self.line_edit_dict_vitrification_model, self.number_of_parameters_to_optimize_for_rate),
+                "coupling": describe_law(self.selected_coupling_law, self.coupling_law_parameters_experimental, self.line_edit_dict_coupling_law, number_of_parameters_for_rate_and_vitrification),
+                "tg": {"law": self.selected_tg_law,
+                       "experimental_parameters": list(self.tg_law_parameters_experimental),
+                       "parameters": {key: line_edit.text() for key, line_edit in self.line_edit_dict_tg_law.items()}} if self.selected_tg_law else None,
+                "global_optimization": {"method": self.selected_global_optimization, "parameters": self.global_optimization_args_dict} if self.selected_global_optimization else None,
+                "local_optimization": {"method": self.selected_local_optimization, "parameters": self.local_optimization_args_dict} if self.selected_local_optimization else None,
+                "cost_function": {"function": self.selected_cost_function,
+                                  "experimental_parameters": list(self.cost_function_parameters_experimental),
+                                  "parameters": {key: line_edit.text() for key, line_edit in self.entries_dict_cost_function.items()}},
+                "results": {"fun": float(self.results.fun),
+                            "mean_rss": float(self.mean_rss),
+                            "total_optimization_time": self.total_time_for_optimization,
+                            "success": bool(self.results.get('success', True)),
+                            "cancelled": bool(self.results.get('cancelled', False)),
+                            "message": str(self.results.get('message', '')),
+                            "nfev": int(self.results.get('nfev', 0)),
+                            "nit": int(self.results.get('nit', 0))},
+                "warm_start": self.warm_start_of_optimization.to_dict() if self.warm_start_of_optimization is not None else None,
+                "date": datetime.datetime.now().isoformat(timespec='seconds')}
+    
+    def get_summary_info(self, data_file_name=None):
         summary_info = '================ Files ================\n'
         summary_info += "Files used for optimization:\n"
         summary_info += '\n'.join([f"- {file}" for file in self.selected_shortened_file_paths])
@@ -1854,35 +2483,11 @@ class MainWindow(QMainWindow):
             summary_info += f"{self.results}\n"
         
         # Data section
+        # The data are saved at full precision in the binary results file (see results_storage), only their size is written here
         summary_info += '================ Data used for optimization ================\n'
-        
-
-        data_rows = []
-        headers = ["Time", "Temperature", "Rate", "Extent"]
-        
-        # Construct the header row
-        header_row = "\t".join([f"{header}{i+1}" for i in range(len(self.experimental_times)) for header in headers ])
-        data_rows.append(header_row)
-        
-        # Pad experimental times to ensure uniform sizes
-        padded_times = pad_arrays(self.experimental_times)
-        padded_temperatures = pad_arrays(self.experimental_temperatures)
-        padded_rates = pad_arrays(self.experimental_rates)
-        padded_extents = pad_arrays(self.experimental_extents)
-
-        # Combine experimental data into a single NumPy array
-        experimental_data = np.array([padded_times, padded_temperatures, padded_rates, padded_extents])
-        
-        # Transpose the data
-        experimental_data = np.transpose(experimental_data)
-        
-        # Construct the data rows
-        for row_values in experimental_data:
-            concatenated_row = np.concatenate(row_values)
-            data_rows.append("\t".join(map(str, concatenated_row)))
-        
-        data_section = "\n".join(data_rows)
-        summary_info += data_section
+        if data_file_name is not None:
+            summary_info += f"Data file: {data_file_name}\n"
+        summary_info += f"Number of points: {[len(time) for time in self.experimental_times]}\n"
         
         return summary_info
 
@@ -1934,6 +2539,8 @@ class MainWindow(QMainWindow):
         self.selected_shortened_results_file_paths = None
         # Reset the bool to indicate successful extraction
         self.successful_results_extraction = None
+        # Stop reading the text of the previous result file
+        self.result_file_next_offset = None
         
         # Update listView background in white to indicate no extraction was performed
         self.ui.listView_result_files.viewport().setStyleSheet("background-color: white")
@@ -1953,103 +2560,89 @@ class MainWindow(QMainWindow):
                 return
     
             
-            # Launch the extraction process with provided parameters
-            with open(self.selected_result_file, 'r') as file:
-                result_summary_info = file.read()
-                self.ui.textEdit_result_file_content.setText(result_summary_info)
-                
-                # Define variables to store the extracted information
-                files = []
-                rate_info = {}
-                vitrification_info = {}
-                coupling_info = {}
-                tg_info = {}
-                results_experimental_times = []
-                results_experimental_temperatures = []
-                results_experimental_extents = []
-                results_experimental_rates = []
-                
-                # Split the summary info by sections
-                sections = result_summary_info.split('================ ')
-                
-                rate_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}}   
-                vitrification_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}} 
-                coupling_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}} 
-                tg_info = {"law": None,"experimental_parameters": None,"parameters": {'None':'None'}} 
-                
-                # Iterate over sections to extract information
-                for section in sections:
-                    lines = section.strip().split('\n')
-                    if "Files ==" in section:
-                        files = [line.split('- ')[1].strip() for line in lines[2:]]
-                    elif "Rate ==" in section:
-                        rate_info = {
-                            "law": getattr(km,lines[1].split(": ")[1]),
-                            "experimental_parameters": lines[2].split(": ")[1],
-                            "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
-                        }
-                    elif "Vitrification ==" in section:
-                        vitrification_info = {
-                            "law": getattr(km,lines[1].split(": ")[1]),
-                            "experimental_parameters": lines[2].split(": ")[1],
-                            "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
-                        }
-                    elif "Coupling ==" in section:
-                        coupling_info = {
-                            "law": getattr(km,lines[1].split(": ")[1]),
-                            "experimental_parameters": lines[2].split(": ")[1],
-                            "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
-                        }
-                    elif "Tg ==" in section:
-                        tg_info = {
-                            "law": getattr(km,lines[1].split(": ")[1]),
-                            "experimental_parameters": lines[2].split(": ")[1],
-                            "parameters": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
-                        }
-
-                    elif "Results ==" in section:
-                        if 'None' not in rate_info["initial_guess"]:
-                            start_rate_index = lines.index("Rate optimization results:")+1
-                            end_rate_index = start_rate_index + len(rate_info["initial_guess"])
-                            rate_args = [float(line.split(": ")[1]) for line in lines[start_rate_index:end_rate_index]]
-                        else:
-                            rate_args = ()
-                        if 'None' not in vitrification_info["initial_guess"]:
-                            start_vitrification_index = lines.index("Vitrification optimization results:")+1
-                            end_vitrification_index = start_vitrification_index + len(vitrification_info["initial_guess"])
-                            vitrification_args = [float(line.split(": ")[1]) for line in lines[start_vitrification_index:end_vitrification_index]]
-                        else:
-                            vitrification_args = ()
-                        if 'None' not in coupling_info["initial_guess"]:
-                            start_coupling_index = lines.index("Coupling optimization results:")+1
-                            end_coupling_index = start_coupling_index + len(coupling_info["initial_guess"])
-                            coupling_args = [float(line.split(": ")[1]) for line in lines[start_coupling_index:end_coupling_index]]
-                        else:
-                            coupling_args = ()
-                        if 'None' not in tg_info["parameters"]:
-                            tg_args = [float(value) for value in tg_info["parameters"].values()]
-                        else:
-                            tg_args = ()
-                            
-                       
-                    elif "Data used for optimization ==" in section:
-                        data_lines = [line.split("\t") for line in lines[1:] if line]
-                        data = np.array(data_lines[1:],dtype=float)
-                        
-                        # Determine the indices of columns to select
-                        total_number_of_columns = data.shape[1]
-                        
-                        time_indices = np.arange(0, total_number_of_columns, step=4)
-                        results_experimental_times = data[:,time_indices]
-                        
-                        temperature_indices = np.arange(1, total_number_of_columns, step=4)
-                        results_experimental_temperatures = data[:,temperature_indices]
-                        
-                        rate_indices = np.arange(2, total_number_of_columns, step=4)
-                        results_experimental_rates = data[:,rate_indices]
-                        
-                        extent_indices = np.arange(3, total_number_of_columns, step=4)
-                        results_experimental_extents = data[:,extent_indices]
+            # Read only the sections before the data, then the first page of the rest of the file
+            result_summary_info, data_offset = results_storage.read_summary_header(self.selected_result_file)
+            self.ui.textEdit_result_file_content.setPlainText(result_summary_info)
+            self.result_file_next_offset = data_offset
+            self.display_next_page_of_result_file()
+            
+            # Define variables to store the extracted information
+            files = []
+            rate_info = {}
+            vitrification_info = {}
+            coupling_info = {}
+            tg_info = {}
+            
+            # Split the summary info by sections
+            sections = result_summary_info.split('================ ')
+            
+            rate_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}}   
+            vitrification_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}} 
+            coupling_info = {"law": None,"experimental_parameters": None,"initial_guess": {'None':'None'}} 
+            tg_info = {"law": None,"experimental_parameters": None,"parameters": {'None':'None'}} 
+            
+            # Iterate over sections to extract information
+            for section in sections:
+                lines = section.strip().split('\n')
+                if "Files ==" in section:
+                    files = [line.split('- ')[1].strip() for line in lines[2:]]
+                elif "Rate ==" in section:
+                    rate_info = {
+                        "law": getattr(km,lines[1].split(": ")[1]),
+                        "experimental_parameters": lines[2].split(": ")[1],
+                        "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
+                    }
+                elif "Vitrification ==" in section:
+                    vitrification_info = {
+                        "law": getattr(km,lines[1].split(": ")[1]),
+                        "experimental_parameters": lines[2].split(": ")[1],
+                        "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
+                    }
+                elif "Coupling ==" in section:
+                    coupling_info = {
+                        "law": getattr(km,lines[1].split(": ")[1]),
+                        "experimental_parameters": lines[2].split(": ")[1],
+                        "initial_guess": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
+                    }
+                elif "Tg ==" in section:
+                    tg_info = {
+                        "law": getattr(km,lines[1].split(": ")[1]),
+                        "experimental_parameters": lines[2].split(": ")[1],
+                        "parameters": {line.split(": ")[0].strip('- '): line.split(": ")[1] for line in lines[4:]}
+                    }
+
+                elif "Results ==" in section:
+                    if 'None' not in rate_info["initial_guess"]:
+                        start_rate_index = lines.index("Rate optimization results:")+1
+                        end_rate_index = start_rate_index + len(rate_info["initial_guess"])
+                        rate_args = [float(line.split(": ")[1]) for line in lines[start_rate_index:end_rate_index]]
+                    else:
+                        rate_args = ()
+                    if 'None' not in vitrification_info["initial_guess"]:
+                        start_vitrification_index = lines.index("Vitrification optimization results:")+1
+                        end_vitrification_index = start_vitrification_index + len(vitrification_info["initial_guess"])
+                        vitrification_args = [float(line.split(": ")[1]) for line in lines[start_vitrification_index:end_vitrification_index]]
+                    else:
+                        vitrification_args = ()
+                    if 'None' not in coupling_info["initial_guess"]:
+                        start_coupling_index = lines.index("Coupling optimization results:")+1
+                        end_coupling_index = start_coupling_index + len(coupling_info["initial_guess"])
+                        coupling_args = [float(line.split(": ")[1]) for line in lines[start_coupling_index:end_coupling_index]]
+                    else:
+                        coupling_args = ()
+                    if 'None' not in tg_info["parameters"]:
+                        tg_args = [float(value) for value in tg_info["parameters"].values()]
+                    else:
+                        tg_args = ()
+
+            # Load the data from the binary file, or parse the data rows of older result files at once
+            if data_offset is None:
+                raise ValueError("The result file doesn't contain the data used for optimization.")
+            experiments = results_storage.load_summary_data(self.selected_result_file, data_offset)
+            results_experimental_times = pad_arrays(experiments['time']).T
+            results_experimental_temperatures = pad_arrays(experiments['temperature']).T
+            results_experimental_rates = pad_arrays(experiments['rate']).T
+            results_experimental_extents = pad_arrays(experiments['extent']).T
                                 
             # Clear axes in the visualization widget
             self.ax_results_viewer_rate.clear()
@@ -2072,15 +2665,15 @@ class MainWindow(QMainWindow):
                                                             coupling_law_args=coupling_args,
                                                             initial_extent=results_experimental_extents[i][0])
                 
-                curve1 = self.ax_results_viewer_rate.plot(results_experimental_times[:,i],results_experimental_rates[:,i],label=f'Experimental {files[i]}')
-                self.ax_results_viewer_extent.plot(results_experimental_times[:,i],results_experimental_extents[:,i],label=f'Experimental {files[i]}')
-                self.ax_results_viewer_temperature.plot(results_experimental_times[:,i],results_experimental_temperatures[:,i],label=f'Experimental {files[i]}')
+                curve1 = self.level_of_detail_results_viewer_rate.plot(results_experimental_times[:,i],results_experimental_rates[:,i],label=f'Experimental {files[i]}')
+                self.level_of_detail_results_viewer_extent.plot(results_experimental_times[:,i],results_experimental_extents[:,i],label=f'Experimental {files[i]}')
+                self.level_of_detail_results_viewer_temperature.plot(results_experimental_times[:,i],results_experimental_temperatures[:,i],label=f'Experimental {files[i]}')
                 
-                color_of_first_curve = curve1[0].get_color()
+                color_of_first_curve = curve1.get_color()
                 
-                self.ax_results_viewer_rate.plot(results_experimental_times[:,i],rate,label=f'Model {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
-                self.ax_results_viewer_extent.plot(results_experimental_times[:,i],extent,label=f'Model {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
-                self.ax_results_viewer_temperature.plot(results_experimental_times[:,i],results_experimental_temperatures[:,i],label=f'Experimental {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
+                self.level_of_detail_results_viewer_rate.plot(results_experimental_times[:,i],rate,label=f'Model {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
+                self.level_of_detail_results_viewer_extent.plot(results_experimental_times[:,i],extent,label=f'Model {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
+                self.level_of_detail_results_viewer_temperature.plot(results_experimental_times[:,i],results_experimental_temperatures[:,i],label=f'Experimental {files[i]}', linestyle='dashed', color=color_of_first_curve, linewidth=2)
                 
                 
             self.ax_results_viewer_rate.legend()
@@ -2116,6 +2709,30 @@ class MainWindow(QMainWindow):
                 self, "Error", f"An error occurred: {str(e)}")
             traceback.print_exc()
             
+    def display_next_page_of_result_file(self, value=None):
+        """
+        Append the next page of the selected result file to its text when the end of the text is reached.
+        
+        Parameters
+        ----------
+        value : int, optional
+            Position of the scroll bar. Default is None (append the page without checking the position).
+        
+        Returns
+        -------
+        None
+        """
+        if self.result_file_next_offset is None:
+            return
+        scroll_bar = self.ui.textEdit_result_file_content.verticalScrollBar()
+        if value is not None and value < scroll_bar.maximum():
+            return
+        page, self.result_file_next_offset = results_storage.read_summary_lines(self.selected_result_file, self.result_file_next_offset)
+        # Insert at the end of the document without moving the view
+        cursor = QTextCursor(self.ui.textEdit_result_file_content.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(page)
+        
     def clear_results_viewer_plots(self):
         self.ax_results_viewer_rate.clear()
         self.ax_results_viewer_extent.clear()
@@ -2137,11 +2754,12 @@ class MainWindow(QMainWindow):
         
         
 class OptimizationThread(QThread):
-    end_of_optimization = pyqtSignal(scipy.optimize.OptimizeResult,float)
+    end_of_optimization = pyqtSignal(object,float,np.ndarray)
     update_progress_bar_signal = pyqtSignal(int)
     update_graph_signal = pyqtSignal(int,float,np.ndarray,object,object)
+    update_model_signal = pyqtSignal(int,np.ndarray)
     error_in_optimization_thread = pyqtSignal(Exception)
-    def __init__(self, cost_function, initial_guess, selected_global_optimization, global_optimization, global_optimization_args_dict, selected_local_optimization, local_optimization, local_optimization_args_dict, experimental_rate, rate_law, experimental_args_for_rate, number_of_parameters_to_optimize_for_rate, vitrification_law, experimental_args_for_vitrification, number_of_parameters_to_optimize_for_vitrification, coupling_law, experimental_args_for_coupling, tg_law, experimental_args_for_tg, tg_args, cost_function_args,experimental_args_for_cost_function, max_iter):
+    def __init__(self, cost_function, initial_guess, selected_global_optimization, global_optimization, global_optimization_args_dict, selected_local_optimization, local_optimization, local_optimization_args_dict, experimental_rate, rate_law, experimental_args_for_rate, number_of_parameters_to_optimize_for_rate, vitrification_law, experimental_args_for_vitrification, number_of_parameters_to_optimize_for_vitrification, coupling_law, experimental_args_for_coupling, tg_law, experimental_args_for_tg, tg_args, cost_function_args,experimental_args_for_cost_function, max_iter, optimization_checkpoint=None, model_update_interval=0.2, history_path=None, optimization_trace=None):
         super().__init__()
         self.cost_function = cost_function
         self.initial_guess = initial_guess
@@ -2166,6 +2784,12 @@ class OptimizationThread(QThread):
         self.cost_function_args = cost_function_args
         self.experimental_args_for_cost_function = experimental_args_for_cost_function
         self.max_iter = max_iter
+        self.optimization_checkpoint = optimization_checkpoint
+        self.model_update_interval = model_update_interval
+        self.history_path = history_path
+        self.optimization_trace = optimization_trace
+        self.history_file = None
+        self.cancel_event = optimization_worker.get_context().Event()
         self.start_time = None
         self.next_iteration_for_GUI_updtate = 1 
         self.time_between_GUI_update = 1 # in seconds
@@ -2174,121 +2798,123 @@ class OptimizationThread(QThread):
         
     def run(self):
         try:
-            if self.selected_global_optimization != '':
-                    self.global_optimization_args_dict['callback'] = self.optimization_callback   
-            if self.selected_local_optimization != '':        
-                    if self.global_optimization == None:
-                        self.local_optimization_args_dict['callback'] = self.optimization_callback
-                        
             # Initialize a self.count variable that will be used to display a progress bar
             self.count = 0
+            if self.optimization_checkpoint is not None and self.optimization_checkpoint.resume_state is not None:
+                self.count = self.optimization_checkpoint.resume_state['nit']
             
             # Initialize a self.count
             self.start_time = time_module.time()
             
-            if self.selected_global_optimization == 'basinhopping':
-                if self.selected_local_optimization == '':
-                    # If no local minimization method is selected the default local minimization is used
-                    # However, the arguments for local minimization still need to be given, hence the creation of the args dict
-                    self.local_optimization_args_dict = {}
-                self.local_optimization_args_dict['args'] = (self.experimental_rate,
-                                                            self.rate_law,
-                                                            self.experimental_args_for_rate,
-                                                            self.number_of_parameters_to_optimize_for_rate,
-                                                            self.vitrification_law,
-                                                            self.experimental_args_for_vitrification,
-                                                            self.number_of_parameters_to_optimize_for_vitrification,
-                                                            self.coupling_law,
-                                                            self.experimental_args_for_coupling,
-                                                            self.tg_law,
-                                                            self.experimental_args_for_tg,
-                                                            self.tg_args,
-                                                            *self.experimental_args_for_cost_function,
-                                                            *self.cost_function_args)
-                self.global_optimization_args_dict['minimizer_kwargs'] = self.local_optimization_args_dict
-                self.result = self.global_optimization(self.cost_function,
-                                                    self.initial_guess,
-                                                    **self.global_optimization_args_dict)
+            args = pipeline.get_cost_function_args(self.experimental_rate,
+                                                   self.rate_law,
+                                                   self.experimental_args_for_rate,
+                                                   self.number_of_parameters_to_optimize_for_rate,
+                                                   self.vitrification_law,
+                                                   self.experimental_args_for_vitrification,
+                                                   self.number_of_parameters_to_optimize_for_vitrification,
+                                                   self.coupling_law,
+                                                   self.experimental_args_for_coupling,
+                                                   self.tg_law,
+                                                   self.experimental_args_for_tg,
+                                                   self.tg_args,
+                                                   self.experimental_args_for_cost_function,
+                                                   self.cost_function_args)
+            # Arguments of opt.model(), used by the process to send the rate of the model with its progress
+            model_args = (self.rate_law,
+                          self.experimental_args_for_rate,
+                          self.number_of_parameters_to_optimize_for_rate,
+                          self.vitrification_law,
+                          self.experimental_args_for_vitrification,
+                          self.number_of_parameters_to_optimize_for_vitrification,
+                          self.coupling_law,
+                          self.experimental_args_for_coupling,
+                          self.tg_law,
+                          self.experimental_args_for_tg,
+                          self.tg_args)
+            # The optimization runs in a separate process so that it doesn't share the GIL with the GUI
+            # This thread only relays the messages of the process to the GUI
+            self.worker = optimization_worker.OptimizationWorker({"cost_function": self.cost_function,
+                                                                  "initial_guess": self.initial_guess,
+                                                                  "selected_global_optimization": self.selected_global_optimization,
+                                                                  "global_optimization_args_dict": self.global_optimization_args_dict,
+                                                                  "selected_local_optimization": self.selected_local_optimization,
+                                                                  "local_optimization_args_dict": self.local_optimization_args_dict,
+                                                                  "args": args,
+                                                                  "optimization_checkpoint": self.optimization_checkpoint,
+                                                                  "optimization_trace": self.optimization_trace},
+                                                                 self.cancel_event,
+                                                                 model_args,
+                                                                 self.model_update_interval)
+            if self.history_path is not None:
+                self.history_file = open(self.history_path, 'w')
+            self.worker.start()
+            while True:
+                message = self.worker.get_message()
+                if message is None:
+                    continue
+                if message[0] == "callback":
+                    _, xk, callback_args, callback_kwargs, model_rate = message
+                    self.optimization_callback(xk, *callback_args, **callback_kwargs)
+                    if model_rate is not None:
+                        self.update_model_signal.emit(self.count, model_rate)
+                elif message[0] == "result":
+                    _, self.result, total_optimization_time, model_rate = message
+                    break
+                else:
+                    raise RuntimeError(f"Error in the optimization process:\n{message[1]}")
+            self.worker.join()
+            # The best minimum found before resuming from a checkpoint is kept
+            if self.selected_global_optimization == 'basinhopping' and self.fmin_bashinhopping is not None and self.fmin_bashinhopping <= self.result.fun:
                 self.result.x = self.xmin_bashinhopping
                 self.result.fun = self.fmin_bashinhopping
+                model_rate = optimization_worker.compute_model_rate(self.result.x, model_args)
             
-            elif self.selected_global_optimization == 'differential_evolution':
-                self.global_optimization_args_dict['args'] = (self.experimental_rate,
-                                                            self.rate_law,
-                                                            self.experimental_args_for_rate,
-                                                            self.number_of_parameters_to_optimize_for_rate,
-                                                            self.vitrification_law,
-                                                            self.experimental_args_for_vitrification,
-                                                            self.number_of_parameters_to_optimize_for_vitrification,
-                                                            self.coupling_law,
-                                                            self.experimental_args_for_coupling,
-                                                            self.tg_law,
-                                                            self.experimental_args_for_tg,
-                                                            self.tg_args,
-                                                            *self.experimental_args_for_cost_function,
-                                                            *self.cost_function_args)
-                self.bounds = self.global_optimization_args_dict['bounds']
-                self.global_optimization_args_dict.pop('bounds')
-                self.result = self.global_optimization(self.cost_function,
-                                                    self.bounds,
-                                                    **self.global_optimization_args_dict)
-                
-            elif self.selected_global_optimization == 'shgo':                
-                self.global_optimization_args_dict['args'] = (self.experimental_rate,
-                                                            self.rate_law,
-                                                            self.experimental_args_for_rate,
-                                                            self.number_of_parameters_to_optimize_for_rate,
-                                                            self.vitrification_law,
-                                                            self.experimental_args_for_vitrification,
-                                                            self.number_of_parameters_to_optimize_for_vitrification,
-                                                            self.coupling_law,
-                                                            self.experimental_args_for_coupling,
-                                                            self.tg_law,
-                                                            self.experimental_args_for_tg,
-                                                            self.tg_args,
-                                                            *self.experimental_args_for_cost_function,
-                                                            *self.cost_function_args)
-                
-                
-                
-                self.global_optimization_args_dict['minimizer_kwargs'] = self.local_optimization_args_dict
-                
-                self.bounds = self.global_optimization_args_dict['bounds']
-                self.global_optimization_args_dict.pop('bounds')                    
-                self.result = self.global_optimization(self.cost_function,
-                                                    self.bounds,
-                                                    **self.global_optimization_args_dict)
-            elif self.selected_global_optimization == '':
-                self.local_optimization_args_dict['args'] = (self.experimental_rate,
-                                                            self.rate_law,
-                                                            self.experimental_args_for_rate,
-                                                            self.number_of_parameters_to_optimize_for_rate,
-                                                            self.vitrification_law,
-                                                            self.experimental_args_for_vitrification,
-                                                            self.number_of_parameters_to_optimize_for_vitrification,
-                                                            self.coupling_law,
-                                                            self.experimental_args_for_coupling,
-                                                            self.tg_law,
-                                                            self.experimental_args_for_tg,
-                                                            self.tg_args,
-                                                            *self.experimental_args_for_cost_function,
-                                                            *self.cost_function_args)
-                self.result = self.local_optimization(self.cost_function,
-                                                    self.initial_guess,
-                                                    **self.local_optimization_args_dict)
-            
-            total_optimization_time = elapsed_time = time_module.time() - self.start_time
-            self.end_of_optimization.emit(self.result,total_optimization_time)
+            self.end_of_optimization.emit(self.result,total_optimization_time,model_rate)
             
         except Exception as e:
             # Handle other exceptions with a generic error message
             traceback.print_exc()
             self.error_in_optimization_thread.emit(e)
             return
+        finally:
+            if self.history_file is not None:
+                self.history_file.close()
+                self.history_file = None
            
             
+    def request_cancellation(self):
+        """
+        Request the optimization to stop at the next evaluation of the cost function.
+
+        The thread then emits the best result found so far with the end_of_optimization signal.
+        """
+        self.cancel_event.set()
+        
+    def write_iteration_to_history(self, xk, args, kwargs):
+        """
+        Write one line of JSON describing the iteration in the history file.
+
+        Parameters
+        ----------
+        xk : numpy.ndarray
+            Parameters at the end of the iteration.
+        args : tuple or None
+            Additional arguments of the callback.
+        kwargs : dict
+            Additional keyword arguments of the callback.
+        """
+        if self.history_file is None:
+            return
+        iteration = {"iteration": self.count,
+                     "time": time_module.time() - self.start_time,
+                     "x": xk,
+                     "args": args,
+                     "kwargs": kwargs}
+        # Arrays and numpy scalars are written as lists and numbers, other objects as text
+        self.history_file.write(json.dumps(iteration, default=lambda value: value.tolist() if hasattr(value, 'tolist') else str(value)) + '\n')
+        
     def optimization_callback(self, xk, *args,**kwargs):
-        print(self.count)
         self.count = self.count + 1
         progress = (self.count / self.max_iter) * 100
         self.update_progress_bar_signal.emit(int(progress))
@@ -2310,6 +2936,8 @@ class OptimizationThread(QThread):
         if self.selected_global_optimization == 'differential_evolution':
             kwargs["convergence"] = args
             args = None
+        
+        self.write_iteration_to_history(xk, args, kwargs)
             
         if self.count == self.next_iteration_for_GUI_updtate:
             elapsed_time = time_module.time() - self.start_time
@@ -2322,9 +2950,6 @@ class OptimizationThread(QThread):
             estimated_remaining_time = time_per_iteration * (self.max_iter-self.count)
             
             self.update_graph_signal.emit(self.count,estimated_remaining_time,xk,args,kwargs)
-            
-            print(self.next_iteration_for_GUI_updtate)
-            print(estimated_remaining_time)
         
         
         
@@ -2334,7 +2959,7 @@ class OptimizationThread(QThread):
         
         
         
-def launch_extraction(file_paths, delimiter=',', has_header=False, skip_lines=0):
+def launch_extraction(file_paths, delimiter=',', has_header=False, skip_lines=0, use_memmap=False):
     """
     Launch the data extraction process and processes warning and info messages.
     
@@ -2348,55 +2973,60 @@ def launch_extraction(file_paths, delimiter=',', has_header=False, skip_lines=0)
         Whether the input files have headers. Default is False.
     skip_lines : int, optional
         Number of lines to skip at the beginning of each file. Default is 0.
+    use_memmap : bool, optional
+        Whether to return memory-mapped arrays instead of loading the data in memory. Default is False.
     
     Returns
     -------
     tuple
         A tuple containing:
             - boolean: Indicates whether the extraction was successful (True) or not (False).
-            - str: String containing any warning or info messages.
+            - str: String containing any error, warning or info messages.
             - numpy.ndarray: Time data.
             - numpy.ndarray: Temperature data.
             - numpy.ndarray: Rate of reaction data.
             - numpy.ndarray: Extent of reaction data.
     """
-    # Capture standard output to capture warning and info messages
-    from io import StringIO
-    import sys
-
-    old_stdout = sys.stdout
-    new_stdout = StringIO()
-    sys.stdout = new_stdout
-
-    # Call the extract_dsc_data_multiple_files function
-    time, temperature, rate_of_reaction, extent_of_reaction = data_extraction.extract_dsc_data_multiple_files(
-        file_paths, delimiter, has_header, skip_lines)
-
-    # Restore standard output
-    sys.stdout = old_stdout
-
-    # Get the captured output
-    captured_output = new_stdout.getvalue()
+    # Files are read and validated concurrently, each file returning its own validation report
+    time, temperature, rate_of_reaction, extent_of_reaction, reports = data_extraction.extract_dsc_data_multiple_files(
+        file_paths, delimiter, has_header, skip_lines, use_memmap, return_reports=True, workers=min(len(file_paths), os.cpu_count() or 1))
 
-    # Check for warnings or info messages
-    if "Error" in captured_output:
-        return False, captured_output, time, temperature, rate_of_reaction, extent_of_reaction
-    elif "Info" in captured_output:
-        return True, captured_output, time, temperature, rate_of_reaction, extent_of_reaction
-    else:
-        return True, "", time, temperature, rate_of_reaction, extent_of_reaction
+    message = "\n".join(report.to_text() for report in reports if report.to_text())
+    successful_extraction = all(report.is_valid for report in reports)
+    
+    return successful_extraction, message, time, temperature, rate_of_reaction, extent_of_reaction
     
 # =============================================================================
 # Function for isoconversional analysis parameters
 # =============================================================================
 
+def get_names_of_functions(module_name):
+    """
+    Get the names of the functions defined in a module of KinOpt, without importing it.
+    
+    Parameters
+    ----------
+    module_name : str
+        Name of the module, in the folder of this script.
+    
+    Returns
+    -------
+    list
+        Sorted names of the functions defined at the top level of the module.
+    """
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{module_name}.py")
+    with open(module_path, 'r', encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    return sorted(node.name for node in tree.body if isinstance(node, ast.FunctionDef))
+
+
 def get_functions_for_isoconversional_method():
     # Get the isoconversional analysis methods from the isoconversional method module
+    # The names are read from the source, so that the module (and SciPy) is only imported when a method is run
     isoconversional_methods = []
-    for element in dir(icm):
-        if callable(getattr(icm, element)):
-            if element[:24] == "isoconversional_analysis":
-                isoconversional_methods.append(element)
+    for element in get_names_of_functions("isoconversional_methods"):
+        if element[:24] == "isoconversional_analysis":
+            isoconversional_methods.append(element)
     return isoconversional_methods
 
 
@@ -2745,6 +3375,30 @@ def pad_arrays(array_list, fill_value=np.nan):
 #
 # =============================================================================
 
+def report_startup_time(main_window):
+    """
+    Print the startup times of the interface and append them to 'startup_times.jsonl' in the results folder.
+    
+    Parameters
+    ----------
+    main_window : MainWindow
+        The window, after its canvases are created.
+    
+    Returns
+    -------
+    None
+    """
+    startup_times = {"date": datetime.datetime.now().isoformat(timespec='seconds'),
+                     "time_to_first_window": main_window.time_to_first_window,
+                     "time_to_interactive_window": main_window.time_to_interactive_window}
+    print(f"Time to first window: {startup_times['time_to_first_window']:.3f} s")
+    print(f"Time to interactive window (canvases created): {startup_times['time_to_interactive_window']:.3f} s")
+    results_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "results")
+    os.makedirs(results_dir, exist_ok=True)
+    with open(os.path.join(results_dir, "startup_times.jsonl"), 'a') as file:
+        file.write(json.dumps(startup_times) + '\n')
+
+
 if __name__ == '__main__':
     # Check if QApplication instance already exists
     if not QApplication.instance():
@@ -2754,5 +3408,11 @@ if __name__ == '__main__':
 
     mainWindow = MainWindow()
     mainWindow.show()
+    if "--benchmark-startup" in sys.argv:
+        # The timer runs after the creation of the canvases, which was scheduled first
+        def end_benchmark():
+            report_startup_time(mainWindow)
+            app.quit()
+        QTimer.singleShot(0, end_benchmark)
     sys.exit(app.exec_())
 
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+The optimization_trace module allows to record the progress of an optimization at each iteration.
+
+For each call of the callback of the optimization, the trace records:
+
+* 'iteration': number of the iteration
+* 'time': wall time since the start of the optimization, in seconds
+* 'number_of_evaluations': number of evaluations of the cost function so far
+* 'best_fun': lowest cost evaluated so far
+* 'x': parameters sent to the callback
+* 'best_x': parameters of the lowest cost evaluated so far
+
+The values are appended to growing arrays (one per column), so that recording an iteration costs
+a few assignments. The arrays are written periodically in a .npz file, which can be loaded with
+load_trace to study the convergence or to compare optimization methods across runs (see summarize_trace).
+
+.. note::
+    When differential evolution evaluates the cost function in a pool of processes ('workers' > 1),
+    the evaluations aren't seen by the trace: 'number_of_evaluations' stays at 0 and 'best_fun' and 'best_x' are NaN.
+"""
+
+import time as time_module
+import numpy as np
+
+import results_storage
+
+
+class ColumnarBuffer:
+    """
+    Append-only buffer storing each column in a numpy array whose capacity doubles when it's full.
+
+    Attributes
+    ----------
+    columns : dict
+        Array of each column, by name. Only the first 'length' rows are filled.
+    length : int
+        Number of rows appended.
+    """
+    def __init__(self, column_shapes, dtypes=None, capacity=256):
+        dtypes = dtypes or {}
+        self.columns = {name: np.full((capacity, *shape), np.nan if np.dtype(dtypes.get(name, float)).kind == 'f' else 0,
+                                      dtype=dtypes.get(name, float))
+                        for name, shape in column_shapes.items()}
+        self.length = 0
+
+    def append(self, **values):
+        """
+        Append a row.
+
+        Parameters
+        ----------
+        **values
+            Value of each column. Missing columns keep their default value (NaN or 0).
+        """
+        capacity = len(next(iter(self.columns.values())))
+        if self.length == capacity:
+            for name, column in self.columns.items():
+                new_column = np.full((2 * capacity, *column.shape[1:]), np.nan if column.dtype.kind == 'f' else 0, dtype=column.dtype)
+                new_column[:capacity] = column
+                self.columns[name] = new_column
+        for name, value in values.items():
+            if value is not None:
+                self.columns[name][self.length] = value
+        self.length += 1
+
+    def to_arrays(self):
+        """
+        Get the filled rows of each column.
+
+        Returns
+        -------
+        dict
+            Array of each column, by name.
+        """
+        return {name: column[:self.length] for name, column in self.columns.items()}
+
+
+class OptimizationTrace:
+    """
+    Record the progress of an optimization through its callback and save it periodically.
+
+    Attributes
+    ----------
+    trace_path : str or None
+        Path of the .npz file, None to keep the trace in memory only.
+    flush_interval : float
+        Minimum time between two saves, in seconds.
+    parameter_names : list or None
+        Names of the parameters, saved with the trace.
+    buffer : ColumnarBuffer or None
+        Columns of the trace, created when the optimization starts.
+    """
+    def __init__(self, trace_path=None, flush_interval=30, parameter_names=None, method=''):
+        self.trace_path = trace_path
+        self.flush_interval = flush_interval
+        self.parameter_names = list(parameter_names) if parameter_names is not None else None
+        self.method = method
+        self.buffer = None
+        self.start_time = None
+        self.last_save_time = None
+
+    def start(self, number_of_parameters):
+        """
+        Create the columns of the trace and start the clock.
+
+        Parameters
+        ----------
+        number_of_parameters : int
+            Number of parameters to optimize.
+        """
+        self.buffer = ColumnarBuffer({"iteration": (), "time": (), "number_of_evaluations": (), "best_fun": (),
+                                      "x": (number_of_parameters,), "best_x": (number_of_parameters,)},
+                                     dtypes={"iteration": np.int64, "number_of_evaluations": np.int64})
+        self.start_time = time_module.time()
+        self.last_save_time = self.start_time
+
+    def record(self, x, traced_cost_function=None):
+        """
+        Record an iteration and save the trace if the interval has elapsed.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Parameters sent to the callback.
+        traced_cost_function : pipeline.CancellableCostFunction, optional
+            Cost function counting its evaluations and keeping the best point evaluated. Default is None.
+        """
+        number_of_evaluations, best_fun, best_x = 0, None, None
+        if traced_cost_function is not None:
+            number_of_evaluations = traced_cost_function.number_of_evaluations
+            if traced_cost_function.best_x is not None:
+                best_fun, best_x = traced_cost_function.best_fun, traced_cost_function.best_x
+        current_time = time_module.time()
+        self.buffer.append(iteration=self.buffer.length + 1, time=current_time - self.start_time,
+                           number_of_evaluations=number_of_evaluations, best_fun=best_fun, x=x, best_x=best_x)
+        if self.trace_path is not None and current_time - self.last_save_time >= self.flush_interval:
+            self.save()
+
+    def wrap_callback(self, callback=None, traced_cost_function=None):
+        """
+        Create a callback recording the iterations.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Callback called after the iteration is recorded, with the same arguments. Default is None.
+        traced_cost_function : pipeline.CancellableCostFunction, optional
+            Cost function counting its evaluations, see record. Default is None.
+
+        Returns
+        -------
+        callable
+            Callback to give to the optimization.
+        """
+        def trace_callback(xk, *args, **kwargs):
+            self.record(xk, traced_cost_function)
+            if callback is not None:
+                return callback(xk, *args, **kwargs)
+        return trace_callback
+
+    def get_arrays(self):
+        """
+        Get the columns of the trace.
+
+        Returns
+        -------
+        dict
+            Array of each column, by name.
+        """
+        return self.buffer.to_arrays() if self.buffer is not None else {}
+
+    def save(self):
+        """Save the trace in its .npz file (see results_storage.open_atomically)."""
+        if self.trace_path is None or self.buffer is None:
+            return
+        with results_storage.open_atomically(self.trace_path, 'wb') as file:
+            np.savez(file, method=np.array(self.method), parameter_names=np.array(self.parameter_names or [], dtype=str), **self.get_arrays())
+        self.last_save_time = time_module.time()
+
+
+def load_trace(trace_path):
+    """
+    Load a trace saved by OptimizationTrace.
+
+    Parameters
+    ----------
+    trace_path : str
+        Path of the .npz file.
+
+    Returns
+    -------
+    dict
+        Array of each column, with the 'method' and the 'parameter_names' of the optimization.
+    """
+    with np.load(trace_path) as file:
+        trace = {key: file[key] for key in file.files}
+    trace['method'] = str(trace['method'])
+    trace['parameter_names'] = trace['parameter_names'].tolist()
+    return trace
+
+
+def summarize_trace(trace, relative_tolerance=1e-3):
+    """
+    Summarize the convergence of an optimization, e.g. to compare methods.
+
+    Parameters
+    ----------
+    trace : dict
+        Trace, see load_trace.
+    relative_tolerance : float, optional
+        Relative distance to the final best cost under which the optimization is considered converged. Default is 1e-3.
+
+    Returns
+    -------
+    dict
+        Method, number of iterations and evaluations, total time, final best cost, and the time, iteration
+        and number of evaluations at which the best cost came within the tolerance of its final value.
+    """
+    best_fun = trace['best_fun']
+    summary = {"method": trace.get('method', ''),
+               "number_of_iterations": int(len(trace['iteration'])),
+               "number_of_evaluations": int(trace['number_of_evaluations'][-1]) if len(best_fun) else 0,
+               "total_time": float(trace['time'][-1]) if len(best_fun) else 0.0,
+               "best_fun": float(best_fun[-1]) if len(best_fun) else np.nan,
+               "time_to_converge": np.nan, "iterations_to_converge": None, "evaluations_to_converge": None}
+    if len(best_fun) and np.isfinite(best_fun[-1]):
+        is_converged = best_fun <= best_fun[-1] + relative_tolerance * abs(best_fun[-1])
+        first_index = int(np.argmax(is_converged))
+        summary.update({"time_to_converge": float(trace['time'][first_index]),
+                        "iterations_to_converge": int(trace['iteration'][first_index]),
+                        "evaluations_to_converge": int(trace['number_of_evaluations'][first_index])})
+    return summary
+
+
+if __name__ == "__main__":
+    print("You've run the optimization_trace module.")
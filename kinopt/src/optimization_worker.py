@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+The optimization_worker module allows to run an optimization in a separate process.
+
+In the graphical interface, the optimization used to run in a thread of the process of the interface:
+the pure Python parts of the cost functions hold the GIL, which makes the interface stutter and slows
+down the optimization. The worker process has its own interpreter and a full core, and sends the
+arguments of each call of the callback, then the result, through a queue. The rate computed by the model
+for the parameters sent is also computed by the worker, so that the interface only has to render it.
+
+Messages sent by the worker:
+
+* ("callback", xk, args, kwargs, model_rate): arguments of a call of the callback of the optimization, and rate of
+  the model for xk (None if the model isn't requested, or was computed less than model_update_interval seconds before)
+* ("result", result, total_optimization_time, model_rate): scipy.optimize.OptimizeResult at the end of the optimization,
+  and rate of the model for result.x (None if the model isn't requested)
+* ("error", message): traceback of an error raised in the worker
+
+.. note::
+    The process is started with the 'spawn' method, which is safe with the threads of Qt and works on all platforms.
+    The cost function, the laws and the experimental data are sent to the process once, when it starts.
+"""
+
+import pickle
+import queue
+import traceback
+import time as time_module
+import multiprocessing
+import numpy as np
+import scipy.optimize
+
+import optimization as opt
+import pipeline
+
+
+def get_context():
+    """
+    Get the multiprocessing context used by the worker.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        Context using the 'spawn' start method.
+    """
+    return multiprocessing.get_context('spawn')
+
+
+def make_picklable_result(result):
+    """
+    Keep only the picklable entries of the result of an optimization.
+
+    Parameters
+    ----------
+    result : scipy.optimize.OptimizeResult
+        Result of the optimization.
+
+    Returns
+    -------
+    scipy.optimize.OptimizeResult
+        Result that can be sent to another process.
+    """
+    picklable_result = scipy.optimize.OptimizeResult()
+    for key, value in result.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        picklable_result[key] = value
+    return picklable_result
+
+
+def compute_model_rate(x, model_args):
+    """
+    Compute the rate of the model for the given parameters.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Parameters of the model.
+    model_args : tuple or None
+        Arguments of optimization.model() after the parameters.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        Rate of the model for all the experiments, or None if model_args is None.
+    """
+    if model_args is None:
+        return None
+    return np.asarray(opt.model(x, *model_args))
+
+
+def run_worker(optimization_kwargs, messages, cancel_event, model_args=None, model_update_interval=0.2):
+    """
+    Run an optimization and send its progress and result. This function is the target of the worker process.
+
+    Parameters
+    ----------
+    optimization_kwargs : dict
+        Arguments of pipeline.run_optimization(), except callback and cancel_event.
+    messages : multiprocessing.Queue
+        Queue where the messages are sent.
+    cancel_event : multiprocessing.Event
+        Flag set by the interface to stop the optimization.
+    model_args : tuple, optional
+        Arguments of optimization.model() after the parameters, used to send the rate of the model. Default is None (no rate sent).
+    model_update_interval : float, optional
+        Minimum time between two computations of the rate of the model during the optimization, in seconds. Default is 0.2.
+    """
+    time_of_last_model_rate = [None]
+
+    def callback(xk, *args, **kwargs):
+        # The rate of the model is only computed as often as the interface can display it
+        model_rate = None
+        current_time = time_module.time()
+        if model_args is not None and (time_of_last_model_rate[0] is None or current_time - time_of_last_model_rate[0] >= model_update_interval):
+            model_rate = compute_model_rate(xk, model_args)
+            time_of_last_model_rate[0] = current_time
+        messages.put(("callback", np.array(xk), args, kwargs, model_rate))
+
+    try:
+        start_time = time_module.time()
+        result = pipeline.run_optimization(**optimization_kwargs, callback=callback, cancel_event=cancel_event)
+        total_optimization_time = time_module.time() - start_time
+        messages.put(("result", make_picklable_result(result), total_optimization_time, compute_model_rate(result.x, model_args)))
+    except Exception:
+        messages.put(("error", traceback.format_exc()))
+
+
+class OptimizationWorker:
+    """
+    Process running an optimization and sending its progress through a queue.
+
+    Attributes
+    ----------
+    messages : multiprocessing.Queue
+        Queue of the messages sent by the process.
+    cancel_event : multiprocessing.Event
+        Flag set to stop the optimization.
+    process : multiprocessing.Process
+        Process running the optimization.
+    """
+    def __init__(self, optimization_kwargs, cancel_event=None, model_args=None, model_update_interval=0.2):
+        context = get_context()
+        self.messages = context.Queue()
+        self.cancel_event = cancel_event if cancel_event is not None else context.Event()
+        self.process = context.Process(target=run_worker,
+                                       args=(optimization_kwargs, self.messages, self.cancel_event, model_args, model_update_interval),
+                                       daemon=True)
+
+    def start(self):
+        """Start the process."""
+        self.process.start()
+
+    def request_cancellation(self):
+        """Request the optimization to stop. The worker then sends the best result found so far."""
+        self.cancel_event.set()
+
+    def get_message(self, timeout=0.1):
+        """
+        Wait for the next message of the process.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time, in seconds. Default is 0.1.
+
+        Returns
+        -------
+        tuple or None
+            Next message, or None if there's no message yet. If the process stopped without
+            sending a result, an error message is returned.
+        """
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            if not self.process.is_alive():
+                # The last messages may arrive after the end of the process
+                try:
+                    return self.messages.get(timeout=timeout)
+                except queue.Empty:
+                    return ("error", f"The optimization process stopped unexpectedly (exit code {self.process.exitcode}).")
+            return None
+
+    def join(self, timeout=None):
+        """
+        Wait for the end of the process.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time, in seconds. Default is None (no limit).
+        """
+        self.process.join(timeout)
+
+
+if __name__ == "__main__":
+    print("You've run the optimization_worker module.")
@@ -0,0 +1,795 @@
+# -*- coding: utf-8 -*-
+"""
+The pipeline module runs the complete analysis without the graphical interface.
+
+The steps are the same as in the graphical interface: extraction of the data (with optional
+decimation and smoothing), interpolation, isoconversional analysis and optimization of a
+kinetic model. Each step is described in a configuration file (JSON, or TOML with Python 3.11 or later)
+and the results are written in a JSON file.
+
+Example of configuration file:
+
+.. code-block:: json
+
+    {
+        "name": "kamal",
+        "data": {
+            "files": ["../data/data_kamal_heating_rate_5C_per_min.txt",
+                      "../data/data_kamal_heating_rate_10C_per_min.txt"],
+            "delimiter": ",",
+            "has_header": true,
+            "decimation": {"number_of_points": 500}
+        },
+        "interpolation": {"method": "linear", "number_of_points": 200},
+        "isoconversional_analysis": {
+            "method": "isoconversional_analysis_friedman_method",
+            "parameters": {"min_conv": 0.1, "max_conv": 0.9, "number_of_points": 50}
+        },
+        "optimization": {
+            "rate": {"law": "rate_for_kamal",
+                     "initial_guess": {"A1": 1e10, "E1": 70000, "A2": 1e13, "E2": 85000, "m": 0.5, "n": 1.5}},
+            "local_optimization": {"method": "Nelder-Mead", "parameters": {"maxiter": 2000}},
+            "cost_function": {"function": "rss_mean"}
+        }
+    }
+
+Relative paths of files are relative to the folder of the configuration file.
+
+.. note::
+    This module doesn't import PyQt5 nor matplotlib, so that it can be used on a server without display.
+"""
+
+import os
+import json
+import datetime
+import time as time_module
+import numpy as np
+import scipy.optimize
+
+import data_extraction
+import decimation
+import smoothing
+import interpolation
+import isoconversional_methods as icm
+import kinetic_models as km
+import optimization as opt
+import checkpoint
+import optimization_trace
+import results_database
+import results_storage
+import warm_start
+
+
+# Arguments of the laws that are given by the experimental data instead of being optimized
+EXPERIMENTAL_PARAMETERS = {'rate': ['T', 'extent', 'Tg', 'optional_parameters'],
+                           'vitrification': ['T', 'extent', 'extent_at_gel', 'Tg', 'optional_parameters'],
+                           'coupling': ['T', 'extent', 'kc', 'kv', 'experimental_parameters', 'extent_at_gel', 'optional_parameters']}
+TG_EXPERIMENTAL_PARAMETERS = ['T', 'extent', 'Tg']
+COST_FUNCTION_EXPERIMENTAL_PARAMETERS = ['T', 'extent', 'Tg']
+ISOCONVERSIONAL_EXPERIMENTAL_PARAMETERS = ["conv_lists", "time_lists", "temperature_lists", "rate_lists"]
+
+# Arguments of the cost functions given by the model itself
+COST_FUNCTION_MODEL_ARGUMENTS = ["x", "experimental_rate", "rate_law", "experimental_args_for_rate",
+                                 "number_of_parameters_to_optimize_for_rate", "vitrification", "vitrification_law",
+                                 "experimental_args_for_vitrification", "number_of_parameters_to_optimize_for_vitrification",
+                                 "coupling_law", "experimental_args_for_coupling", "tg_law", "experimental_args_for_tg",
+                                 "tg_args", "rss_to_use_args"]
+
+# Arguments of scipy.optimize.minimize() that aren't options of the method of minimization
+LOCAL_OPTIMIZATION_MAIN_ARGUMENTS = ["jac", "hess", "hessp", "bounds", "constraints", "tol", "callback"]
+
+
+def load_config(config_path):
+    """
+    Load a configuration file.
+
+    Parameters
+    ----------
+    config_path : str
+        Path of a .json or .toml configuration file.
+
+    Returns
+    -------
+    dict
+        Configuration, with the paths of the data files made absolute.
+
+    Raises
+    ------
+    ValueError
+        If the extension of the file isn't supported.
+    """
+    extension = os.path.splitext(config_path)[1].lower()
+    if extension == '.json':
+        with open(config_path, 'r') as file:
+            config = json.load(file)
+    elif extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML configuration files require Python 3.11 or later, please use a JSON file.")
+        with open(config_path, 'rb') as file:
+            config = tomllib.load(file)
+    else:
+        raise ValueError(f"Unsupported configuration file: {config_path}. Use a .json or .toml file.")
+
+    config_directory = os.path.dirname(os.path.abspath(config_path))
+    config.setdefault('name', os.path.splitext(os.path.basename(config_path))[0])
+    config['data']['files'] = [os.path.join(config_directory, file_path) for file_path in config['data']['files']]
+    return config
+
+
+def get_law_parameters(law, experimental_parameter_values):
+    """
+    Separate the arguments of a law between experimental parameters and parameters to give or optimize.
+
+    Parameters
+    ----------
+    law : callable
+        Function of a law (e.g. from the kinetic_models module).
+    experimental_parameter_values : list
+        Names of the arguments given by the experimental data.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - list: Names of the experimental parameters.
+            - list: Names of the other parameters.
+    """
+    arguments = law.__code__.co_varnames[:law.__code__.co_argcount]
+    experimental_parameters = [argument for argument in arguments
+                               if argument in experimental_parameter_values and argument != "optional_parameters"]
+    other_parameters = [argument for argument in arguments if argument not in experimental_parameter_values]
+    return experimental_parameters, other_parameters
+
+
+def get_cost_function_parameters(cost_function):
+    """
+    Separate the arguments of a cost function, excluding the arguments given by the model.
+
+    Parameters
+    ----------
+    cost_function : callable
+        Cost function of the optimization module.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - list: Names of the experimental parameters.
+            - list: Names of the parameters to give.
+    """
+    arguments = cost_function.__code__.co_varnames[1:cost_function.__code__.co_argcount]
+    arguments = [argument for argument in arguments if argument not in COST_FUNCTION_MODEL_ARGUMENTS]
+    experimental_parameters = [argument for argument in arguments if argument in COST_FUNCTION_EXPERIMENTAL_PARAMETERS]
+    other_parameters = [argument for argument in arguments if argument not in COST_FUNCTION_EXPERIMENTAL_PARAMETERS]
+    return experimental_parameters, other_parameters
+
+
+def get_experimental_args(labels_of_experimental_arguments, data):
+    """
+    Retrieve the experimental data associated with the labels of arguments.
+
+    Parameters
+    ----------
+    labels_of_experimental_arguments : list
+        Labels of the experimental arguments (e.g. 'T', 'extent', 'time_lists').
+    data : dict
+        Experimental data, with the keys 'time', 'T', 'rate' and 'extent' for the concatenated arrays
+        and 'time_lists', 'temperature_lists', 'rate_lists' and 'conv_lists' for the data of each file.
+
+    Returns
+    -------
+    tuple
+        Experimental data in the order of the labels.
+    """
+    return tuple(data[label] for label in labels_of_experimental_arguments if label in data)
+
+
+def split_local_optimization_options(options_dict):
+    """
+    Separate the arguments of scipy.optimize.minimize() from the options of the method of minimization.
+
+    Parameters
+    ----------
+    options_dict : dict
+        Parameters of the method of minimization.
+
+    Returns
+    -------
+    dict
+        Arguments for scipy.optimize.minimize(), with the options of the method under the key 'options'.
+    """
+    main_args_dict = {"jac": None, "hess": None, "hessp": None, "bounds": None, "constraints": (), "tol": None, "callback": None}
+    options_dict = dict(options_dict)
+    for key in LOCAL_OPTIMIZATION_MAIN_ARGUMENTS:
+        if key in options_dict:
+            main_args_dict[key] = options_dict.pop(key)
+    main_args_dict['options'] = options_dict
+    return main_args_dict
+
+
+def get_cost_function_args(experimental_rate, rate_law, experimental_args_for_rate, number_of_parameters_to_optimize_for_rate, vitrification_law, experimental_args_for_vitrification, number_of_parameters_to_optimize_for_vitrification, coupling_law, experimental_args_for_coupling, tg_law, experimental_args_for_tg, tg_args, experimental_args_for_cost_function, cost_function_args):
+    """
+    Gather the arguments passed to the cost function after the parameters to optimize.
+
+    Returns
+    -------
+    tuple
+        Arguments of the cost function, see the cost functions of the optimization module.
+    """
+    return (experimental_rate,
+            rate_law,
+            experimental_args_for_rate,
+            number_of_parameters_to_optimize_for_rate,
+            vitrification_law,
+            experimental_args_for_vitrification,
+            number_of_parameters_to_optimize_for_vitrification,
+            coupling_law,
+            experimental_args_for_coupling,
+            tg_law,
+            experimental_args_for_tg,
+            tg_args,
+            *experimental_args_for_cost_function,
+            *cost_function_args)
+
+
+class OptimizationCancelled(Exception):
+    """Raised inside the optimization when its cancellation is requested."""
+
+
+class CancellableCostFunction:
+    """
+    Cost function checking a cancellation flag before each evaluation and keeping the best point evaluated.
+
+    Attributes
+    ----------
+    cost_function : callable
+        Cost function to minimize.
+    cancel_event : threading.Event or None
+        Flag set to request the cancellation.
+    best_x : numpy.ndarray or None
+        Parameters of the lowest cost evaluated.
+    best_fun : float
+        Lowest cost evaluated.
+    number_of_evaluations : int
+        Number of evaluations of the cost function.
+    """
+    def __init__(self, cost_function, cancel_event):
+        self.cost_function = cost_function
+        self.cancel_event = cancel_event
+        self.best_x = None
+        self.best_fun = np.inf
+        self.number_of_evaluations = 0
+
+    def __call__(self, x, *args):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise OptimizationCancelled()
+        fun = self.cost_function(x, *args)
+        self.number_of_evaluations += 1
+        if fun < self.best_fun:
+            self.best_fun = fun
+            self.best_x = np.array(x, dtype=float)
+        return fun
+
+    def __getstate__(self):
+        # The flag can't be sent to the processes of a pool of workers, the cancellation is then checked by the callback
+        state = self.__dict__.copy()
+        state['cancel_event'] = None
+        return state
+
+
+def run_optimization(cost_function, initial_guess, selected_global_optimization, global_optimization_args_dict, selected_local_optimization, local_optimization_args_dict, args, callback=None, optimization_checkpoint=None, cancel_event=None, optimization_trace=None):
+    """
+    Run the selected global and/or local optimization.
+
+    The dictionaries of arguments are copied and not modified.
+
+    Parameters
+    ----------
+    cost_function : callable
+        Cost function to minimize.
+    initial_guess : numpy.ndarray
+        Initial guess of the parameters to optimize.
+    selected_global_optimization : str
+        'basinhopping', 'differential_evolution', 'shgo' or '' (no global optimization).
+    global_optimization_args_dict : dict or None
+        Arguments of the global optimization (including 'bounds' for differential_evolution and shgo).
+    selected_local_optimization : str
+        Method of scipy.optimize.minimize() or '' (no local optimization).
+    local_optimization_args_dict : dict or None
+        Arguments of scipy.optimize.minimize(), see split_local_optimization_options.
+    args : tuple
+        Arguments of the cost function, see get_cost_function_args.
+    callback : callable, optional
+        Callback of the optimization, given to the global optimization if any, otherwise to the local optimization. Default is None.
+    optimization_checkpoint : checkpoint.OptimizationCheckpoint, optional
+        Checkpoint recording the state of the optimization, and restoring it if it was created to resume. Default is None.
+    cancel_event : threading.Event, optional
+        Flag set (e.g. by another thread) to stop the optimization. It's checked before each evaluation
+        of the cost function and in the callback. Default is None.
+    optimization_trace : optimization_trace.OptimizationTrace, optional
+        Trace recording the progress of the optimization at each call of the callback. Default is None.
+
+    Returns
+    -------
+    scipy.optimize.OptimizeResult
+        Result of the optimization. If the optimization was cancelled, the best point found so far,
+        with the attribute 'cancelled' set to True.
+    """
+    if cancel_event is not None:
+        cancellable_cost_function = CancellableCostFunction(cost_function, cancel_event)
+        callback_calls = {"count": 0, "last_x": np.asarray(initial_guess, dtype=float)}
+
+        def cancellable_callback(xk, *callback_args, **callback_kwargs):
+            callback_calls['count'] += 1
+            callback_calls['last_x'] = np.array(xk, dtype=float)
+            if cancel_event.is_set():
+                raise OptimizationCancelled()
+            if callback is not None:
+                return callback(xk, *callback_args, **callback_kwargs)
+
+        try:
+            return run_optimization(cancellable_cost_function, initial_guess, selected_global_optimization, global_optimization_args_dict,
+                                    selected_local_optimization, local_optimization_args_dict, args, cancellable_callback, optimization_checkpoint,
+                                    optimization_trace=optimization_trace)
+        except OptimizationCancelled:
+            best_x, best_fun = cancellable_cost_function.best_x, cancellable_cost_function.best_fun
+            if best_x is None:
+                # The cost function was only evaluated by the processes of a pool of workers
+                best_x = callback_calls['last_x']
+                best_fun = cost_function(best_x, *args)
+            number_of_iterations = callback_calls['count']
+            if optimization_checkpoint is not None:
+                optimization_checkpoint.save()
+                number_of_iterations = optimization_checkpoint.number_of_iterations
+                if optimization_checkpoint.state['best_fun'] is not None and optimization_checkpoint.state['best_fun'] < best_fun:
+                    best_x, best_fun = optimization_checkpoint.state['best_x'], optimization_checkpoint.state['best_fun']
+            return scipy.optimize.OptimizeResult(x=best_x, fun=best_fun, success=False, cancelled=True,
+                                                 message="Optimization cancelled, best point found so far.",
+                                                 nfev=cancellable_cost_function.number_of_evaluations, nit=number_of_iterations)
+
+    if optimization_trace is not None:
+        # The cost function counts its evaluations and keeps the best point for the trace
+        traced_cost_function = cost_function if isinstance(cost_function, CancellableCostFunction) else CancellableCostFunction(cost_function, None)
+        optimization_trace.start(len(initial_guess))
+        try:
+            return run_optimization(traced_cost_function, initial_guess, selected_global_optimization, global_optimization_args_dict,
+                                    selected_local_optimization, local_optimization_args_dict, args,
+                                    optimization_trace.wrap_callback(callback, traced_cost_function), optimization_checkpoint)
+        finally:
+            optimization_trace.save()
+
+    global_optimization_args_dict = dict(global_optimization_args_dict) if global_optimization_args_dict else {}
+    local_optimization_args_dict = dict(local_optimization_args_dict) if local_optimization_args_dict else None
+    if optimization_checkpoint is not None:
+        method = selected_global_optimization if selected_global_optimization != '' else 'minimize'
+        initial_guess = optimization_checkpoint.prepare(method, initial_guess, global_optimization_args_dict, local_optimization_args_dict)
+        callback = optimization_checkpoint.wrap_callback(callback)
+        result = run_optimization(cost_function, initial_guess, selected_global_optimization, global_optimization_args_dict,
+                                  selected_local_optimization, local_optimization_args_dict, args, callback)
+        return optimization_checkpoint.finish(result)
+
+    if callback is not None:
+        if selected_global_optimization != '':
+            global_optimization_args_dict['callback'] = callback
+        elif selected_local_optimization != '':
+            local_optimization_args_dict['callback'] = callback
+
+    if selected_global_optimization == 'basinhopping':
+        # If no local minimization method is selected the default local minimization is used
+        # However, the arguments for local minimization still need to be given, hence the creation of the args dict
+        if local_optimization_args_dict is None:
+            local_optimization_args_dict = {}
+        local_optimization_args_dict['args'] = args
+        global_optimization_args_dict['minimizer_kwargs'] = local_optimization_args_dict
+        return scipy.optimize.basinhopping(cost_function, initial_guess, **global_optimization_args_dict)
+
+    elif selected_global_optimization == 'differential_evolution':
+        global_optimization_args_dict['args'] = args
+        bounds = global_optimization_args_dict.pop('bounds')
+        return scipy.optimize.differential_evolution(cost_function, bounds, **global_optimization_args_dict)
+
+    elif selected_global_optimization == 'shgo':
+        global_optimization_args_dict['args'] = args
+        global_optimization_args_dict['minimizer_kwargs'] = local_optimization_args_dict
+        bounds = global_optimization_args_dict.pop('bounds')
+        return scipy.optimize.shgo(cost_function, bounds, **global_optimization_args_dict)
+
+    elif selected_global_optimization == '':
+        local_optimization_args_dict['args'] = args
+        return scipy.optimize.minimize(cost_function, initial_guess, **local_optimization_args_dict)
+
+    raise ValueError(f"Unknown global optimization method: {selected_global_optimization}")
+
+
+def prepare_data(data_config):
+    """
+    Extract, validate, decimate and smooth the data of the files.
+
+    Parameters
+    ----------
+    data_config : dict
+        Section 'data' of the configuration, with the keys 'files', 'delimiter', 'has_header',
+        'skip_lines', and the optional sections 'decimation' (see decimation.decimate_experiments)
+        and 'smoothing' (see smoothing.smooth_experiments).
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - dict: Experimental data, see get_experimental_args.
+            - list: Messages of the validation, decimation and smoothing.
+
+    Raises
+    ------
+    ValueError
+        If a file is invalid.
+    """
+    arrays_lists = []
+    messages = []
+    for file_path in data_config['files']:
+        arrays, report = data_extraction.extract_and_validate_dsc_data(file_path,
+                                                                       data_config.get('delimiter', ','),
+                                                                       data_config.get('has_header', False),
+                                                                       data_config.get('skip_lines', 0))
+        if report.to_text():
+            messages.append(report.to_text())
+        if not report.is_valid:
+            raise ValueError(f"Extraction failed!\n{report.to_text()}")
+        arrays_lists.append(arrays)
+    time_lists, temperature_lists, rate_lists, extent_lists = (list(column) for column in zip(*arrays_lists))
+
+    if data_config.get('decimation'):
+        time_lists, temperature_lists, rate_lists, extent_lists, decimation_report = decimation.decimate_experiments(
+            time_lists, temperature_lists, rate_lists, extent_lists, **data_config['decimation'])
+        messages.append(decimation_report.to_text())
+
+    if data_config.get('smoothing'):
+        time_lists, temperature_lists, rate_lists, extent_lists, smoothing_report = smoothing.smooth_experiments(
+            time_lists, temperature_lists, rate_lists, extent_lists, **data_config['smoothing'])
+        messages.append(smoothing_report.to_text())
+
+    data = {"time": np.concatenate(time_lists),
+            "T": np.concatenate(temperature_lists),
+            "rate": np.concatenate(rate_lists),
+            "extent": np.concatenate(extent_lists),
+            "time_lists": time_lists,
+            "temperature_lists": temperature_lists,
+            "rate_lists": rate_lists,
+            "conv_lists": extent_lists}
+    return data, messages
+
+
+def interpolate_data(interpolation_config, data):
+    """
+    Interpolate the data of each file over conversion.
+
+    Parameters
+    ----------
+    interpolation_config : dict
+        Section 'interpolation' of the configuration, with the keys 'method' ('linear', 'cubic' or 'pchip'),
+        'number_of_points', and optionally 'limits' ('per_experiment' or 'shared', default 'per_experiment')
+        and 'tolerance' (adaptive grid, linear interpolation with shared limits only).
+    data : dict
+        Experimental data, see get_experimental_args.
+
+    Returns
+    -------
+    dict
+        Interpolated data of each file, with the keys 'conv_lists', 'time_lists', 'temperature_lists' and 'rate_lists'.
+    """
+    method = interpolation_config.get('method', 'linear')
+    number_of_points = interpolation_config['number_of_points']
+    shared_limits = interpolation_config.get('limits', 'per_experiment') == 'shared'
+    args = (data['conv_lists'], data['time_lists'], data['temperature_lists'], data['rate_lists'], number_of_points)
+
+    if method == 'linear' and shared_limits:
+        interpolated_data = interpolation.linear_interpolation(*args, tolerance=interpolation_config.get('tolerance'))
+    elif method == 'linear':
+        interpolated_data = interpolation.linear_interpolation_multiple_limits(*args)
+    elif method in ('cubic', 'pchip') and shared_limits:
+        interpolated_data = interpolation.cubic_spline_interpolation(*args, method=method)
+    elif method in ('cubic', 'pchip'):
+        interpolated_data = interpolation.cubic_spline_interpolation_multiple_limits(*args, method=method)
+    else:
+        raise ValueError(f"Unknown interpolation method: {method}. Use 'linear', 'cubic' or 'pchip'.")
+
+    return dict(zip(["conv_lists", "time_lists", "temperature_lists", "rate_lists"], (list(array) for array in interpolated_data)))
+
+
+def run_isoconversional_analysis(isoconversional_config, data):
+    """
+    Perform an isoconversional analysis.
+
+    Parameters
+    ----------
+    isoconversional_config : dict
+        Section 'isoconversional_analysis' of the configuration, with the keys 'method'
+        (function of the isoconversional_methods module) and 'parameters'.
+    data : dict
+        Data of each file (interpolated if an interpolation is configured).
+
+    Returns
+    -------
+    dict
+        Conversion and activation energy.
+    """
+    isoconversional_method = getattr(icm, isoconversional_config['method'])
+    experimental_parameters, other_parameters = get_law_parameters(isoconversional_method, ISOCONVERSIONAL_EXPERIMENTAL_PARAMETERS)
+    experimental_args = get_experimental_args(experimental_parameters, data)
+    method_args = [isoconversional_config['parameters'][parameter] for parameter in other_parameters]
+
+    conversion, activation_energy = isoconversional_method(*experimental_args, *method_args)[:2]
+    return {"method": isoconversional_config['method'],
+            "conversion": np.asarray(conversion).tolist(),
+            "activation_energy": np.asarray(activation_energy).tolist()}
+
+
+def get_bounds(bounds, parameters_to_optimize):
+    """
+    Order the bounds of the parameters to optimize.
+
+    Parameters
+    ----------
+    bounds : dict or list
+        Bounds (min, max) of each parameter, by name or in the order of the parameters.
+    parameters_to_optimize : list
+        Names of the parameters to optimize.
+
+    Returns
+    -------
+    list
+        List of (min, max) tuples.
+    """
+    if isinstance(bounds, dict):
+        return [tuple(bounds[parameter]) for parameter in parameters_to_optimize]
+    return [tuple(bound) for bound in bounds]
+
+
+def run_fit(optimization_config, data, callback=None):
+    """
+    Optimize the parameters of a kinetic model.
+
+    Parameters
+    ----------
+    optimization_config : dict
+        Section 'optimization' of the configuration, with the sections 'rate', 'vitrification',
+        'coupling' (each with a 'law' and an 'initial_guess' by parameter), 'tg' (with a 'law' and
+        its 'parameters'), 'global_optimization' and 'local_optimization' (each with a 'method' and
+        its 'parameters'), 'cost_function' (with a 'function' and its 'parameters') and optionally
+        'checkpoint' (with a 'path', an 'interval' in seconds and 'resume' to resume from an existing checkpoint),
+        'trace' (with a 'path' of .npz file and a 'flush_interval' in seconds, see the optimization_trace module)
+        and 'warm_start' (with the 'database_path' of the previous results, and optionally a 'bound_margin' and
+        a 'maximum_distance', see the warm_start module).
+    data : dict
+        Experimental data, see get_experimental_args.
+    callback : callable, optional
+        Callback of the optimization. Default is None.
+
+    Returns
+    -------
+    dict
+        Optimized parameters by name, final value of the cost function, mean RSS and information about the optimization.
+    """
+    initial_guess = []
+    parameters_to_optimize = []
+    laws = {}
+    experimental_args = {}
+    number_of_parameters = {}
+    parameters_by_section = {}
+    for section in ('rate', 'vitrification', 'coupling'):
+        section_config = optimization_config.get(section)
+        if not section_config:
+            laws[section], experimental_args[section], number_of_parameters[section] = None, None, 0
+            continue
+        laws[section] = getattr(km, section_config['law'])
+        experimental_parameters, other_parameters = get_law_parameters(laws[section], EXPERIMENTAL_PARAMETERS[section])
+        experimental_args[section] = get_experimental_args(experimental_parameters, data)
+        number_of_parameters[section] = len(other_parameters)
+        parameters_by_section[section] = other_parameters
+        initial_guess.extend(float(section_config['initial_guess'][parameter]) for parameter in other_parameters)
+        parameters_to_optimize.extend(other_parameters)
+
+    tg_config = optimization_config.get('tg')
+    if tg_config:
+        tg_law = getattr(km, tg_config['law'])
+        tg_experimental_parameters, tg_parameters = get_law_parameters(tg_law, TG_EXPERIMENTAL_PARAMETERS)
+        experimental_args_for_tg = get_experimental_args(tg_experimental_parameters, data)
+        tg_args = np.array([float(tg_config['parameters'][parameter]) for parameter in tg_parameters])
+    else:
+        tg_law, experimental_args_for_tg, tg_args = None, None, None
+
+    cost_function_config = optimization_config['cost_function']
+    cost_function = getattr(opt, cost_function_config['function'])
+    cost_experimental_parameters, cost_parameters = get_cost_function_parameters(cost_function)
+    experimental_args_for_cost_function = get_experimental_args(cost_experimental_parameters, data)
+    cost_function_args = tuple(float(cost_function_config.get('parameters', {})[parameter]) for parameter in cost_parameters)
+
+    global_config = optimization_config.get('global_optimization') or {}
+    selected_global_optimization = global_config.get('method', '')
+    global_optimization_args_dict = dict(global_config.get('parameters', {}))
+    if 'bounds' in global_optimization_args_dict:
+        global_optimization_args_dict['bounds'] = get_bounds(global_optimization_args_dict['bounds'], parameters_to_optimize)
+
+    local_config = optimization_config.get('local_optimization') or {}
+    selected_local_optimization = local_config.get('method', '')
+    local_optimization_args_dict = None
+    if selected_local_optimization != '':
+        local_parameters = dict(local_config.get('parameters', {}))
+        if 'bounds' in local_parameters:
+            local_parameters['bounds'] = get_bounds(local_parameters['bounds'], parameters_to_optimize)
+        local_optimization_args_dict = split_local_optimization_options(local_parameters)
+        local_optimization_args_dict['method'] = selected_local_optimization
+
+    model_args = (laws['rate'], experimental_args['rate'], number_of_parameters['rate'],
+                  laws['vitrification'], experimental_args['vitrification'], number_of_parameters['vitrification'],
+                  laws['coupling'], experimental_args['coupling'],
+                  tg_law, experimental_args_for_tg, tg_args)
+    args = get_cost_function_args(data['rate'], *model_args, experimental_args_for_cost_function, cost_function_args)
+
+    optimization_checkpoint = None
+    checkpoint_config = optimization_config.get('checkpoint')
+    if checkpoint_config:
+        resume = checkpoint_config.get('resume', False) and os.path.exists(checkpoint_config['path'])
+        optimization_checkpoint = checkpoint.OptimizationCheckpoint(checkpoint_config['path'], checkpoint_config.get('interval', 60),
+                                                                    resume, parameters_to_optimize)
+
+    proposed_warm_start = None
+    warm_start_config = optimization_config.get('warm_start')
+    if warm_start_config and os.path.exists(warm_start_config.get('database_path', '')):
+        laws_names = {section: (optimization_config.get(section) or {}).get('law') for section in warm_start.LAW_SECTIONS}
+        experiments = {"time": data['time_lists'], "temperature": data['temperature_lists'],
+                       "rate": data['rate_lists'], "extent": data['conv_lists']}
+        proposed_warm_start = warm_start.propose_warm_start(warm_start_config['database_path'], laws_names, parameters_by_section, experiments,
+                                                            global_optimization_args_dict.get('bounds'),
+                                                            warm_start_config.get('bound_margin', 0.5),
+                                                            warm_start_config.get('maximum_distance', 0.1))
+    if proposed_warm_start is not None:
+        initial_guess = proposed_warm_start.initial_guess
+        if selected_global_optimization != '':
+            global_optimization_args_dict = warm_start.apply_warm_start(selected_global_optimization, global_optimization_args_dict,
+                                                                        proposed_warm_start, global_optimization_args_dict.get('seed'))
+
+    trace = None
+    trace_config = optimization_config.get('trace')
+    if trace_config and trace_config.get('path'):
+        trace = optimization_trace.OptimizationTrace(trace_config['path'], trace_config.get('flush_interval', 30),
+                                                     parameters_to_optimize, selected_global_optimization or selected_local_optimization)
+
+    start_time = time_module.time()
+    result = run_optimization(cost_function, np.array(initial_guess),
+                              selected_global_optimization, global_optimization_args_dict,
+                              selected_local_optimization, local_optimization_args_dict,
+                              args, callback, optimization_checkpoint, optimization_trace=trace)
+    total_optimization_time = time_module.time() - start_time
+
+    dif = opt.model(result.x, *model_args) - data['rate']
+    fit_results = {"parameters": dict(zip(parameters_to_optimize, np.asarray(result.x, dtype=float).tolist())),
+                   "fun": float(result.fun),
+                   "mean_rss": float(np.dot(dif, dif) / len(dif)),
+                   "success": bool(result.get('success', True)),
+                   "message": str(result.get('message', '')),
+                   "nfev": int(result.get('nfev', 0)),
+                   "nit": int(result.get('nit', 0)),
+                   "total_optimization_time": total_optimization_time}
+    if trace is not None:
+        fit_results['trace_path'] = trace.trace_path
+    if proposed_warm_start is not None:
+        fit_results['warm_start'] = dict(proposed_warm_start.to_dict(),
+                                         initial_guess=dict(zip(parameters_to_optimize, np.asarray(proposed_warm_start.initial_guess).tolist())),
+                                         bounds=proposed_warm_start.bounds)
+    return fit_results
+
+
+def get_results_metadata(config, fit_results):
+    """
+    Describe an optimization of the pipeline as the graphical interface does, to add it to the results database.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration, see load_config.
+    fit_results : dict
+        Results of the optimization, see run_fit.
+
+    Returns
+    -------
+    dict
+        Files, laws, optimization methods, cost function and results of the optimization (see results_storage).
+    """
+    optimization_config = config['optimization']
+    metadata = {"files": [os.path.basename(file_path) for file_path in config['data']['files']],
+                "full_file_paths": list(config['data']['files'])}
+    warm_start_results = fit_results.get('warm_start')
+    for section in ('rate', 'vitrification', 'coupling'):
+        section_config = optimization_config.get(section)
+        if section_config:
+            initial_guess = dict(section_config['initial_guess'])
+            if warm_start_results is not None:
+                initial_guess.update({parameter: value for parameter, value in warm_start_results['initial_guess'].items() if parameter in initial_guess})
+            metadata[section] = {"law": section_config['law'],
+                                 "initial_guess": initial_guess,
+                                 "results": {parameter: fit_results['parameters'][parameter]
+                                             for parameter in section_config['initial_guess'] if parameter in fit_results['parameters']}}
+        else:
+            metadata[section] = None
+    for section in ('tg', 'global_optimization', 'local_optimization', 'cost_function'):
+        metadata[section] = optimization_config.get(section) or None
+    metadata['results'] = {key: fit_results[key] for key in ('fun', 'mean_rss', 'total_optimization_time', 'success', 'message', 'nfev', 'nit')}
+    metadata['warm_start'] = warm_start_results
+    metadata['date'] = datetime.datetime.now().isoformat(timespec='seconds')
+    return metadata
+
+
+def run_pipeline(config, output_directory=None):
+    """
+    Run all the steps described in a configuration.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration, see load_config. The sections 'interpolation', 'isoconversional_analysis'
+        and 'optimization' are optional. With 'database' (true, or the path of the database), the optimization
+        is added to the results database (see results_database), with the optional 'material' of the samples.
+    output_directory : str, optional
+        Folder where the results are written as '<name>_results.json'. Default is None (results aren't written).
+
+    Returns
+    -------
+    dict
+        Results of each step.
+    """
+    results = {"name": config['name'], "files": config['data']['files']}
+    start_time = time_module.time()
+
+    data, results['messages'] = prepare_data(config['data'])
+    results['number_of_points'] = int(len(data['time']))
+
+    analysis_data = data
+    if config.get('interpolation'):
+        analysis_data = interpolate_data(config['interpolation'], data)
+
+    if config.get('isoconversional_analysis'):
+        results['isoconversional_analysis'] = run_isoconversional_analysis(config['isoconversional_analysis'], analysis_data)
+
+    if config.get('optimization'):
+        checkpoint_config = config['optimization'].get('checkpoint')
+        if checkpoint_config and 'path' not in checkpoint_config:
+            # By default, the checkpoint is saved next to the results, so that a new run of the same configuration resumes it
+            checkpoint_config['path'] = os.path.join(output_directory or os.getcwd(), f"{config['name']}_checkpoint.json")
+        trace_config = config['optimization'].get('trace')
+        if trace_config is True:
+            trace_config = config['optimization']['trace'] = {}
+        if trace_config is not None and trace_config is not False and 'path' not in trace_config:
+            trace_config['path'] = os.path.join(output_directory or os.getcwd(), f"{config['name']}_trace.npz")
+        database_path = config.get('database')
+        if database_path is True:
+            database_path = os.path.join(output_directory or os.getcwd(), results_database.DATABASE_NAME)
+        warm_start_config = config['optimization'].get('warm_start')
+        if warm_start_config is True:
+            warm_start_config = config['optimization']['warm_start'] = {}
+        if warm_start_config is not None and warm_start_config is not False and 'database_path' not in warm_start_config:
+            # By default, the previous results are looked up in the database of the results
+            warm_start_config['database_path'] = database_path or os.path.join(output_directory or os.getcwd(), results_database.DATABASE_NAME)
+        results['optimization'] = run_fit(config['optimization'], data)
+        if database_path:
+            experiments = {"time": data['time_lists'], "temperature": data['temperature_lists'],
+                           "rate": data['rate_lists'], "extent": data['conv_lists']}
+            results['optimization']['run_id'] = results_database.add_run(database_path, get_results_metadata(config, results['optimization']),
+                                                                         experiments, source="pipeline",
+                                                                         name=config['name'], material=config.get('material'))
+            results['optimization']['database_path'] = database_path
+
+    results['total_time'] = time_module.time() - start_time
+
+    if output_directory is not None:
+        results_path = os.path.join(output_directory, f"{config['name']}_results.json")
+        with results_storage.open_atomically(results_path) as file:
+            json.dump(results, file, indent=2)
+        results['results_path'] = results_path
+    return results
+
+
+if __name__ == "__main__":
+    print("You've run the pipeline module.")
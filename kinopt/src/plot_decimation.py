@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+The plot_decimation module allows to plot large curves at the resolution of the display.
+
+Plotting millions of points makes the rendering of matplotlib slow (tab switching, zoom, pan), while a
+canvas can only display a few thousand distinct columns of pixels. Each curve is therefore plotted with
+a subset of its points, selected for the visible range of the axes and selected again after each zoom or
+pan from the data at full resolution.
+
+Two selections are available:
+
+* min/max envelope ('minmax'): the first, last, minimum and maximum points of each column of pixels, which
+  keeps the peaks and the noise envelope exactly (vectorized, default)
+* Largest-Triangle-Three-Buckets ('lttb'): one point per bucket, maximizing the area of the triangle formed
+  with the neighbouring buckets, which keeps the visual shape with fewer points
+
+.. note::
+    This module doesn't import matplotlib, the axes and lines are only used through their methods.
+    The x values of each curve must be sorted (e.g. time).
+"""
+
+import numpy as np
+
+
+def get_visible_range(x, x_limits=None):
+    """
+    Get the indices of the points within the limits, with one more point on each side for continuity.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted x values.
+    x_limits : tuple, optional
+        (minimum, maximum) of the visible range. Default is None (whole curve).
+
+    Returns
+    -------
+    tuple
+        Index of the first point and index after the last point.
+    """
+    if x_limits is None:
+        return 0, len(x)
+    x_min, x_max = min(x_limits), max(x_limits)
+    start = max(np.searchsorted(x, x_min, side='left') - 1, 0)
+    stop = min(np.searchsorted(x, x_max, side='right') + 1, len(x))
+    return start, stop
+
+
+def min_max_indices(x, y, number_of_bins):
+    """
+    Select the first, last, minimum and maximum points of each bin of equal width in x.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted x values.
+    y : numpy.ndarray
+        y values.
+    number_of_bins : int
+        Number of bins (e.g. number of columns of pixels).
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the selected points.
+    """
+    length = len(x)
+    if length <= 4 * number_of_bins:
+        return np.arange(length)
+
+    # Index of the first point of each non-empty bin
+    edges = np.linspace(x[0], x[-1], number_of_bins + 1)
+    starts = np.unique(np.searchsorted(x, edges[:-1], side='left'))
+    starts = starts[starts < length]
+    stops = np.append(starts[1:], length)
+
+    # NaN values (e.g. model diverging) are ignored by the selection
+    finite_y = np.where(np.isnan(y), np.nanmean(y) if np.any(np.isfinite(y)) else 0.0, y)
+    minimums = np.minimum.reduceat(finite_y, starts)
+    maximums = np.maximum.reduceat(finite_y, starts)
+    bin_ids = np.repeat(np.arange(len(starts)), stops - starts)
+    is_minimum = finite_y == minimums[bin_ids]
+    is_maximum = finite_y == maximums[bin_ids]
+
+    # First occurrence of the minimum and maximum of each bin
+    positions = np.arange(length)
+    argmins = np.minimum.reduceat(np.where(is_minimum, positions, length), starts)
+    argmaxs = np.minimum.reduceat(np.where(is_maximum, positions, length), starts)
+    return np.unique(np.concatenate((starts, stops - 1, argmins, argmaxs)))
+
+
+def lttb_indices(x, y, number_of_points):
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted x values.
+    y : numpy.ndarray
+        y values.
+    number_of_points : int
+        Number of points to select, including the first and last points.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the selected points.
+    """
+    length = len(x)
+    if number_of_points >= length or number_of_points < 3:
+        return np.arange(length)
+
+    # Buckets between the first and last points, which are always kept
+    bucket_edges = np.linspace(1, length - 1, number_of_points - 1).astype(int)
+    indices = np.empty(number_of_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = length - 1
+    finite_y = np.nan_to_num(y)
+    for bucket in range(number_of_points - 2):
+        start, stop = bucket_edges[bucket], bucket_edges[bucket + 1]
+        # Average point of the next bucket (or the last point)
+        if bucket < number_of_points - 3:
+            next_start, next_stop = bucket_edges[bucket + 1], bucket_edges[bucket + 2]
+            average_x = x[next_start:next_stop].mean()
+            average_y = finite_y[next_start:next_stop].mean()
+        else:
+            average_x, average_y = x[-1], finite_y[-1]
+        previous_x, previous_y = x[indices[bucket]], finite_y[indices[bucket]]
+        areas = np.abs((previous_x - average_x) * (finite_y[start:stop] - previous_y)
+                       - (previous_x - x[start:stop]) * (average_y - previous_y))
+        indices[bucket + 1] = start + np.argmax(areas)
+    return indices
+
+
+def decimate_for_display(x, y, number_of_points=2000, x_limits=None, method='minmax'):
+    """
+    Select the points of a curve to display.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted x values. Points with NaN x values (e.g. padding of the results files) are removed.
+    y : numpy.ndarray
+        y values.
+    number_of_points : int, optional
+        Approximate number of points to display (e.g. width of the axes in pixels). Default is 2000.
+    x_limits : tuple, optional
+        (minimum, maximum) of the visible range. Default is None (whole curve).
+    method : str, optional
+        'minmax' (up to 4 points per bin of number_of_points bins) or 'lttb' (number_of_points points). Default is 'minmax'.
+
+    Returns
+    -------
+    tuple
+        x and y values of the selected points.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if np.isnan(x[-1:]).any() or np.isnan(x[:1]).any():
+        is_finite = np.isfinite(x)
+        x, y = x[is_finite], y[is_finite]
+    start, stop = get_visible_range(x, x_limits)
+    x, y = x[start:stop], y[start:stop]
+    if method == 'minmax':
+        indices = min_max_indices(x, y, number_of_points)
+    elif method == 'lttb':
+        indices = lttb_indices(x, y, number_of_points)
+    else:
+        raise ValueError(f"Unknown decimation method: {method}. Use 'minmax' or 'lttb'.")
+    if len(indices) == len(x):
+        return x, y
+    return x[indices], y[indices]
+
+
+class LevelOfDetail:
+    """
+    Plot curves of an axes at the resolution of the display and update them after each zoom or pan.
+
+    Attributes
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes of the curves.
+    method : str
+        Selection of the points, 'minmax' or 'lttb'.
+    lines : list
+        List of (line, x, y) with the data at full resolution of each curve.
+    """
+    def __init__(self, ax, method='minmax'):
+        self.ax = ax
+        self.method = method
+        self.lines = []
+        self.callbacks = None
+
+    @property
+    def number_of_points(self):
+        """int: Number of points displayed per curve, from the width of the axes in pixels."""
+        return max(int(self.ax.bbox.width), 200)
+
+    def check_connection(self):
+        """Connect to the changes of limits of the axes. Clearing the axes removes the curves and the connection."""
+        if self.callbacks is not self.ax.callbacks:
+            self.lines = []
+            self.callbacks = self.ax.callbacks
+            self.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+    def get_x_limits(self):
+        """
+        Get the visible range of the axes.
+
+        Returns
+        -------
+        tuple or None
+            Limits of the x axis, or None if the limits are computed automatically.
+        """
+        return None if self.ax.get_autoscalex_on() else self.ax.get_xlim()
+
+    def plot(self, x, y, *args, **kwargs):
+        """
+        Plot a curve at the resolution of the display.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Sorted x values.
+        y : numpy.ndarray
+            y values.
+        *args, **kwargs
+            Arguments of matplotlib.axes.Axes.plot().
+
+        Returns
+        -------
+        matplotlib.lines.Line2D
+            Line of the curve.
+        """
+        self.check_connection()
+        displayed_x, displayed_y = decimate_for_display(x, y, self.number_of_points, self.get_x_limits(), self.method)
+        line, = self.ax.plot(displayed_x, displayed_y, *args, **kwargs)
+        self.lines.append((line, np.asarray(x), np.asarray(y)))
+        return line
+
+    def set_data(self, line, x, y):
+        """
+        Replace the data of a curve plotted by this object.
+
+        Parameters
+        ----------
+        line : matplotlib.lines.Line2D
+            Line of the curve.
+        x : numpy.ndarray
+            Sorted x values.
+        y : numpy.ndarray
+            y values.
+        """
+        self.check_connection()
+        x = np.asarray(x)
+        y = np.asarray(y)
+        self.lines = [(other_line, x, y) if other_line is line else (other_line, other_x, other_y)
+                      for other_line, other_x, other_y in self.lines]
+        line.set_data(*decimate_for_display(x, y, self.number_of_points, self.get_x_limits(), self.method))
+
+    def on_xlim_changed(self, ax):
+        """
+        Select again the points of each curve for the new visible range.
+
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            Axes whose limits changed.
+        """
+        x_limits = ax.get_xlim()
+        for line, x, y in self.lines:
+            line.set_data(*decimate_for_display(x, y, self.number_of_points, x_limits, self.method))
+
+
+if __name__ == "__main__":
+    print("You've run the plot_decimation module.")
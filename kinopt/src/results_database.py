@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+The results_database module allows to store the results of all the optimizations in a local SQLite database.
+
+Each finished optimization (graphical interface or pipeline) is added as a row of the table 'runs', with:
+
+* the laws (rate, vitrification, coupling, Tg), the optimization methods and the cost function
+* the final cost, the mean RSS, the number of evaluations and iterations and the time of the optimization
+* a fingerprint of the data used for the optimization (hash of the arrays), and the path of the result files
+* the run it started from, if it was started from a warm start (see warm_start)
+* the complete description of the optimization (JSON, see results_storage)
+
+The optimized parameters and their initial guesses are stored in the table 'parameters', and the files with
+the hash of their content and a fingerprint of their data in the table 'files'. The tables are indexed to
+compare thousands of runs quickly, e.g. the best fit of a law for each material (see get_best_runs) or
+the time of the optimizations by method (see get_runtime_by_optimizer).
+
+.. note::
+    The material isn't known by the graphical interface, it can be given in the configuration of the
+    pipeline ('material'). The runs without material can be grouped by data fingerprint instead.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import numpy as np
+
+import data_extraction
+import results_storage
+
+
+DATABASE_NAME = "results.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    date TEXT,
+    source TEXT,
+    name TEXT,
+    material TEXT,
+    rate_law TEXT,
+    vitrification_law TEXT,
+    coupling_law TEXT,
+    tg_law TEXT,
+    global_optimization TEXT,
+    local_optimization TEXT,
+    cost_function TEXT,
+    fun REAL,
+    mean_rss REAL,
+    total_optimization_time REAL,
+    nfev INTEGER,
+    nit INTEGER,
+    success INTEGER,
+    cancelled INTEGER,
+    number_of_files INTEGER,
+    number_of_points INTEGER,
+    data_fingerprint TEXT,
+    results_path TEXT,
+    warm_start_run_id INTEGER,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS parameters (
+    run_id INTEGER REFERENCES runs(id) ON DELETE CASCADE,
+    section TEXT,
+    name TEXT,
+    initial_guess REAL,
+    value REAL
+);
+CREATE TABLE IF NOT EXISTS files (
+    run_id INTEGER REFERENCES runs(id) ON DELETE CASCADE,
+    file_name TEXT,
+    file_hash TEXT,
+    data_fingerprint TEXT,
+    number_of_points INTEGER,
+    minimum_temperature REAL,
+    maximum_temperature REAL,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS runs_by_rate_law_and_material ON runs (rate_law, material, fun);
+CREATE INDEX IF NOT EXISTS runs_by_data_fingerprint ON runs (data_fingerprint, fun);
+CREATE INDEX IF NOT EXISTS runs_by_optimizer ON runs (global_optimization, local_optimization, total_optimization_time);
+CREATE INDEX IF NOT EXISTS parameters_by_run ON parameters (run_id);
+CREATE INDEX IF NOT EXISTS files_by_run ON files (run_id);
+CREATE INDEX IF NOT EXISTS files_by_data_fingerprint ON files (data_fingerprint);
+"""
+
+LAW_SECTIONS = ["rate", "vitrification", "coupling"]
+
+
+def get_default_database_path():
+    """
+    Get the path of the database in the results folder of KinOpt.
+
+    Returns
+    -------
+    str
+        Path of the database.
+    """
+    return os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "results", DATABASE_NAME)
+
+
+def connect(database_path):
+    """
+    Open the database, and create its tables and indexes if they don't exist.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Connection to the database, whose rows can be accessed by column name.
+    """
+    directory = os.path.dirname(os.path.abspath(database_path))
+    os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(database_path)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def get_data_fingerprint(*arrays):
+    """
+    Compute a fingerprint of experimental data, based on the content of the arrays.
+
+    Parameters
+    ----------
+    *arrays : numpy.ndarray
+        Arrays of the data (e.g. time, temperature, rate and extent).
+
+    Returns
+    -------
+    str
+        BLAKE2b hash of the arrays.
+    """
+    data_hash = hashlib.blake2b(digest_size=20)
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        data_hash.update(f"{array.shape}".encode())
+        data_hash.update(array.data)
+    return data_hash.hexdigest()
+
+
+def describe_files(experiments):
+    """
+    Describe the data of each file, to compare them between runs.
+
+    Parameters
+    ----------
+    experiments : dict
+        List of arrays of each file, for each key of results_storage.DATA_KEYS.
+
+    Returns
+    -------
+    list
+        Data fingerprint, number of points, minimum and maximum temperature and duration of each file (dict).
+    """
+    files = []
+    for index, time in enumerate(experiments["time"]):
+        time = np.asarray(time, dtype=float)
+        temperature = np.asarray(experiments["temperature"][index], dtype=float)
+        length = len(time)
+        files.append({"data_fingerprint": get_data_fingerprint(*(experiments[key][index] for key in results_storage.DATA_KEYS)),
+                      "number_of_points": length,
+                      "minimum_temperature": float(np.nanmin(temperature)) if length else None,
+                      "maximum_temperature": float(np.nanmax(temperature)) if length else None,
+                      "duration": float(time[-1] - time[0]) if length else None})
+    return files
+
+
+def to_float(value):
+    """
+    Convert a value to a float, e.g. the text of an initial guess.
+
+    Parameters
+    ----------
+    value : object
+        Value to convert.
+
+    Returns
+    -------
+    float or None
+        Value, or None if it isn't a number.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def add_run(database_path, metadata, experiments, results_path=None, source="gui", name=None, material=None):
+    """
+    Add a finished optimization to the database.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database.
+    metadata : dict
+        Description of the optimization and its results, see results_storage.
+    experiments : dict
+        List of arrays of each file, for each key of results_storage.DATA_KEYS.
+    results_path : str, optional
+        Path of the result files. Default is None.
+    source : str, optional
+        Origin of the optimization, 'gui' or 'pipeline'. Default is 'gui'.
+    name : str, optional
+        Name of the optimization (e.g. of the configuration of the pipeline). Default is None.
+    material : str, optional
+        Material of the samples. Default is None.
+
+    Returns
+    -------
+    int
+        Identifier of the run in the database.
+    """
+    def get_method(section):
+        return (metadata.get(section) or {}).get("method") or None
+
+    def get_law(section):
+        return (metadata.get(section) or {}).get("law") or None
+
+    results = metadata.get("results") or {}
+    files = metadata.get("files") or []
+    full_file_paths = metadata.get("full_file_paths") or files
+    number_of_points = [len(time) for time in experiments["time"]]
+    data_fingerprint = get_data_fingerprint(*(np.concatenate([np.asarray(array, dtype=float) for array in experiments[key]])
+                                              for key in results_storage.DATA_KEYS))
+    run = {"date": metadata.get("date"), "source": source, "name": name, "material": material,
+           "rate_law": get_law("rate"), "vitrification_law": get_law("vitrification"),
+           "coupling_law": get_law("coupling"), "tg_law": get_law("tg"),
+           "global_optimization": get_method("global_optimization"), "local_optimization": get_method("local_optimization"),
+           "cost_function": (metadata.get("cost_function") or {}).get("function"),
+           "fun": to_float(results.get("fun")), "mean_rss": to_float(results.get("mean_rss")),
+           "total_optimization_time": to_float(results.get("total_optimization_time")),
+           "nfev": results.get("nfev"), "nit": results.get("nit"),
+           "success": int(bool(results.get("success", True))), "cancelled": int(bool(results.get("cancelled", False))),
+           "number_of_files": len(number_of_points), "number_of_points": int(sum(number_of_points)),
+           "data_fingerprint": data_fingerprint, "results_path": results_path,
+           "warm_start_run_id": (metadata.get("warm_start") or {}).get("run_id"),
+           "metadata": json.dumps(metadata, default=results_storage.to_json_compatible)}
+
+    with connect(database_path) as connection:
+        cursor = connection.execute(f"INSERT INTO runs ({', '.join(run)}) VALUES ({', '.join('?' * len(run))})", tuple(run.values()))
+        run_id = cursor.lastrowid
+        parameters = []
+        for section in LAW_SECTIONS:
+            law = metadata.get(section) or {}
+            initial_guess = law.get("initial_guess") or {}
+            for parameter, value in (law.get("results") or {}).items():
+                parameters.append((run_id, section, parameter, to_float(initial_guess.get(parameter)), to_float(value)))
+        connection.executemany("INSERT INTO parameters VALUES (?, ?, ?, ?, ?)", parameters)
+        file_rows = []
+        for index, file in enumerate(describe_files(experiments)):
+            file_path = full_file_paths[index] if index < len(full_file_paths) else None
+            file_hash = data_extraction.get_file_hash(file_path) if file_path and os.path.isfile(file_path) else None
+            file_rows.append((run_id, files[index] if index < len(files) else None, file_hash, file["data_fingerprint"],
+                              file["number_of_points"], file["minimum_temperature"], file["maximum_temperature"], file["duration"]))
+        connection.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", file_rows)
+    connection.close()
+    return run_id
+
+
+def get_run_parameters(database_path, run_id):
+    """
+    Get the optimized parameters of a run.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database.
+    run_id : int
+        Identifier of the run.
+
+    Returns
+    -------
+    dict
+        Optimized value of each parameter, by section ('rate', 'vitrification', 'coupling').
+    """
+    connection = connect(database_path)
+    rows = connection.execute("SELECT section, name, value FROM parameters WHERE run_id = ? ORDER BY rowid", (run_id,)).fetchall()
+    connection.close()
+    parameters = {}
+    for row in rows:
+        parameters.setdefault(row["section"], {})[row["name"]] = row["value"]
+    return parameters
+
+
+def get_best_runs(database_path, rate_law=None, group_by="material", include_cancelled=False):
+    """
+    Get the run with the lowest final cost of each group, e.g. the best fit of a law for each material.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database.
+    rate_law : str, optional
+        Name of the rate law of the runs. Default is None (all the laws, one group by law).
+    group_by : str, optional
+        Column grouping the runs, 'material' or 'data_fingerprint'. Default is 'material'.
+    include_cancelled : bool, optional
+        If True, the cancelled optimizations are compared as well. Default is False.
+
+    Returns
+    -------
+    list
+        Best run of each group (dict of the columns of the table 'runs', without the metadata), sorted by group.
+    """
+    if group_by not in ("material", "data_fingerprint"):
+        raise ValueError(f"Unknown group: {group_by}. Use 'material' or 'data_fingerprint'.")
+    conditions = ["fun IS NOT NULL"]
+    arguments = []
+    if rate_law is not None:
+        conditions.append("rate_law = ?")
+        arguments.append(rate_law)
+    if not include_cancelled:
+        conditions.append("cancelled = 0")
+    # SQLite takes the other columns from the row of the minimum
+    query = (f"SELECT *, MIN(fun) AS best_fun FROM runs WHERE {' AND '.join(conditions)} "
+             f"GROUP BY rate_law, {group_by} ORDER BY rate_law, {group_by}")
+    connection = connect(database_path)
+    rows = connection.execute(query, arguments).fetchall()
+    connection.close()
+    best_runs = []
+    for row in rows:
+        run = dict(row)
+        run.pop("metadata")
+        run.pop("best_fun")
+        best_runs.append(run)
+    return best_runs
+
+
+def get_runtime_by_optimizer(database_path, include_cancelled=False):
+    """
+    Compare the optimization methods: number of runs, mean time, mean number of evaluations and lowest cost.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the database.
+    include_cancelled : bool, optional
+        If True, the cancelled optimizations are counted as well. Default is False.
+
+    Returns
+    -------
+    list
+        Statistics of each combination of global and local optimization (dict), sorted by mean time.
+    """
+    condition = "" if include_cancelled else "WHERE cancelled = 0"
+    query = ("SELECT global_optimization, local_optimization, COUNT(*) AS number_of_runs, "
+             "AVG(total_optimization_time) AS mean_optimization_time, AVG(nfev) AS mean_nfev, MIN(fun) AS best_fun "
+             f"FROM runs {condition} GROUP BY global_optimization, local_optimization ORDER BY mean_optimization_time")
+    connection = connect(database_path)
+    rows = connection.execute(query).fetchall()
+    connection.close()
+    return [dict(row) for row in rows]
+
+
+if __name__ == "__main__":
+    print("You've run the results_database module.")
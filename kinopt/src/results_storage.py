@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+The results_storage module allows to save and load the results of an optimization in a binary file.
+
+The text summary of an optimization used to contain all the experimental data, written row by row,
+which is slow to write and to read, large, and rounds the values. The results are now saved in a .npz
+file next to the summary ('<name>.npz' for '<name>.txt'), containing:
+
+* 'metadata': JSON text with the files, the laws and their parameters, the optimization methods and
+  their arguments, the cost function, the optimized parameters, the final cost and the timing
+* 'time', 'temperature', 'rate', 'extent': experimental data of all the files, concatenated
+* 'model_rate': rate computed by the model with the optimized parameters, concatenated (optional)
+* 'lengths': number of points of each file, to split the concatenated arrays
+* 'x': optimized parameters
+
+The text summaries are read in parts: read_summary_header reads the sections before the data, which are
+enough to display the laws and parameters, load_summary_data loads the data from the binary file (or parses
+the data rows of older summaries at once), and read_summary_lines reads the rest of the text page by page.
+
+.. note::
+    The arrays are saved without compression and at full precision, so that saving and loading a
+    result of millions of points takes milliseconds. The text summary remains human-readable.
+"""
+
+import os
+import json
+import contextlib
+import numpy as np
+
+
+RESULTS_VERSION = 1
+
+DATA_KEYS = ["time", "temperature", "rate", "extent"]
+
+DATA_SECTION_TITLE = "================ Data used for optimization"
+
+
+def get_data_path(summary_path):
+    """
+    Get the path of the binary results file associated with a text summary.
+
+    Parameters
+    ----------
+    summary_path : str
+        Path of the text summary.
+
+    Returns
+    -------
+    str
+        Path of the .npz file.
+    """
+    return os.path.splitext(summary_path)[0] + ".npz"
+
+
+def to_json_compatible(value):
+    """
+    Convert the values that JSON can't represent (arrays, numpy scalars, functions...).
+
+    Parameters
+    ----------
+    value : object
+        Value to convert.
+
+    Returns
+    -------
+    object
+        List for arrays, number for numpy scalars, name for functions and text otherwise.
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if callable(value) and hasattr(value, '__name__'):
+        return value.__name__
+    return str(value)
+
+
+@contextlib.contextmanager
+def open_atomically(path, mode='w'):
+    """
+    Open a file to replace it at once.
+
+    The content is written in a temporary file ('<path>.tmp'), which is renamed once it is complete, 
+    so that an interruption never leaves a partial file. The directory of the file is created if needed.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    mode : str, optional
+        Mode used to open the temporary file ('w' or 'wb'). Default is 'w'.
+
+    Yields
+    ------
+    file object
+        Temporary file to write.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + ".tmp"
+    try:
+        with open(temporary_path, mode) as file:
+            yield file
+    except BaseException:
+        # The previous version of the file is kept
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, path)
+
+
+def save_results(results_path, metadata, experiments, x=None, model_rate=None):
+    """
+    Save the results of an optimization (see open_atomically).
+
+    Parameters
+    ----------
+    results_path : str
+        Path of the .npz file.
+    metadata : dict
+        Description of the optimization and its results, see the module documentation.
+    experiments : dict
+        List of arrays of each file, for each key of DATA_KEYS.
+    x : numpy.ndarray, optional
+        Optimized parameters. Default is None.
+    model_rate : numpy.ndarray, optional
+        Rate of the model for all the files, concatenated. Default is None.
+    """
+    arrays = {key: np.concatenate([np.asarray(array, dtype=float) for array in experiments[key]]) for key in DATA_KEYS}
+    arrays['lengths'] = np.array([len(array) for array in experiments['time']], dtype=np.int64)
+    if x is not None:
+        arrays['x'] = np.asarray(x, dtype=float)
+    if model_rate is not None:
+        arrays['model_rate'] = np.asarray(model_rate, dtype=float)
+    metadata = dict(metadata, version=RESULTS_VERSION)
+
+    with open_atomically(results_path, 'wb') as file:
+        np.savez(file, metadata=np.array(json.dumps(metadata, default=to_json_compatible)), **arrays)
+
+
+def load_metadata(results_path):
+    """
+    Load only the description of an optimization, without its data.
+
+    Parameters
+    ----------
+    results_path : str
+        Path of the .npz file.
+
+    Returns
+    -------
+    dict
+        Description of the optimization and its results.
+    """
+    with np.load(results_path) as file:
+        return json.loads(str(file['metadata']))
+
+
+def load_results(results_path):
+    """
+    Load the results of an optimization.
+
+    Parameters
+    ----------
+    results_path : str
+        Path of the .npz file.
+
+    Returns
+    -------
+    dict
+        'metadata', 'x' (or None), and the list of arrays of each file for each key of DATA_KEYS
+        and 'model_rate' (or None).
+    """
+    with np.load(results_path) as file:
+        results = {"metadata": json.loads(str(file['metadata'])),
+                   "x": file['x'] if 'x' in file.files else None}
+        split_indices = np.cumsum(file['lengths'])[:-1]
+        for key in DATA_KEYS + ['model_rate']:
+            results[key] = np.split(file[key], split_indices) if key in file.files else None
+    return results
+
+
+def read_summary_header(summary_path):
+    """
+    Read a text summary up to the title of its data section, without reading the data.
+
+    Parameters
+    ----------
+    summary_path : str
+        Path of the text summary.
+
+    Returns
+    -------
+    tuple
+        Text of the summary up to the title of the data section (included), and position in bytes of the
+        data section in the file (None if the summary has no data section).
+    """
+    header_lines = []
+    data_offset = None
+    with open(summary_path, 'rb') as file:
+        for line in iter(file.readline, b''):
+            header_lines.append(line)
+            if line.startswith(DATA_SECTION_TITLE.encode()):
+                data_offset = file.tell()
+                break
+    return b''.join(header_lines).decode(errors='replace').replace('\r\n', '\n'), data_offset
+
+
+def read_summary_lines(summary_path, offset, number_of_lines=1000):
+    """
+    Read a page of lines of a text summary.
+
+    Parameters
+    ----------
+    summary_path : str
+        Path of the text summary.
+    offset : int
+        Position in bytes of the first line to read.
+    number_of_lines : int, optional
+        Maximum number of lines to read. Default is 1000.
+
+    Returns
+    -------
+    tuple
+        Text of the lines, and position in bytes of the next line (None at the end of the file).
+    """
+    lines = []
+    with open(summary_path, 'rb') as file:
+        file.seek(offset)
+        for line in iter(file.readline, b''):
+            lines.append(line)
+            if len(lines) == number_of_lines:
+                break
+        next_offset = file.tell()
+        is_end_of_file = not file.read(1)
+    text = b''.join(lines).decode(errors='replace').replace('\r\n', '\n')
+    return text, None if is_end_of_file else next_offset
+
+
+def load_summary_data(summary_path, data_offset):
+    """
+    Load the data used for an optimization, from the binary file of the summary or from its data rows.
+
+    The summaries written before the binary files contain a row of headers then one row per time step, with
+    the time, temperature, rate and extent of each file separated by tabs, and padded with NaN values. The rows
+    are parsed at once by numpy instead of line by line.
+
+    Parameters
+    ----------
+    summary_path : str
+        Path of the text summary.
+    data_offset : int
+        Position in bytes of the data section, see read_summary_header.
+
+    Returns
+    -------
+    dict
+        List of arrays of each file (without padding) for each key of DATA_KEYS.
+    """
+    with open(summary_path, 'rb') as file:
+        file.seek(data_offset)
+        first_line = file.readline().decode(errors='replace').strip()
+        if first_line.startswith("Data file: "):
+            data_path = os.path.join(os.path.dirname(summary_path), first_line.split(": ", 1)[1])
+            results = load_results(data_path)
+            return {key: results[key] for key in DATA_KEYS}
+        number_of_columns = len(first_line.split("\t"))
+        values = np.fromstring(file.read().decode(errors='replace'), sep=' ')
+
+    data = values[:len(values) - len(values) % number_of_columns].reshape(-1, number_of_columns)
+    experiments = {key: [] for key in DATA_KEYS}
+    for column in range(0, number_of_columns - number_of_columns % len(DATA_KEYS), len(DATA_KEYS)):
+        # The shorter files are padded with NaN values at the end
+        length = int(np.count_nonzero(~np.isnan(data[:, column])))
+        for index, key in enumerate(DATA_KEYS):
+            experiments[key].append(data[:length, column + index])
+    return experiments
+
+
+if __name__ == "__main__":
+    print("You've run the results_storage module.")
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+The scheduler module allows to run many analyses (datasets x models) in parallel processes.
+
+A manifest file (JSON, or TOML with Python 3.11 or later) lists the datasets and the models to fit.
+Each combination of a dataset and a model is a job, run by the pipeline module in its own process.
+
+Example of manifest:
+
+.. code-block:: json
+
+    {
+        "name": "formulations",
+        "settings": {"workers": 4, "timeout": 600, "retries": 1},
+        "datasets": [
+            {"name": "resin_A", "data": {"files": ["resin_A/5K.txt", "resin_A/10K.txt"], "has_header": true}},
+            {"name": "resin_B", "data": {"files": ["resin_B/5K.txt", "resin_B/10K.txt"], "has_header": true}}
+        ],
+        "models": [
+            {"name": "kamal", "optimization": {"rate": {"law": "rate_for_kamal", "initial_guess": {}}}},
+            {"name": "nth_order", "optimization": {"rate": {"law": "rate_for_nth_order", "initial_guess": {}}}}
+        ]
+    }
+
+Each dataset contains the sections 'data', 'interpolation' and 'isoconversional_analysis' of a configuration of the pipeline module,
+each model contains its section 'optimization'. Sections defined in the model replace the sections of the dataset.
+
+.. note::
+    The state of each job is saved in '<name>_jobs.json' in the output folder after each change.
+    If the batch is interrupted, running it again only runs the jobs that aren't done.
+"""
+
+import os
+import json
+import time as time_module
+import traceback
+import multiprocessing
+
+import pipeline
+import results_storage
+
+
+JOB_STATUSES = ["pending", "running", "done", "failed", "timeout"]
+
+
+def load_manifest(manifest_path):
+    """
+    Load a manifest file.
+
+    Parameters
+    ----------
+    manifest_path : str
+        Path of a .json or .toml manifest.
+
+    Returns
+    -------
+    dict
+        Manifest, with the paths of the data files made absolute.
+    """
+    extension = os.path.splitext(manifest_path)[1].lower()
+    if extension == '.json':
+        with open(manifest_path, 'r') as file:
+            manifest = json.load(file)
+    elif extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML manifests require Python 3.11 or later, please use a JSON file.")
+        with open(manifest_path, 'rb') as file:
+            manifest = tomllib.load(file)
+    else:
+        raise ValueError(f"Unsupported manifest: {manifest_path}. Use a .json or .toml file.")
+
+    manifest_directory = os.path.dirname(os.path.abspath(manifest_path))
+    manifest.setdefault('name', os.path.splitext(os.path.basename(manifest_path))[0])
+    for dataset in manifest['datasets']:
+        dataset['data']['files'] = [os.path.join(manifest_directory, file_path) for file_path in dataset['data']['files']]
+    return manifest
+
+
+def create_jobs(manifest):
+    """
+    Create the configuration of each combination of a dataset and a model.
+
+    Parameters
+    ----------
+    manifest : dict
+        Manifest, see load_manifest.
+
+    Returns
+    -------
+    dict
+        Configuration of each job (see the pipeline module), by name of job ('<dataset>__<model>').
+    """
+    jobs = {}
+    for dataset in manifest['datasets']:
+        models = manifest.get('models') or [{"name": "no_model"}]
+        for model in models:
+            config = {key: value for key, value in dataset.items() if key != 'name'}
+            config.update({key: value for key, value in model.items() if key != 'name'})
+            config['name'] = f"{dataset['name']}__{model['name']}"
+            jobs[config['name']] = config
+    return jobs
+
+
+def load_state(state_path, job_names):
+    """
+    Load the state of the jobs, or create it.
+
+    Jobs that were running when the batch was interrupted are set back to pending.
+
+    Parameters
+    ----------
+    state_path : str
+        Path of the state file.
+    job_names : list
+        Names of the jobs of the manifest.
+
+    Returns
+    -------
+    dict
+        State of each job: status, number of attempts, error, path of the results and duration.
+    """
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path, 'r') as file:
+            state = json.load(file)
+    for job_name in job_names:
+        job_state = state.setdefault(job_name, {"status": "pending", "attempts": 0, "error": None, "results_path": None, "time": None})
+        if job_state['status'] == "running":
+            job_state['status'] = "pending"
+    return state
+
+
+def save_state(state, state_path):
+    """
+    Save the state of the jobs (see results_storage.open_atomically).
+
+    Parameters
+    ----------
+    state : dict
+        State of each job.
+    state_path : str
+        Path of the state file.
+    """
+    with results_storage.open_atomically(state_path) as file:
+        json.dump(state, file, indent=2)
+
+
+def run_job(config, output_directory, connection):
+    """
+    Run one job and send its outcome through a pipe. This function is the target of the job processes.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration of the job.
+    output_directory : str
+        Folder where the results are written.
+    connection : multiprocessing.connection.Connection
+        End of the pipe used to send ('done', path of the results) or ('failed', traceback).
+    """
+    try:
+        results = pipeline.run_pipeline(config, output_directory)
+        connection.send(("done", results['results_path']))
+    except Exception:
+        connection.send(("failed", traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+class BatchScheduler:
+    """
+    Run the jobs of a manifest in a pool of processes, with timeouts and retries.
+
+    Each job runs in its own process, so that a job exceeding its timeout can be terminated
+    without affecting the others.
+
+    Attributes
+    ----------
+    jobs : dict
+        Configuration of each job, by name.
+    output_directory : str
+        Folder where the results and the state file are written.
+    workers : int
+        Maximum number of jobs running at the same time.
+    timeout : float or None
+        Maximum duration of a job, in seconds.
+    retries : int
+        Number of new attempts of a job that failed or exceeded its timeout.
+    state_path : str
+        Path of the state file.
+    state : dict
+        State of each job.
+    """
+    def __init__(self, manifest, output_directory, workers=None, timeout=None, retries=None, poll_interval=0.1):
+        settings = manifest.get('settings', {})
+        self.jobs = create_jobs(manifest)
+        self.output_directory = output_directory
+        self.workers = workers if workers is not None else settings.get('workers', os.cpu_count() or 1)
+        self.timeout = timeout if timeout is not None else settings.get('timeout')
+        self.retries = retries if retries is not None else settings.get('retries', 0)
+        self.poll_interval = poll_interval
+        os.makedirs(output_directory, exist_ok=True)
+        self.state_path = os.path.join(output_directory, f"{manifest['name']}_jobs.json")
+        self.state = load_state(self.state_path, list(self.jobs))
+        self.running = {}
+
+    def get_jobs_to_run(self):
+        """
+        Get the jobs that aren't done and still have attempts left.
+
+        Returns
+        -------
+        list
+            Names of the jobs to run, in the order of the manifest.
+        """
+        return [job_name for job_name, job_state in self.state.items()
+                if job_name in self.jobs and job_state['status'] != "done" and job_state['attempts'] <= self.retries]
+
+    def start_job(self, job_name):
+        """
+        Start the process of a job.
+
+        Parameters
+        ----------
+        job_name : str
+            Name of the job.
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=run_job, args=(self.jobs[job_name], self.output_directory, sender), daemon=True)
+        process.start()
+        sender.close()
+        self.running[job_name] = (process, receiver, time_module.time())
+        job_state = self.state[job_name]
+        job_state['status'] = "running"
+        job_state['attempts'] += 1
+        save_state(self.state, self.state_path)
+
+    def finish_job(self, job_name, status, error=None, results_path=None):
+        """
+        Update the state of a job that stopped and release its process.
+
+        Parameters
+        ----------
+        job_name : str
+            Name of the job.
+        status : str
+            'done', 'failed' or 'timeout'.
+        error : str, optional
+            Traceback or description of the error. Default is None.
+        results_path : str, optional
+            Path of the results. Default is None.
+        """
+        process, receiver, start_time = self.running.pop(job_name)
+        receiver.close()
+        process.join(timeout=1)
+        job_state = self.state[job_name]
+        job_state.update({"status": status, "error": error, "results_path": results_path, "time": time_module.time() - start_time})
+        # A job with attempts left is run again
+        if status != "done" and job_state['attempts'] <= self.retries:
+            job_state['status'] = "pending"
+        save_state(self.state, self.state_path)
+        print(f"{job_name}: {status} (attempt {job_state['attempts']}, {job_state['time']:.1f} s)")
+
+    def check_running_jobs(self):
+        """Update the state of the running jobs that finished, failed or exceeded the timeout."""
+        for job_name, (process, receiver, start_time) in list(self.running.items()):
+            if receiver.poll():
+                try:
+                    status, message = receiver.recv()
+                except EOFError:
+                    status, message = "failed", f"The process of the job stopped with exit code {process.exitcode}."
+                if status == "done":
+                    self.finish_job(job_name, "done", results_path=message)
+                else:
+                    self.finish_job(job_name, "failed", error=message)
+            elif not process.is_alive():
+                self.finish_job(job_name, "failed", error=f"The process of the job stopped with exit code {process.exitcode}.")
+            elif self.timeout is not None and time_module.time() - start_time > self.timeout:
+                process.terminate()
+                self.finish_job(job_name, "timeout", error=f"The job exceeded the timeout of {self.timeout} s.")
+
+    def run(self):
+        """
+        Run all the jobs that aren't done.
+
+        Returns
+        -------
+        dict
+            State of each job.
+        """
+        try:
+            while True:
+                self.check_running_jobs()
+                pending_jobs = [job_name for job_name in self.get_jobs_to_run() if job_name not in self.running]
+                if not pending_jobs and not self.running:
+                    break
+                for job_name in pending_jobs[:max(self.workers - len(self.running), 0)]:
+                    self.start_job(job_name)
+                time_module.sleep(self.poll_interval)
+        finally:
+            # Jobs still running (e.g. after a KeyboardInterrupt) are stopped and will be run again when resuming
+            for process, receiver, _ in self.running.values():
+                process.terminate()
+                receiver.close()
+            save_state(self.state, self.state_path)
+        return self.state
+
+
+def run_batch(manifest_path, output_directory, workers=None, timeout=None, retries=None):
+    """
+    Run all the jobs of a manifest, resuming a previous batch if its state file exists.
+
+    Parameters
+    ----------
+    manifest_path : str
+        Path of the manifest.
+    output_directory : str
+        Folder where the results and the state file are written.
+    workers : int, optional
+        Number of processes. Default is None (value of the manifest, or number of CPUs).
+    timeout : float, optional
+        Maximum duration of a job, in seconds. Default is None (value of the manifest, or no timeout).
+    retries : int, optional
+        Number of new attempts of a failed job. Default is None (value of the manifest, or 0).
+
+    Returns
+    -------
+    dict
+        State of each job.
+    """
+    scheduler = BatchScheduler(load_manifest(manifest_path), output_directory, workers, timeout, retries)
+    return scheduler.run()
+
+
+if __name__ == "__main__":
+    print("You've run the scheduler module.")
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+The smoothing module allows to reduce the noise of experimental data before interpolation.
+
+Noisy data (e.g. FTIR or rheology experiments) is amplified by cubic splines and by the logarithm
+of the rate used in the Friedman method: rates become negative or spike, which also slows down optimizers.
+The smoothing is applied after the data extraction and before the interpolation.
+
+Two methods are available:
+
+* a Savitzky-Golay filter, applied to all experiments at once, with a window length selected
+  automatically for each experiment by generalized cross-validation (GCV)
+* a smoothing spline (scipy.interpolate.make_smoothing_spline), with a smoothing parameter
+  selected automatically by GCV for each experiment
+
+.. note::
+    The time spent in each stage of the smoothing is measured and stored in the returned report.
+"""
+
+import time as time_module
+import numpy as np
+from scipy import signal, interpolate
+
+
+class SmoothingReport:
+    """
+    Summary of the smoothing of a set of experiments.
+
+    Attributes
+    ----------
+    method : str
+        Smoothing method.
+    number_of_points : int
+        Total number of points smoothed.
+    window_lengths : list
+        Window length used for each experiment (Savitzky-Golay only).
+    timings : dict
+        Time spent in each stage of the smoothing, in seconds.
+    """
+    def __init__(self, method):
+        self.method = method
+        self.number_of_points = 0
+        self.window_lengths = []
+        self.timings = {}
+
+    @property
+    def total_time(self):
+        """float: Total time spent in the smoothing, in seconds."""
+        return sum(self.timings.values())
+
+    def to_text(self):
+        """
+        Format the report.
+
+        Returns
+        -------
+        str
+            Summary of the smoothing.
+        """
+        stages = ", ".join(f"{stage}: {elapsed * 1000:.1f} ms" for stage, elapsed in self.timings.items())
+        text = f"Smoothing ({self.method}): {self.number_of_points} points in {self.total_time * 1000:.1f} ms ({stages})"
+        if self.window_lengths:
+            text += f", window lengths: {', '.join(str(window_length) for window_length in self.window_lengths)}"
+        return text
+
+
+def get_segments(arrays):
+    """
+    Concatenate experiments and get the position of each experiment.
+
+    Parameters
+    ----------
+    arrays : list
+        List of arrays.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - numpy.ndarray: Values of all experiments, one after the other.
+            - numpy.ndarray: Index of the first point of each experiment.
+            - numpy.ndarray: Number of points of each experiment.
+    """
+    lengths = np.array([len(array) for array in arrays])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return np.concatenate(arrays).astype(float), starts, lengths
+
+
+def get_candidate_window_lengths(lengths, polyorder, number_of_candidates=12):
+    """
+    Get odd window lengths to test for the Savitzky-Golay filter.
+
+    Parameters
+    ----------
+    lengths : numpy.ndarray
+        Number of points of each experiment.
+    polyorder : int
+        Order of the polynomial of the filter.
+    number_of_candidates : int, optional
+        Maximum number of window lengths. Default is 12.
+
+    Returns
+    -------
+    numpy.ndarray
+        Increasing odd window lengths, from polyorder + 2 to a fifth of the longest experiment.
+    """
+    minimum = polyorder + 2 + (polyorder + 1) % 2
+    maximum = max(minimum, int(np.max(lengths)) // 5)
+    window_lengths = np.geomspace(minimum, maximum, number_of_candidates).astype(int)
+    window_lengths += 1 - window_lengths % 2
+    return np.unique(window_lengths)
+
+
+def savitzky_golay_filter_batch(flat_values, starts, lengths, window_length, polyorder):
+    """
+    Apply a Savitzky-Golay filter with the same window length to all experiments.
+
+    The filter is applied to all experiments with one convolution, then the first and last
+    points of each experiment are replaced by the values of a polynomial fitted to its own edges
+    (equivalent to scipy.signal.savgol_filter with mode='interp').
+
+    Parameters
+    ----------
+    flat_values : numpy.ndarray
+        Values of all experiments, one after the other.
+    starts : numpy.ndarray
+        Index of the first point of each experiment.
+    lengths : numpy.ndarray
+        Number of points of each experiment.
+    window_length : int
+        Odd window length of the filter.
+    polyorder : int
+        Order of the polynomial of the filter.
+
+    Returns
+    -------
+    numpy.ndarray
+        Smoothed values. Experiments shorter than the window are filtered with the longest possible window.
+    """
+    coefficients = signal.savgol_coeffs(window_length, polyorder)
+    smoothed_values = np.convolve(flat_values, coefficients, mode='same')
+
+    half_window = window_length // 2
+    for start, length in zip(starts, lengths):
+        values = flat_values[start:start + length]
+        if length >= window_length:
+            smoothed_values[start:start + half_window] = signal.savgol_filter(
+                values[:window_length], window_length, polyorder, mode='interp')[:half_window]
+            smoothed_values[start + length - half_window:start + length] = signal.savgol_filter(
+                values[-window_length:], window_length, polyorder, mode='interp')[-half_window:]
+        else:
+            short_window_length = length - 1 + length % 2
+            if short_window_length > polyorder:
+                smoothed_values[start:start + length] = signal.savgol_filter(values, short_window_length, polyorder, mode='interp')
+            else:
+                smoothed_values[start:start + length] = values
+    return smoothed_values
+
+
+def savitzky_golay_smoothing(arrays, window_length=None, polyorder=3):
+    """
+    Smooth experiments with a Savitzky-Golay filter.
+
+    If no window length is given, the window length of each experiment is selected by
+    generalized cross-validation: GCV = mean(residuals**2) / (1 - h)**2, where h is the weight
+    of the central point of the filter. Each candidate window is applied to all experiments at once.
+
+    Parameters
+    ----------
+    arrays : list
+        List of arrays to smooth, sampled at regular intervals.
+    window_length : int, optional
+        Odd window length of the filter. Default is None (automatic selection).
+    polyorder : int, optional
+        Order of the polynomial of the filter. Default is 3.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - list: Smoothed arrays.
+            - list: Window length used for each experiment.
+    """
+    flat_values, starts, lengths = get_segments(arrays)
+
+    if window_length is not None:
+        smoothed_values = savitzky_golay_filter_batch(flat_values, starts, lengths, window_length, polyorder)
+        window_lengths = [window_length] * len(arrays)
+    else:
+        experiment_ids = np.repeat(np.arange(len(arrays)), lengths)
+        best_scores = np.full(len(arrays), np.inf)
+        smoothed_values = flat_values.copy()
+        window_lengths = [None] * len(arrays)
+        for candidate in get_candidate_window_lengths(lengths, polyorder):
+            candidate_values = savitzky_golay_filter_batch(flat_values, starts, lengths, candidate, polyorder)
+            central_weight = signal.savgol_coeffs(candidate, polyorder)[candidate // 2]
+            residuals = np.bincount(experiment_ids, weights=(flat_values - candidate_values)**2, minlength=len(arrays))
+            scores = residuals / lengths / (1 - central_weight)**2
+            # Windows longer than an experiment are not considered for it
+            scores[lengths < candidate] = np.inf
+
+            is_better = scores < best_scores
+            best_scores[is_better] = scores[is_better]
+            is_better_point = is_better[experiment_ids]
+            smoothed_values[is_better_point] = candidate_values[is_better_point]
+            for index in np.flatnonzero(is_better):
+                window_lengths[index] = int(candidate)
+
+    smoothed_arrays = np.split(smoothed_values, np.cumsum(lengths)[:-1])
+    return smoothed_arrays, window_lengths
+
+
+def smoothing_spline(times, arrays, lam=None):
+    """
+    Smooth experiments with a cubic smoothing spline.
+
+    Parameters
+    ----------
+    times : list
+        List of strictly increasing time arrays.
+    arrays : list
+        List of arrays to smooth.
+    lam : float, optional
+        Smoothing parameter. Default is None (selected for each experiment by generalized cross-validation).
+
+    Returns
+    -------
+    list
+        Smoothed arrays.
+    """
+    return [interpolate.make_smoothing_spline(time, values, lam=lam)(time) for time, values in zip(times, arrays)]
+
+
+def enforce_increase(arrays):
+    """
+    Make each array non-decreasing, replacing each value by the running maximum of its experiment.
+
+    Parameters
+    ----------
+    arrays : list
+        List of arrays (e.g. extents of reaction).
+
+    Returns
+    -------
+    list
+        Non-decreasing arrays.
+    """
+    flat_values, _, lengths = get_segments(arrays)
+    # An offset larger than the span of the values keeps the experiments independent in one accumulation
+    offset = np.ptp(flat_values) + 1.0
+    experiment_offsets = np.repeat(offset * np.arange(len(arrays)), lengths)
+    increasing_values = np.maximum.accumulate(flat_values + experiment_offsets) - experiment_offsets
+    return np.split(increasing_values, np.cumsum(lengths)[:-1])
+
+
+def smooth_experiments(times_lists, temperatures_lists, rates_lists, extents_lists, method='savgol', window_length=None, polyorder=3, lam=None, non_negative_rates=True):
+    """
+    Smooth the rate and extent of reaction of multiple experiments.
+
+    Parameters
+    ----------
+    times_lists : list
+        List of time arrays.
+    temperatures_lists : list
+        List of temperature arrays (returned unchanged).
+    rates_lists : list
+        List of rate arrays.
+    extents_lists : list
+        List of extent arrays.
+    method : str, optional
+        'savgol' (Savitzky-Golay filter) or 'spline' (smoothing spline). Default is 'savgol'.
+    window_length : int, optional
+        Window length of the Savitzky-Golay filter. Default is None (automatic selection).
+    polyorder : int, optional
+        Order of the polynomial of the Savitzky-Golay filter. Default is 3.
+    lam : float, optional
+        Smoothing parameter of the smoothing spline. Default is None (automatic selection).
+    non_negative_rates : bool, optional
+        Whether to replace negative smoothed rates by 0. Default is True.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+            - list: Time arrays.
+            - list: Temperature arrays.
+            - list: Smoothed rate arrays.
+            - list: Smoothed and non-decreasing extent arrays.
+            - SmoothingReport: Timings and parameters of the smoothing.
+    """
+    report = SmoothingReport(method)
+    report.number_of_points = sum(len(time) for time in times_lists)
+
+    start_time = time_module.perf_counter()
+    if method == 'savgol':
+        new_rates, report.window_lengths = savitzky_golay_smoothing(rates_lists, window_length, polyorder)
+        new_extents, _ = savitzky_golay_smoothing(extents_lists, window_length, polyorder)
+    elif method == 'spline':
+        new_rates = smoothing_spline(times_lists, rates_lists, lam)
+        new_extents = smoothing_spline(times_lists, extents_lists, lam)
+    else:
+        raise ValueError(f"Unknown smoothing method: {method}. Use 'savgol' or 'spline'.")
+    report.timings[method] = time_module.perf_counter() - start_time
+
+    start_time = time_module.perf_counter()
+    if non_negative_rates:
+        new_rates = [np.maximum(rate, 0) for rate in new_rates]
+    new_extents = enforce_increase(new_extents)
+    report.timings['constraints'] = time_module.perf_counter() - start_time
+
+    return list(times_lists), list(temperatures_lists), new_rates, new_extents, report
+
+
+if __name__ == "__main__":
+    print("You've run the smoothing module.")
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+The warm_start module allows to start an optimization from the results of previous optimizations.
+
+The previous optimizations are looked up in the results database (see results_database). A previous
+run is reused if its laws (rate, vitrification, coupling and Tg) and its parameters are the same, and if its
+data are similar: for each current file, the distance to the closest file of the run is 0 if their data
+fingerprints are the same, and otherwise the largest relative difference of their minimum temperature,
+maximum temperature and duration. From the closest runs, the warm start proposes:
+
+* the initial guess: optimized parameters of the closest run (lowest cost among the closest)
+* tightened bounds: range of the optimized parameters of the runs, widened by a margin and kept within the given bounds
+* the initial population of differential evolution: optimized parameters of the runs, completed by a
+  Latin hypercube sampling of the tightened bounds
+
+A warm start keeps the laws, the parameters and the fingerprint of the data it was proposed for
+(see get_warm_start_context), so that it is only used for an optimization of the same problem (see WarmStart.matches).
+
+The runs started from a warm start are recorded in the database with the run they started from, so that
+get_warm_start_savings can compare their number of evaluations and time with the runs started cold.
+
+.. note::
+    The global optimization methods without bounds (e.g. basinhopping) only use the initial guess.
+"""
+
+import numpy as np
+
+import results_database
+
+
+LAW_SECTIONS = ["rate", "vitrification", "coupling", "tg"]
+
+
+class WarmStart:
+    """
+    Starting point of an optimization proposed from previous optimizations.
+
+    Attributes
+    ----------
+    run_ids : list
+        Identifiers of the previous runs used, from the closest.
+    distances : list
+        Distance between the data of each run and the current data.
+    initial_guess : numpy.ndarray
+        Optimized parameters of the closest run.
+    seeds : numpy.ndarray
+        Optimized parameters of each run (one row per run).
+    bounds : list or None
+        Tightened bounds (min, max) of each parameter, or None if no bounds were given.
+    context : dict or None
+        Laws, parameter names and data fingerprint the warm start was proposed for (see get_warm_start_context).
+    """
+    def __init__(self, run_ids, distances, seeds, bounds=None, context=None):
+        self.run_ids = list(run_ids)
+        self.distances = list(distances)
+        self.seeds = np.asarray(seeds, dtype=float)
+        self.initial_guess = self.seeds[0].copy()
+        self.bounds = bounds
+        self.context = context
+
+    def matches(self, laws, parameter_names, experiments):
+        """
+        Check that the warm start was proposed for the same laws, parameters and data.
+
+        Parameters
+        ----------
+        laws : dict
+            Name of the law of each section ('rate', 'vitrification', 'coupling', 'tg'), or None.
+        parameter_names : dict
+            Names of the optimized parameters of each section ('rate', 'vitrification', 'coupling').
+        experiments : dict
+            List of arrays of each file, for each key of results_storage.DATA_KEYS.
+
+        Returns
+        -------
+        bool
+            True if the problem is the one the warm start was proposed for.
+        """
+        return self.context == get_warm_start_context(laws, parameter_names, experiments)
+
+    def to_dict(self):
+        """
+        Describe the warm start, to save it with the results.
+
+        Returns
+        -------
+        dict
+            Closest run, all the runs used and their distances.
+        """
+        return {"run_id": self.run_ids[0], "run_ids": self.run_ids, "distances": self.distances}
+
+
+def get_warm_start_context(laws, parameter_names, experiments):
+    """
+    Describe the problem a warm start is proposed for.
+
+    Parameters
+    ----------
+    laws : dict
+        Name of the law of each section ('rate', 'vitrification', 'coupling', 'tg'), or None.
+    parameter_names : dict
+        Names of the optimized parameters of each section ('rate', 'vitrification', 'coupling').
+    experiments : dict
+        List of arrays of each file, for each key of results_storage.DATA_KEYS.
+
+    Returns
+    -------
+    dict
+        Laws, parameter names and data fingerprint of each file.
+    """
+    return {"laws": {section: laws.get(section) or None for section in LAW_SECTIONS},
+            "parameter_names": {section: list(names) for section, names in parameter_names.items() if names},
+            "data_fingerprints": [file["data_fingerprint"] for file in results_database.describe_files(experiments)]}
+
+
+def get_file_distance(file, other_file):
+    """
+    Compute the distance between the data of two files.
+
+    Parameters
+    ----------
+    file : dict
+        Data fingerprint, minimum and maximum temperature and duration of a file (see results_database).
+    other_file : dict
+        Same description for the other file.
+
+    Returns
+    -------
+    float
+        0 if the data are the same, otherwise the largest relative difference of the temperatures and durations.
+    """
+    if file["data_fingerprint"] == other_file["data_fingerprint"]:
+        return 0.0
+    differences = []
+    for key in ("minimum_temperature", "maximum_temperature", "duration"):
+        if file[key] is None or other_file[key] is None:
+            return np.inf
+        scale = max(abs(file[key]), abs(other_file[key]), 1e-12)
+        differences.append(abs(file[key] - other_file[key]) / scale)
+    return max(differences)
+
+
+def find_previous_runs(database_path, laws, parameter_names, experiments, maximum_distance=0.1, maximum_number_of_runs=10):
+    """
+    Find the previous optimizations of the same laws and parameters on similar data.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the results database.
+    laws : dict
+        Name of the law of each section ('rate', 'vitrification', 'coupling', 'tg'), or None.
+    parameter_names : dict
+        Names of the optimized parameters of each section ('rate', 'vitrification', 'coupling').
+    experiments : dict
+        List of arrays of each file, for each key of results_storage.DATA_KEYS.
+    maximum_distance : float, optional
+        Maximum distance between the data of a run and the current data. Default is 0.1.
+    maximum_number_of_runs : int, optional
+        Maximum number of runs returned. Default is 10.
+
+    Returns
+    -------
+    list
+        'run_id', 'distance', 'fun' and optimized parameters 'x' of each run, sorted by distance then by cost.
+    """
+    current_files = results_database.describe_files(experiments)
+    connection = results_database.connect(database_path)
+    runs = connection.execute("SELECT id, fun FROM runs WHERE rate_law IS ? AND vitrification_law IS ? AND coupling_law IS ? AND tg_law IS ? "
+                              "AND cancelled = 0 AND fun IS NOT NULL",
+                              tuple(laws.get(section) or None for section in LAW_SECTIONS)).fetchall()
+    files_of_runs = {}
+    for row in connection.execute(f"SELECT * FROM files WHERE run_id IN ({', '.join('?' * len(runs))})", [run["id"] for run in runs]):
+        files_of_runs.setdefault(row["run_id"], []).append(dict(row))
+    connection.close()
+
+    previous_runs = []
+    for run in runs:
+        files = files_of_runs.get(run["id"], [])
+        if not files or not current_files:
+            continue
+        distance = float(np.mean([min(get_file_distance(file, other_file) for other_file in files) for file in current_files]))
+        if distance > maximum_distance:
+            continue
+        parameters = results_database.get_run_parameters(database_path, run["id"])
+        if any(list(parameters.get(section, {})) != list(names) for section, names in parameter_names.items()):
+            continue
+        x = [parameters[section][name] for section, names in parameter_names.items() for name in names]
+        if not np.all(np.isfinite(x)):
+            continue
+        previous_runs.append({"run_id": run["id"], "distance": distance, "fun": run["fun"], "x": np.array(x)})
+    previous_runs.sort(key=lambda previous_run: (previous_run["distance"], previous_run["fun"]))
+    return previous_runs[:maximum_number_of_runs]
+
+
+def get_tightened_bounds(seeds, bounds=None, bound_margin=0.5):
+    """
+    Compute bounds around the optimized parameters of previous runs.
+
+    Parameters
+    ----------
+    seeds : numpy.ndarray
+        Optimized parameters of each run (one row per run).
+    bounds : list, optional
+        Bounds (min, max) of each parameter that the tightened bounds can't exceed. Default is None.
+    bound_margin : float, optional
+        Margin added on each side, relative to the largest of the range and the magnitude of the parameters. Default is 0.5.
+
+    Returns
+    -------
+    list
+        Bounds (min, max) of each parameter.
+    """
+    seeds = np.atleast_2d(seeds)
+    minimums, maximums = seeds.min(axis=0), seeds.max(axis=0)
+    margins = bound_margin * np.maximum(maximums - minimums, np.abs(seeds).max(axis=0))
+    tightened_bounds = []
+    for index, (lower, upper) in enumerate(zip(minimums - margins, maximums + margins)):
+        if bounds is not None:
+            lower, upper = max(lower, bounds[index][0]), min(upper, bounds[index][1])
+            if lower >= upper:
+                # The previous results are outside the given bounds
+                lower, upper = bounds[index]
+        elif lower == upper:
+            lower, upper = lower - 1, upper + 1
+        tightened_bounds.append((float(lower), float(upper)))
+    return tightened_bounds
+
+
+def get_initial_population(bounds, seeds, population_size, seed=None):
+    """
+    Create the initial population of differential evolution from previous results.
+
+    Parameters
+    ----------
+    bounds : list
+        Bounds (min, max) of each parameter.
+    seeds : numpy.ndarray
+        Parameters included in the population (one row per run), clipped to the bounds.
+    population_size : int
+        Number of individuals (at least 5, see scipy.optimize.differential_evolution).
+    seed : int, optional
+        Seed of the random sampling. Default is None.
+
+    Returns
+    -------
+    numpy.ndarray
+        Population (one row per individual): the seeds, then a Latin hypercube sampling of the bounds.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    seeds = np.clip(np.atleast_2d(seeds), bounds[:, 0], bounds[:, 1])[:population_size]
+    population_size = max(population_size, 5)
+    number_of_samples = population_size - len(seeds)
+    rng = np.random.default_rng(seed)
+    # One sample in each interval of equal width, in a random order for each parameter
+    samples = (np.argsort(rng.random((number_of_samples, len(bounds))), axis=0) + rng.random((number_of_samples, len(bounds)))) / max(number_of_samples, 1)
+    samples = bounds[:, 0] + samples * (bounds[:, 1] - bounds[:, 0])
+    return np.vstack((seeds, samples))
+
+
+def propose_warm_start(database_path, laws, parameter_names, experiments, bounds=None, bound_margin=0.5,
+                       maximum_distance=0.1, maximum_number_of_runs=10):
+    """
+    Propose a starting point from the previous optimizations of the same laws on similar data.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the results database.
+    laws : dict
+        Name of the law of each section ('rate', 'vitrification', 'coupling', 'tg'), or None.
+    parameter_names : dict
+        Names of the optimized parameters of each section ('rate', 'vitrification', 'coupling').
+    experiments : dict
+        List of arrays of each file, for each key of results_storage.DATA_KEYS.
+    bounds : list, optional
+        Bounds (min, max) of each parameter. Default is None.
+    bound_margin : float, optional
+        Margin of the tightened bounds, see get_tightened_bounds. Default is 0.5.
+    maximum_distance : float, optional
+        Maximum distance between the data of a run and the current data, see find_previous_runs. Default is 0.1.
+    maximum_number_of_runs : int, optional
+        Maximum number of runs used. Default is 10.
+
+    Returns
+    -------
+    WarmStart or None
+        Starting point, or None if no previous run is similar.
+    """
+    previous_runs = find_previous_runs(database_path, laws, parameter_names, experiments, maximum_distance, maximum_number_of_runs)
+    if not previous_runs:
+        return None
+    seeds = np.array([previous_run["x"] for previous_run in previous_runs])
+    return WarmStart([previous_run["run_id"] for previous_run in previous_runs],
+                     [previous_run["distance"] for previous_run in previous_runs],
+                     seeds,
+                     get_tightened_bounds(seeds, bounds, bound_margin) if bounds is not None else None,
+                     get_warm_start_context(laws, parameter_names, experiments))
+
+
+def apply_warm_start(method, args_dict, warm_start, seed=None, tighten_bounds=True):
+    """
+    Use a warm start in the arguments of a global optimization.
+
+    Parameters
+    ----------
+    method : str
+        Name of the global optimization method.
+    args_dict : dict
+        Arguments of the method.
+    warm_start : WarmStart
+        Starting point, see propose_warm_start.
+    seed : int, optional
+        Seed of the sampling of the initial population of differential evolution. Default is None.
+    tighten_bounds : bool, optional
+        If False, the bounds of the arguments are kept (e.g. if they were already replaced). Default is True.
+
+    Returns
+    -------
+    dict
+        Arguments with the tightened bounds and, for differential evolution, the initial population.
+    """
+    args_dict = dict(args_dict or {})
+    if tighten_bounds and warm_start.bounds is not None and 'bounds' in args_dict:
+        args_dict['bounds'] = warm_start.bounds
+    if method == 'differential_evolution' and args_dict.get('bounds') is not None:
+        population_size = int(args_dict.get('popsize', 15)) * len(args_dict['bounds'])
+        args_dict['init'] = get_initial_population(args_dict['bounds'], warm_start.seeds, population_size, seed)
+    return args_dict
+
+
+def get_warm_start_savings(database_path):
+    """
+    Compare the optimizations started from a warm start with the optimizations started cold.
+
+    Parameters
+    ----------
+    database_path : str
+        Path of the results database.
+
+    Returns
+    -------
+    list
+        For each combination of laws and optimization methods with both kinds of runs (dict): the number of runs,
+        mean number of evaluations and mean time of each kind, and the relative savings of evaluations and time.
+    """
+    groups = ["rate_law", "vitrification_law", "coupling_law", "tg_law", "global_optimization", "local_optimization"]
+    connection = results_database.connect(database_path)
+    rows = connection.execute(f"SELECT {', '.join(groups)}, warm_start_run_id IS NOT NULL AS is_warm_start, COUNT(*) AS number_of_runs, "
+                              "AVG(nfev) AS mean_nfev, AVG(total_optimization_time) AS mean_optimization_time "
+                              f"FROM runs WHERE cancelled = 0 GROUP BY {', '.join(groups)}, is_warm_start").fetchall()
+    connection.close()
+    runs_by_group = {}
+    for row in rows:
+        runs_by_group.setdefault(tuple(row[group] for group in groups), {})["warm" if row["is_warm_start"] else "cold"] = row
+    savings = []
+    for group, runs in runs_by_group.items():
+        if "warm" not in runs or "cold" not in runs:
+            continue
+        cold, warm = runs["cold"], runs["warm"]
+        saving = dict(zip(groups, group))
+        saving.update({"number_of_cold_runs": cold["number_of_runs"], "number_of_warm_runs": warm["number_of_runs"],
+                       "mean_nfev_cold": cold["mean_nfev"], "mean_nfev_warm": warm["mean_nfev"],
+                       "mean_optimization_time_cold": cold["mean_optimization_time"],
+                       "mean_optimization_time_warm": warm["mean_optimization_time"],
+                       "evaluation_savings": 1 - warm["mean_nfev"] / cold["mean_nfev"] if cold["mean_nfev"] else None,
+                       "time_savings": 1 - warm["mean_optimization_time"] / cold["mean_optimization_time"] if cold["mean_optimization_time"] else None})
+        savings.append(saving)
+    return savings
+
+
+if __name__ == "__main__":
+    print("You've run the warm_start module.")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules of kinopt/src import each other by name (e.g. 'import data_extraction'), as when the GUI is launched from this folder
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
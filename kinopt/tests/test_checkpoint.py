@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from kinopt.src import checkpoint
+from kinopt.src import pipeline
+
+
+def rosenbrock(x):
+    """Cost function with a narrow valley, slow to optimize."""
+    return np.sum(100.0 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
+
+
+def run_differential_evolution(checkpoint_path, maxiter, resume=False):
+    """Run differential evolution on the Rosenbrock function with a checkpoint saved at each generation."""
+    optimization_checkpoint = checkpoint.OptimizationCheckpoint(checkpoint_path, interval=0, resume=resume)
+    global_optimization_args_dict = {"bounds": [(-2, 2)] * 3, "maxiter": maxiter, "seed": 1, "polish": False, "tol": 0}
+    return pipeline.run_optimization(rosenbrock, np.zeros(3), 'differential_evolution', global_optimization_args_dict,
+                                     '', None, (), optimization_checkpoint=optimization_checkpoint)
+
+
+def test_resumed_differential_evolution_matches_uninterrupted_run(tmp_path):
+    """Test that stopping differential evolution and resuming it from the checkpoint gives the same result as one run."""
+    uninterrupted_result = run_differential_evolution(str(tmp_path / "uninterrupted.json"), 20)
+    
+    checkpoint_path = str(tmp_path / "interrupted.json")
+    run_differential_evolution(checkpoint_path, 8)
+    state = checkpoint.load_checkpoint(checkpoint_path)
+    assert state['nit'] == 8
+    assert state['population'].shape == state['population_energies'].shape + (3,)
+    resumed_result = run_differential_evolution(checkpoint_path, 20, resume=True)
+    
+    assert resumed_result.nit == 20
+    assert np.allclose(resumed_result.x, uninterrupted_result.x)
+    assert np.isclose(resumed_result.fun, uninterrupted_result.fun)
+
+
+def test_resumed_basinhopping_keeps_best_minimum(tmp_path):
+    """Test that basinhopping resumes with the remaining iterations and keeps the best minimum found before."""
+    checkpoint_path = str(tmp_path / "basinhopping.json")
+    local_optimization_args_dict = {"method": "Nelder-Mead", "options": {"maxiter": 50}}
+    first_result = pipeline.run_optimization(rosenbrock, np.zeros(3), 'basinhopping', {"niter": 3, "seed": 2}, 'Nelder-Mead', local_optimization_args_dict, (),
+                                             optimization_checkpoint=checkpoint.OptimizationCheckpoint(checkpoint_path, interval=0))
+    
+    resumed_result = pipeline.run_optimization(rosenbrock, np.zeros(3), 'basinhopping', {"niter": 5, "seed": 2}, 'Nelder-Mead', local_optimization_args_dict, (),
+                                               optimization_checkpoint=checkpoint.OptimizationCheckpoint(checkpoint_path, interval=0, resume=True))
+    
+    assert first_result.nit == 3
+    assert resumed_result.nit == 5
+    assert resumed_result.fun <= first_result.fun
+
+
+def test_resume_with_another_method_raises(tmp_path):
+    """Test that a checkpoint can't be resumed by another optimization method."""
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    run_differential_evolution(checkpoint_path, 2)
+    
+    with pytest.raises(ValueError):
+        pipeline.run_optimization(rosenbrock, np.zeros(3), '', None, 'Nelder-Mead', {"method": "Nelder-Mead", "options": {}}, (),
+                                  optimization_checkpoint=checkpoint.OptimizationCheckpoint(checkpoint_path, resume=True))
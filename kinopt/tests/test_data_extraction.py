@@ -0,0 +1,215 @@
+import numpy as np
+from kinopt.src import data_extraction
+
+
+def write_dsc_file(path, number_of_points=50):
+    """Write a simple DSC file with a header and an extent reaching 1 before the end."""
+    time = np.linspace(0, 100, number_of_points)
+    temperature = np.linspace(300, 400, number_of_points)
+    extent = np.clip(np.linspace(0, 1.2, number_of_points), 0, 1)
+    rate = np.gradient(extent, time)
+    np.savetxt(path, np.column_stack((time, temperature, rate, extent)), delimiter=',', header="Time,Temperature,Rate,Extent", comments='')
+    return time, temperature, rate, extent
+
+
+def test_single_file_memmap_matches_in_memory_extraction(tmp_path):
+    """
+    Test that extracting a file with use_memmap returns memory-mapped arrays equal to the
+    arrays obtained with a regular extraction, including the removal of data after extent reaches 1.
+    """
+    file_path = str(tmp_path / "experiment.csv")
+    write_dsc_file(file_path)
+    
+    expected = data_extraction.extract_dsc_data_single_file(file_path, has_header=True)
+    result = data_extraction.extract_dsc_data_single_file(file_path, has_header=True, use_memmap=True, cache_directory=str(tmp_path / "cache"))
+    
+    for expected_array, array in zip(expected, result):
+        assert isinstance(array, np.memmap)
+        assert np.array_equal(expected_array, array)
+    assert result[3][-1] == 1
+
+
+def test_multiple_files_memmap_matches_in_memory_extraction(tmp_path):
+    """
+    Test that the concatenated memory-mapped arrays match the concatenated in-memory arrays
+    and that the conversion is reused when the files are extracted again.
+    """
+    file_paths = [str(tmp_path / "experiment_1.csv"), str(tmp_path / "experiment_2.csv")]
+    write_dsc_file(file_paths[0], 40)
+    write_dsc_file(file_paths[1], 60)
+    cache_directory = str(tmp_path / "cache")
+    
+    expected = data_extraction.extract_dsc_data_multiple_files(file_paths, has_header=True)
+    result = data_extraction.extract_dsc_data_multiple_files(file_paths, has_header=True, use_memmap=True, cache_directory=cache_directory)
+    
+    for expected_array, array in zip(expected, result):
+        assert isinstance(array, np.memmap)
+        assert np.array_equal(expected_array, array)
+    
+    number_of_cache_files = len(list((tmp_path / "cache").iterdir()))
+    data_extraction.extract_dsc_data_multiple_files(file_paths, has_header=True, use_memmap=True, cache_directory=cache_directory)
+    assert len(list((tmp_path / "cache").iterdir())) == number_of_cache_files
+
+
+def test_validate_dsc_data_reports_errors_warnings_and_infos():
+    """
+    Test that validate_dsc_data returns a structured report instead of printing,
+    with errors for a decreasing extent and a rate not consistent with the extent,
+    and a warning for a temperature in Celsius.
+    """
+    time = np.array([0.0, 1.0, 2.0, 3.0])
+    temperature = np.array([25.0, 26.0, 27.0, 28.0])
+    rate = np.array([0.2, 0.2, 0.2, 0.2])
+    extent = np.array([0.0, 0.2, 0.1, 0.3])
+    
+    report = data_extraction.validate_dsc_data(time, temperature, rate, extent, "experiment.csv")
+    
+    assert not report.is_valid
+    assert any("non-decreasing" in message for message in report.errors)
+    assert any("Integral" in message for message in report.errors)
+    assert len(report.warnings) == 1
+    assert "Error in file experiment.csv" in report.to_text()
+
+
+def test_multiple_files_extraction_returns_one_report_per_file(tmp_path, capsys):
+    """
+    Test that return_reports gives a valid report per file, that unreadable files are reported 
+    as errors instead of raising, and that nothing is printed.
+    """
+    file_paths = [str(tmp_path / "experiment_1.csv"), str(tmp_path / "experiment_2.csv")]
+    write_dsc_file(file_paths[0], 200)
+    write_dsc_file(file_paths[1], 300)
+    
+    *arrays, reports = data_extraction.extract_dsc_data_multiple_files(file_paths, has_header=True, return_reports=True, workers=2)
+    assert [report.file_name for report in reports] == ["experiment_1.csv", "experiment_2.csv"]
+    assert all(report.is_valid for report in reports)
+    assert len(arrays[0]) > 0
+    
+    *arrays, reports = data_extraction.extract_dsc_data_multiple_files(file_paths + [str(tmp_path / "missing.csv")], has_header=True, return_reports=True)
+    assert arrays == [None, None, None, None]
+    assert not reports[2].is_valid
+    assert capsys.readouterr().out == ""
+
+
+def test_incremental_extraction_only_re_extracts_changed_files(tmp_path, monkeypatch):
+    """
+    Test that the incremental extraction re-extracts only modified or new files, 
+    ignores files touched without modification, and updates the concatenated arrays.
+    """
+    file_paths = [str(tmp_path / "experiment_1.csv"), str(tmp_path / "experiment_2.csv")]
+    write_dsc_file(file_paths[0], 40)
+    write_dsc_file(file_paths[1], 60)
+    
+    extraction = data_extraction.IncrementalExtraction(file_paths, has_header=True)
+    assert extraction.update() == file_paths
+    assert extraction.update() == []
+    number_of_points = len(extraction.get_concatenated_arrays()[0])
+    
+    extracted_files = []
+    original_extraction = data_extraction.extract_and_validate_dsc_data
+    def spy(file_path, *args, **kwargs):
+        extracted_files.append(file_path)
+        return original_extraction(file_path, *args, **kwargs)
+    monkeypatch.setattr(data_extraction, "extract_and_validate_dsc_data", spy)
+    
+    # Touched without modification
+    stat = data_extraction.os.stat(file_paths[0])
+    data_extraction.os.utime(file_paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert extraction.update() == []
+    
+    # Modified file
+    write_dsc_file(file_paths[1], 80)
+    data_extraction.os.utime(file_paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert extraction.update() == [file_paths[1]]
+    assert extracted_files == [file_paths[1]]
+    assert len(extraction.get_concatenated_arrays()[0]) > number_of_points
+    
+    # New file in the same folder
+    new_file_path = str(tmp_path / "experiment_3.csv")
+    write_dsc_file(new_file_path, 30)
+    assert extraction.find_new_files() == [new_file_path]
+    assert extraction.update(file_paths + [new_file_path]) == [new_file_path]
+    assert len(extraction.get_arrays_lists()[0]) == 3
+    assert extraction.is_complete
+
+
+def test_memmap_keeps_one_concatenation_per_cache_directory(tmp_path):
+    """Test that extracting another selection of files removes the concatenated binary file of the previous selection."""
+    file_paths = [str(tmp_path / "experiment_1.csv"), str(tmp_path / "experiment_2.csv"), str(tmp_path / "experiment_3.csv")]
+    for file_path in file_paths:
+        write_dsc_file(file_path)
+    cache_directory = tmp_path / "cache"
+    
+    data_extraction.extract_dsc_data_multiple_files(file_paths[:2], has_header=True, use_memmap=True, cache_directory=str(cache_directory))
+    result = data_extraction.extract_dsc_data_multiple_files(file_paths[1:], has_header=True, use_memmap=True, cache_directory=str(cache_directory))
+    
+    assert len(list(cache_directory.glob("concatenated.*.npy"))) == 1
+    assert len(list(cache_directory.glob("experiment_*.npy"))) == 3
+    assert len(result[0]) == 2 * len(data_extraction.extract_dsc_data_single_file(file_paths[0], has_header=True)[0])
+
+
+def test_incremental_extraction_only_follows_valid_new_files(tmp_path, monkeypatch):
+    """
+    Test that files already extracted are followed without being parsed again, and that a new file 
+    which isn't valid isn't followed nor parsed again until it changes.
+    """
+    file_path = str(tmp_path / "experiment_1.csv")
+    arrays = write_dsc_file(file_path, 40)
+    notes_path = tmp_path / "notes.csv"
+    notes_path.write_text("not,a,dsc\nfile,at,all\n")
+    
+    extracted_files = []
+    original_extraction = data_extraction.extract_and_validate_dsc_data
+    def spy(file_path, *args, **kwargs):
+        extracted_files.append(file_path)
+        return original_extraction(file_path, *args, **kwargs)
+    monkeypatch.setattr(data_extraction, "extract_and_validate_dsc_data", spy)
+    
+    extraction = data_extraction.IncrementalExtraction([], has_header=True)
+    extraction.add_extracted_files([file_path], [arrays])
+    assert extraction.update() == []
+    
+    assert extraction.add_new_files() == []
+    assert extraction.add_new_files() == []
+    assert extracted_files == [str(notes_path)]
+    assert extraction.file_paths == [file_path]
+    
+    # Once the file is complete, it is followed
+    write_dsc_file(str(notes_path), 30)
+    stat = data_extraction.os.stat(notes_path)
+    data_extraction.os.utime(notes_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert extraction.add_new_files() == [str(notes_path)]
+    assert len(extraction.get_arrays_lists()[0]) == 2
+
+
+def test_malformed_file_is_rejected_with_and_without_memmap(tmp_path):
+    """Test that a file with a value that isn't a number can't be read, whether it is memory-mapped or not."""
+    file_path = tmp_path / "experiment.csv"
+    write_dsc_file(str(file_path))
+    lines = file_path.read_text().splitlines()
+    lines[5] = "abc," + lines[5].split(",", 1)[1]
+    file_path.write_text("\n".join(lines))
+    
+    for use_memmap in (False, True):
+        arrays, report = data_extraction.extract_and_validate_dsc_data(str(file_path), has_header=True, use_memmap=use_memmap,
+                                                                       cache_directory=str(tmp_path / "cache"))
+        assert arrays is None
+        assert report.errors[0].startswith("The file couldn't be read")
+
+
+def test_memmap_keeps_one_binary_file_per_input_file(tmp_path):
+    """Test that converting a modified file removes the binary file of its previous version only."""
+    file_paths = [str(tmp_path / "experiment_1.csv"), str(tmp_path / "experiment_2.csv")]
+    for file_path in file_paths:
+        write_dsc_file(file_path)
+    cache_directory = tmp_path / "cache"
+    data_extraction.extract_dsc_data_multiple_files(file_paths, has_header=True, use_memmap=True, cache_directory=str(cache_directory))
+    
+    write_dsc_file(file_paths[0], 80)
+    stat = data_extraction.os.stat(file_paths[0])
+    data_extraction.os.utime(file_paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    result = data_extraction.extract_dsc_data_single_file(file_paths[0], has_header=True, use_memmap=True, cache_directory=str(cache_directory))
+    
+    assert len(list(cache_directory.glob("experiment_1.*.npy"))) == 1
+    assert len(list(cache_directory.glob("experiment_2.*.npy"))) == 1
+    assert np.array_equal(result[0], data_extraction.extract_dsc_data_single_file(file_paths[0], has_header=True)[0])
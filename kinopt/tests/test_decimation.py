@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from kinopt.src import decimation
+
+
+def create_oversampled_experiment(number_of_points=20000):
+    """Create a synthetic oversampled experiment with a sharp peak of rate."""
+    time = np.linspace(0, 1000, number_of_points)
+    temperature = 300 + 0.1 * time
+    rate = np.exp(-((time - 500) / 30) ** 2)
+    extent = np.cumsum(rate)
+    extent = extent / extent[-1]
+    return time, temperature, rate, extent
+
+
+def test_decimation_with_tolerance_respects_error_bound():
+    """Test that the tolerance-based decimation keeps the reconstruction error below the tolerance."""
+    time, temperature, rate, extent = create_oversampled_experiment()
+    indices, errors = decimation.decimate_experiment(time, temperature, rate, extent, tolerance=1e-3)
+
+    assert np.max(errors) <= 1e-3
+    assert len(indices) < len(time) / 10
+    assert indices[0] == 0 and indices[-1] == len(time) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_decimation_with_number_of_points():
+    """Test that the target number of points is not exceeded and that points concentrate on the peak."""
+    time, temperature, rate, extent = create_oversampled_experiment()
+    indices, _ = decimation.decimate_experiment(time, temperature, rate, extent, number_of_points=200)
+
+    assert 2 < len(indices) <= 200
+    kept_time = time[indices]
+    assert np.sum(np.abs(kept_time - 500) < 100) > np.sum(kept_time < 200)
+
+
+def test_decimate_experiments_report():
+    """Test the decimation of multiple experiments and the associated report."""
+    experiments = [create_oversampled_experiment(5000), create_oversampled_experiment(8000)]
+    times, temperatures, rates, extents, report = decimation.decimate_experiments(*[list(column) for column in zip(*experiments)],
+                                                                                  number_of_points=100, tolerance=1e-2)
+
+    assert len(times) == 2
+    assert all(len(t) == len(r) == len(x) == len(T) for t, T, r, x in zip(times, temperatures, rates, extents))
+    assert report.original_number_of_points == [5000, 8000]
+    assert report.speedup > 10
+    assert report.max_error <= 1e-2
+    assert "speedup" in report.to_text()
+
+
+def test_decimation_without_option_raises():
+    """Test that a ValueError is raised if neither a number of points nor a tolerance is given."""
+    time, temperature, rate, extent = create_oversampled_experiment(100)
+    with pytest.raises(ValueError):
+        decimation.decimate_experiment(time, temperature, rate, extent)
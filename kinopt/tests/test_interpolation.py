@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from scipy import interpolate
 from kinopt.src import interpolation as interp
 
 def test_linear_interpolation():
@@ -83,4 +84,185 @@ def test_linear_interpolation_multiple_limits():
     assert np.allclose(new_conversions, expected_conversions)
     assert np.allclose(new_times, expected_times)
     assert np.allclose(new_temperatures, expected_temperatures)
-    assert np.allclose(new_rates, expected_rates)
\ No newline at end of file
+    assert np.allclose(new_rates, expected_rates)
+
+@pytest.mark.parametrize("conversion", [[0, 0.2, 0.4, 0.6, 0.8, 0.8], [0, 0.2, 0.15, 0.6, 0.8, 0.9]])
+def test_linear_interpolation_multiple_limits_with_plateau_or_non_monotonic_conversion(conversion):
+    """
+    Test that a final plateau of conversion doesn't give NaN, and that a plateau or a non-monotonic 
+    conversion gives the same result as scipy.interpolate.interp1d.
+    """
+    conversions = [np.array(conversion)]
+    times = [np.arange(6.0)]
+    
+    new_conversions, new_times, new_temperatures, new_rates = interp.linear_interpolation_multiple_limits(
+        conversions, times, times, times, 9)
+    
+    assert np.all(np.isfinite(new_times))
+    expected = interpolate.interp1d(conversions[0], times[0])(new_conversions[0])
+    assert np.allclose(new_times[0], expected)
+    assert np.allclose(new_rates[0], expected)
+
+
+def test_batched_linear_interpolation_ragged_and_padded():
+    """
+    Test that the batched linear interpolation of ragged and NaN-padded experiments gives 
+    the same result as np.interp applied to each experiment, and writes in the provided arrays.
+    """
+    rng = np.random.default_rng(1)
+    lengths = [50, 80, 120]
+    conversions = [np.sort(rng.random(length)) for length in lengths]
+    times = [np.cumsum(rng.random(length)) for length in lengths]
+    minimum = max(conversion[0] for conversion in conversions)
+    maximum = min(conversion[-1] for conversion in conversions)
+    new_conversion = np.linspace(minimum, maximum, 40)
+    
+    out = [np.empty((3, 40))]
+    result = interp.batched_linear_interpolation(conversions, [times], new_conversion, out=out)
+    assert result[0] is out[0]
+    for i in range(3):
+        assert np.allclose(result[0][i], np.interp(new_conversion, conversions[i], times[i]))
+    
+    padded_conversions = np.full((3, max(lengths)), np.nan)
+    padded_times = np.full((3, max(lengths)), np.nan)
+    for i, length in enumerate(lengths):
+        padded_conversions[i, :length] = conversions[i]
+        padded_times[i, :length] = times[i]
+    padded_result = interp.batched_linear_interpolation(padded_conversions, [padded_times], new_conversion)
+    assert np.allclose(padded_result[0], result[0])
+
+
+@pytest.mark.parametrize("method, scipy_class", [("cubic", "CubicSpline"), ("pchip", "PchipInterpolator")])
+def test_batched_spline_matches_scipy(method, scipy_class):
+    """
+    Test that the batched spline evaluated on a shared grid and on per-experiment grids 
+    matches the scipy splines built for each experiment and each column.
+    """
+    from scipy import interpolate
+    rng = np.random.default_rng(2)
+    conversions = [np.sort(rng.random(length)) for length in (8, 12, 20)]
+    times = [np.cumsum(rng.random(len(conversion))) for conversion in conversions]
+    rates = [rng.random(len(conversion)) for conversion in conversions]
+    
+    spline = interp.BatchedSpline(conversions, [times, rates], method)
+    
+    shared_grid = np.linspace(0.2, 0.8, 15)
+    per_experiment_grids = np.array([np.linspace(conversion[0], conversion[-1], 15) for conversion in conversions])
+    for grid in (shared_grid, per_experiment_grids):
+        new_times, new_rates = spline(grid)
+        for i, conversion in enumerate(conversions):
+            experiment_grid = grid if grid.ndim == 1 else grid[i]
+            expected_times = getattr(interpolate, scipy_class)(conversion, times[i])(experiment_grid)
+            expected_rates = getattr(interpolate, scipy_class)(conversion, rates[i])(experiment_grid)
+            assert np.allclose(new_times[i], expected_times)
+            assert np.allclose(new_rates[i], expected_rates)
+
+
+def test_cubic_spline_interpolation_multiple_limits():
+    """
+    Test that the cubic spline interpolation with multiple limits interpolates each experiment 
+    between its own limits and returns conversion, time, temperature and rate arrays.
+    """
+    conversions = [np.linspace(0.0, 0.9, 6), np.linspace(0.1, 1.0, 5)]
+    times = [2 * conversion for conversion in conversions]
+    temperatures = [300 + 100 * conversion for conversion in conversions]
+    rates = [conversion**2 for conversion in conversions]
+    
+    new_conversions, new_times, new_temperatures, new_rates = interp.cubic_spline_interpolation_multiple_limits(
+        conversions, times, temperatures, rates, 7
+    )
+    
+    assert np.allclose(new_conversions[0], np.linspace(0.0, 0.9, 7))
+    assert np.allclose(new_conversions[1], np.linspace(0.1, 1.0, 7))
+    assert np.allclose(new_times, 2 * new_conversions)
+    assert np.allclose(new_temperatures, 300 + 100 * new_conversions)
+    assert np.allclose(new_rates, new_conversions**2)
+
+
+def test_adaptive_conversion_grid_concentrates_points_on_peak():
+    """
+    Test that the adaptive grid meets the tolerance at the midpoints of its intervals 
+    and places more points around a sharp peak of rate than in flat regions.
+    """
+    conversions = [np.linspace(0, 1, 2001), np.linspace(0, 1, 1501)]
+    rates = [np.exp(-((conversion - 0.3) / 0.02) ** 2) for conversion in conversions]
+    temperatures = [300 + 50 * conversion for conversion in conversions]
+    
+    grid = interp.adaptive_conversion_grid(conversions, [temperatures, rates], 1e-3)
+    
+    assert grid[0] == 0 and grid[-1] == 1
+    assert np.all(np.diff(grid) > 0)
+    midpoints = 0.5 * (grid[:-1] + grid[1:])
+    for conversion, rate in zip(conversions, rates):
+        grid_rate = np.interp(grid, conversion, rate)
+        assert np.max(np.abs(np.interp(midpoints, grid, grid_rate) - np.interp(midpoints, conversion, rate))) <= 1e-3
+    assert np.sum(np.abs(grid - 0.3) < 0.1) > 3 * np.sum(grid > 0.6)
+    
+    new_conversions, _, _, new_rates = interp.linear_interpolation(conversions, conversions, temperatures, rates, 500, tolerance=1e-3)
+    assert new_conversions.shape == (2, len(grid))
+    assert len(grid) < 500
+
+
+def test_interpolation_cache_returns_copies_and_evicts_by_bytes():
+    """
+    Test that an interpolation called again with the same data and settings is taken from the cache, 
+    that modifying a returned array doesn't modify the stored result, and that the least recently used 
+    results are evicted when the size of the cache is exceeded.
+    """
+    interp.interpolation_cache.clear()
+    conversions = [np.linspace(0, 1, 100)]
+    times = [np.linspace(0, 10, 100)]
+    temperatures = [np.linspace(300, 400, 100)]
+    rates = [np.ones(100)]
+    
+    first = interp.linear_interpolation(conversions, times, temperatures, rates, 50)
+    first[1][0, 0] = -1.0
+    hits = interp.interpolation_cache.hits
+    second = interp.linear_interpolation(conversions, times, temperatures, rates, 50)
+    assert interp.interpolation_cache.hits == hits + 1
+    assert second[1][0, 0] == 0.0
+    
+    # Different data or settings are different entries
+    interp.linear_interpolation(conversions, [2 * times[0]], temperatures, rates, 50)
+    interp.linear_interpolation(conversions, times, temperatures, rates, 60)
+    assert len(interp.interpolation_cache) == 3
+    
+    cache = interp.InterpolationCache(max_bytes=1000)
+    cache.put("a", (np.zeros(50),))
+    cache.put("b", (np.zeros(50),))
+    cache.get("a")
+    cache.put("c", (np.zeros(50),))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.current_bytes == 800
+    interp.interpolation_cache.clear()
+
+
+@pytest.mark.parametrize("function", [interp.cubic_spline_interpolation, interp.cubic_spline_interpolation_multiple_limits])
+def test_spline_interpolation_reuses_splines_for_another_number_of_points(function, monkeypatch):
+    """
+    Test that the spline interpolation with another number of points evaluates the splines 
+    already built for the same data and method, instead of fitting them again.
+    """
+    interp.spline_cache.clear()
+    conversions = [np.linspace(0, 1, 30), np.linspace(0.1, 0.9, 40)]
+    times = [np.linspace(0, 10, 30), np.linspace(0, 20, 40)]
+    temperatures = [np.linspace(300, 400, 30), np.linspace(300, 450, 40)]
+    rates = [np.ones(30), np.ones(40)]
+    
+    fitted_splines = []
+    original_init = interp.BatchedSpline.__init__
+    def spy(self, *args, **kwargs):
+        fitted_splines.append(args)
+        original_init(self, *args, **kwargs)
+    monkeypatch.setattr(interp.BatchedSpline, "__init__", spy)
+    
+    expected = function(conversions, times, temperatures, rates, 20)
+    result = function(conversions, times, temperatures, rates, 35)
+    assert len(fitted_splines) == 1
+    assert result[1].shape == (2, 35)
+    assert np.allclose(function(conversions, times, temperatures, rates, 20)[1], expected[1])
+    
+    function(conversions, times, temperatures, rates, 35, method='pchip')
+    assert len(fitted_splines) == 2
+    interp.spline_cache.clear()
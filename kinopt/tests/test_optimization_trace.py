@@ -0,0 +1,42 @@
+import numpy as np
+import scipy.optimize
+from kinopt.src import pipeline
+from kinopt.src import optimization_trace
+
+
+def test_columnar_buffer_grows():
+    """Test that the buffer keeps all the rows appended beyond its initial capacity, with NaN for missing values."""
+    buffer = optimization_trace.ColumnarBuffer({"time": (), "x": (2,)}, capacity=4)
+    for index in range(10):
+        buffer.append(time=float(index), x=None if index == 3 else [index, -index])
+    
+    arrays = buffer.to_arrays()
+    
+    np.testing.assert_array_equal(arrays['time'], np.arange(10))
+    assert arrays['x'].shape == (10, 2)
+    assert np.isnan(arrays['x'][3]).all()
+    np.testing.assert_array_equal(arrays['x'][9], [9, -9])
+
+
+def test_trace_of_optimization(tmp_path):
+    """Test that the trace records each iteration of an optimization, and that it's saved and summarized."""
+    trace_path = str(tmp_path / "trace.npz")
+    trace = optimization_trace.OptimizationTrace(trace_path, parameter_names=["a", "b", "c"], method="Nelder-Mead")
+    
+    result = pipeline.run_optimization(scipy.optimize.rosen, np.zeros(3), '', None, 'Nelder-Mead',
+                                       {"method": "Nelder-Mead", "options": {"maxiter": 300}}, (), optimization_trace=trace)
+    
+    loaded_trace = optimization_trace.load_trace(trace_path)
+    assert loaded_trace['parameter_names'] == ["a", "b", "c"]
+    assert len(loaded_trace['iteration']) == result.nit
+    assert np.all(np.diff(loaded_trace['number_of_evaluations']) >= 0)
+    assert loaded_trace['number_of_evaluations'][-1] == result.nfev
+    assert np.all(np.diff(loaded_trace['best_fun']) <= 0)
+    assert np.all(np.diff(loaded_trace['time']) >= 0)
+    np.testing.assert_allclose(loaded_trace['x'][-1], result.x)
+    
+    summary = optimization_trace.summarize_trace(loaded_trace)
+    assert summary['method'] == "Nelder-Mead"
+    assert summary['number_of_iterations'] == result.nit
+    assert np.isclose(summary['best_fun'], result.fun)
+    assert summary['iterations_to_converge'] <= result.nit
@@ -0,0 +1,85 @@
+import numpy as np
+import scipy.optimize
+from kinopt.src import optimization_worker
+from kinopt.src import optimization as opt
+
+
+def collect_messages(worker):
+    """Collect the messages of a worker until its result or an error."""
+    messages = []
+    while not messages or messages[-1][0] == "callback":
+        message = worker.get_message(timeout=1)
+        if message is not None:
+            messages.append(message)
+    worker.join()
+    return messages
+
+
+def test_worker_sends_progress_and_result():
+    """Test that the worker process sends the arguments of each callback then the result of the optimization."""
+    worker = optimization_worker.OptimizationWorker({"cost_function": scipy.optimize.rosen,
+                                                     "initial_guess": np.zeros(3),
+                                                     "selected_global_optimization": '',
+                                                     "global_optimization_args_dict": None,
+                                                     "selected_local_optimization": 'Nelder-Mead',
+                                                     "local_optimization_args_dict": {"method": "Nelder-Mead", "options": {"maxiter": 2000}},
+                                                     "args": ()})
+    worker.start()
+    messages = collect_messages(worker)
+    
+    assert messages[-1][0] == "result"
+    result = messages[-1][1]
+    assert np.allclose(result.x, 1, atol=1e-3)
+    callback_messages = messages[:-1]
+    assert len(callback_messages) == result.nit
+    assert np.allclose(callback_messages[-1][1], result.x)
+
+
+def test_worker_cancellation_returns_best_point():
+    """Test that a cancelled worker stops and sends the best point found so far."""
+    worker = optimization_worker.OptimizationWorker({"cost_function": scipy.optimize.rosen,
+                                                     "initial_guess": np.zeros(5),
+                                                     "selected_global_optimization": 'differential_evolution',
+                                                     "global_optimization_args_dict": {"bounds": [(-2, 2)] * 5, "maxiter": 10**6, "tol": 0},
+                                                     "selected_local_optimization": '',
+                                                     "local_optimization_args_dict": None,
+                                                     "args": ()})
+    worker.start()
+    while worker.get_message(timeout=1)[0] != "callback":
+        pass
+    worker.request_cancellation()
+    messages = collect_messages(worker)
+    
+    result = messages[-1][1]
+    assert messages[-1][0] == "result"
+    assert result.cancelled
+    assert np.isclose(scipy.optimize.rosen(result.x), result.fun)
+
+
+def linear_rate_law(time, temperature, a, b, *args):
+    """Rate law a * time + b, defined at module level so that it can be sent to the worker process."""
+    return a * time + b
+
+
+def test_worker_sends_rate_of_model():
+    """Test that the worker sends the rate of the model for the parameters of the callbacks and of the result."""
+    time = np.linspace(0, 1, 50)
+    temperature = np.full(50, 300.)
+    experimental_rate = linear_rate_law(time, temperature, 2., 1.)
+    model_args = (linear_rate_law, (time, temperature), 2, None, None, 0, None, None, None, None, None)
+    worker = optimization_worker.OptimizationWorker({"cost_function": opt.rss_standard,
+                                                     "initial_guess": np.zeros(2),
+                                                     "selected_global_optimization": '',
+                                                     "global_optimization_args_dict": None,
+                                                     "selected_local_optimization": 'Nelder-Mead',
+                                                     "local_optimization_args_dict": {"method": "Nelder-Mead", "options": {"maxiter": 2000}},
+                                                     "args": (experimental_rate, *model_args)},
+                                                    model_args=model_args,
+                                                    model_update_interval=0)
+    worker.start()
+    messages = collect_messages(worker)
+    
+    _, result, _, model_rate = messages[-1]
+    np.testing.assert_allclose(model_rate, linear_rate_law(time, temperature, *result.x))
+    _, xk, _, _, model_rate = messages[0]
+    np.testing.assert_allclose(model_rate, linear_rate_law(time, temperature, *xk))
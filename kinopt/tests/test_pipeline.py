@@ -0,0 +1,84 @@
+import os
+import json
+import time
+import threading
+import pytest
+import numpy as np
+from kinopt.src import pipeline
+
+
+DATA_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+
+def write_config(tmp_path, optimization):
+    """Write a configuration using the Kamal data, with paths relative to the configuration file."""
+    file_names = ["data_kamal_heating_rate_5C_per_min.txt", "data_kamal_heating_rate_10C_per_min.txt", "data_kamal_heating_rate_20C_per_min.txt"]
+    config = {"name": "kamal",
+              "data": {"files": [os.path.relpath(os.path.join(DATA_DIRECTORY, file_name), tmp_path) for file_name in file_names],
+                       "delimiter": ",",
+                       "has_header": True,
+                       "decimation": {"number_of_points": 300}},
+              "interpolation": {"method": "linear", "number_of_points": 200},
+              "isoconversional_analysis": {"method": "isoconversional_analysis_friedman_method",
+                                           "parameters": {"min_conv": 0.1, "max_conv": 0.9, "number_of_points": 10}},
+              "optimization": optimization}
+    config_path = tmp_path / "kamal.json"
+    config_path.write_text(json.dumps(config))
+    return str(config_path)
+
+
+def test_run_pipeline_writes_results(tmp_path):
+    """Test that the whole pipeline runs from a configuration file and writes the results by parameter name."""
+    optimization = {"rate": {"law": "rate_for_nth_order", "initial_guess": {"A1": 1e5, "E1": 60000, "n": 1.5}},
+                    "local_optimization": {"method": "Nelder-Mead", "parameters": {"maxiter": 50}},
+                    "cost_function": {"function": "rss_mean"}}
+    config = pipeline.load_config(write_config(tmp_path, optimization))
+    
+    results = pipeline.run_pipeline(config, str(tmp_path / "results"))
+    
+    with open(results['results_path'], 'r') as file:
+        written_results = json.load(file)
+    assert written_results['number_of_points'] == 900
+    assert len(written_results['isoconversional_analysis']['activation_energy']) == 10
+    assert list(written_results['optimization']['parameters']) == ["A1", "E1", "n"]
+    assert written_results['optimization']['nit'] == 50
+    assert np.isclose(written_results['optimization']['fun'], written_results['optimization']['mean_rss'])
+
+
+def test_split_local_optimization_options():
+    """Test that the arguments of scipy.optimize.minimize() are separated from the options of the method."""
+    args_dict = pipeline.split_local_optimization_options({"bounds": [(0, 1)], "maxiter": 10, "xatol": 1e-4})
+    
+    assert args_dict['bounds'] == [(0, 1)]
+    assert args_dict['options'] == {"maxiter": 10, "xatol": 1e-4}
+
+
+def test_run_optimization_unknown_method():
+    """Test that an unknown global optimization method raises an error."""
+    with pytest.raises(ValueError):
+        pipeline.run_optimization(lambda x: np.sum(x**2), np.ones(2), "unknown", {}, '', None, ())
+
+
+def test_cancelled_optimization_returns_best_point():
+    """Test that setting the cancel flag stops the optimization quickly and returns the best point evaluated."""
+    evaluated_costs = []
+    
+    def cost_function(x):
+        evaluated_costs.append(np.sum((x - 1)**2))
+        return evaluated_costs[-1]
+    
+    def callback(xk, convergence):
+        # Request the cancellation from another thread, as the GUI does
+        if len(evaluated_costs) > 500:
+            threading.Thread(target=cancel_event.set).start()
+    
+    cancel_event = threading.Event()
+    start_time = time.time()
+    result = pipeline.run_optimization(cost_function, np.zeros(3), 'differential_evolution', {"bounds": [(-5, 5)] * 3, "maxiter": 10**6, "tol": 0},
+                                       '', None, (), callback=callback, cancel_event=cancel_event)
+    
+    assert time.time() - start_time < 5
+    assert result.cancelled
+    assert not result.success
+    assert result.fun == min(evaluated_costs)
+    assert np.isclose(cost_function(result.x), result.fun)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from kinopt.src import plot_decimation
+
+
+def test_min_max_decimation_keeps_peaks_and_ends():
+    """Test that the min/max decimation reduces a large curve while keeping its extrema, first and last points."""
+    x = np.linspace(0, 100, 200000)
+    y = np.sin(x)
+    y[123457] = 10
+    y[54321] = -10
+    
+    displayed_x, displayed_y = plot_decimation.decimate_for_display(x, y, number_of_points=500)
+    
+    assert len(displayed_x) <= 4 * 500
+    assert np.all(np.diff(displayed_x) > 0)
+    assert displayed_y.max() == 10 and displayed_y.min() == -10
+    assert displayed_x[0] == x[0] and displayed_x[-1] == x[-1]
+
+
+def test_lttb_decimation():
+    """Test that the LTTB decimation returns the requested number of sorted points, including a peak."""
+    x = np.linspace(0, 10, 10000)
+    y = np.zeros_like(x)
+    y[5000] = 1
+    
+    displayed_x, displayed_y = plot_decimation.decimate_for_display(x, y, number_of_points=100, method='lttb')
+    
+    assert len(displayed_x) == 100
+    assert np.all(np.diff(displayed_x) > 0)
+    assert displayed_y.max() == 1
+    with pytest.raises(ValueError):
+        plot_decimation.decimate_for_display(x, y, method='unknown')
+
+
+def test_decimation_of_visible_range_and_padding():
+    """Test that only the visible range is decimated, and that NaN padding of the results files is removed."""
+    x = np.concatenate((np.linspace(0, 100, 100001), np.full(100, np.nan)))
+    y = np.arange(len(x), dtype=float)
+    
+    displayed_x, displayed_y = plot_decimation.decimate_for_display(x, y, number_of_points=1000, x_limits=(40, 50))
+    
+    assert displayed_x[0] < 40 and displayed_x[1] >= 40
+    assert displayed_x[-1] > 50 and displayed_x[-2] <= 50
+    assert not np.isnan(displayed_x).any()
+    
+    small_x, small_y = plot_decimation.decimate_for_display(x[:50], y[:50], number_of_points=1000)
+    np.testing.assert_array_equal(small_y, y[:50])
@@ -0,0 +1,45 @@
+import numpy as np
+from kinopt.src import results_database
+
+
+def get_metadata(rate_law, fun, total_optimization_time, global_method="differential_evolution"):
+    """Describe a fictive optimization as the graphical interface does."""
+    return {"files": ["a.txt"],
+            "rate": {"law": rate_law, "initial_guess": {"A1": "1e5", "E1": "60000"}, "results": {"A1": 2e5, "E1": 61000.0}},
+            "vitrification": None,
+            "coupling": None,
+            "tg": None,
+            "global_optimization": {"method": global_method, "parameters": {"maxiter": 10}},
+            "local_optimization": None,
+            "cost_function": {"function": "rss_mean", "parameters": {}},
+            "results": {"fun": fun, "mean_rss": fun, "total_optimization_time": total_optimization_time,
+                        "success": True, "cancelled": False, "nfev": 100, "nit": 10},
+            "date": "2024-01-01T00:00:00"}
+
+
+def test_add_runs_and_query_them(tmp_path):
+    """Test that the runs are stored with their parameters and files, and compared by material and by optimizer."""
+    database_path = str(tmp_path / "results.sqlite")
+    experiments = {key: [np.linspace(0, 1, 50)] for key in ["time", "temperature", "rate", "extent"]}
+    other_experiments = {key: [np.linspace(0, 2, 50)] for key in ["time", "temperature", "rate", "extent"]}
+    
+    results_database.add_run(database_path, get_metadata("rate_for_kamal", 3.0, 10.0), experiments, material="epoxy")
+    best_run_id = results_database.add_run(database_path, get_metadata("rate_for_kamal", 1.0, 20.0), experiments, material="epoxy")
+    results_database.add_run(database_path, get_metadata("rate_for_kamal", 2.0, 1.0, "basinhopping"), other_experiments, material="polyester")
+    results_database.add_run(database_path, get_metadata("rate_for_nth_order", 0.5, 2.0), experiments, material="epoxy")
+    
+    best_runs = results_database.get_best_runs(database_path, rate_law="rate_for_kamal")
+    assert [(run['material'], run['fun']) for run in best_runs] == [("epoxy", 1.0), ("polyester", 2.0)]
+    assert best_runs[0]['id'] == best_run_id
+    assert best_runs[0]['data_fingerprint'] != best_runs[1]['data_fingerprint']
+    assert len(results_database.get_best_runs(database_path, group_by="data_fingerprint")) == 3
+    
+    runtimes = results_database.get_runtime_by_optimizer(database_path)
+    assert [(row['global_optimization'], row['number_of_runs']) for row in runtimes] == [("basinhopping", 1), ("differential_evolution", 3)]
+    assert np.isclose(runtimes[1]['mean_optimization_time'], 32.0 / 3)
+    
+    assert results_database.get_run_parameters(database_path, best_run_id) == {"rate": {"A1": 2e5, "E1": 61000.0}}
+    connection = results_database.connect(database_path)
+    row = connection.execute("SELECT * FROM files WHERE run_id = ?", (best_run_id,)).fetchone()
+    connection.close()
+    assert row['file_name'] == "a.txt" and row['number_of_points'] == 50 and row['duration'] == 1.0
@@ -0,0 +1,78 @@
+import os
+import numpy as np
+import scipy.optimize
+from kinopt.src import results_storage
+
+
+def test_save_and_load_results(tmp_path):
+    """Test that the data, parameters and metadata of an optimization are saved and loaded at full precision."""
+    results_path = results_storage.get_data_path(str(tmp_path / "results_of_optimization.txt"))
+    rng = np.random.default_rng(0)
+    experiments = {key: [rng.random(1000), rng.random(700)] for key in results_storage.DATA_KEYS}
+    model_rate = rng.random(1700)
+    metadata = {"files": ["a.txt", "b.txt"],
+                "rate": {"law": "rate_for_kamal", "results": {"A1": np.float64(1.5e10)}},
+                "global_optimization": {"method": "basinhopping", "parameters": {"niter": 10, "minimizer": scipy.optimize.minimize}}}
+    
+    results_storage.save_results(results_path, metadata, experiments, x=np.array([1.5e10]), model_rate=model_rate)
+    
+    assert results_path.endswith("results_of_optimization.npz")
+    assert not os.path.exists(results_path + ".tmp")
+    loaded_metadata = results_storage.load_metadata(results_path)
+    assert loaded_metadata['files'] == ["a.txt", "b.txt"]
+    assert loaded_metadata['rate']['results']['A1'] == 1.5e10
+    assert loaded_metadata['global_optimization']['parameters']['minimizer'] == "minimize"
+    
+    results = results_storage.load_results(results_path)
+    for key in results_storage.DATA_KEYS:
+        assert len(results[key]) == 2
+        np.testing.assert_array_equal(results[key][0], experiments[key][0])
+        np.testing.assert_array_equal(results[key][1], experiments[key][1])
+    np.testing.assert_array_equal(np.concatenate(results['model_rate']), model_rate)
+    np.testing.assert_array_equal(results['x'], [1.5e10])
+
+
+def test_read_legacy_summary_by_parts(tmp_path):
+    """Test that the header, the data rows and the pages of a summary with its data written as text are read separately."""
+    summary_path = tmp_path / "old_results_of_optimization.txt"
+    times = [np.arange(5.0), np.arange(3.0)]
+    rows = ["time1\ttemperature1\trate1\textent1\ttime2\ttemperature2\trate2\textent2"]
+    for index in range(5):
+        row = [times[0][index], 400.0, 0.1 * index, 0.2 * index]
+        row += [times[1][index], 410.0, 0.3, 0.4] if index < 3 else [np.nan] * 4
+        rows.append("\t".join(map(str, row)))
+    header = "================ Files ================\n- a.txt\n- b.txt\n" + results_storage.DATA_SECTION_TITLE + " ================\n"
+    summary_path.write_text(header + "\n".join(rows) + "\n")
+    
+    header_text, data_offset = results_storage.read_summary_header(str(summary_path))
+    assert header_text == header
+    
+    experiments = results_storage.load_summary_data(str(summary_path), data_offset)
+    np.testing.assert_array_equal(experiments['time'][0], times[0])
+    np.testing.assert_array_equal(experiments['time'][1], times[1])
+    np.testing.assert_array_equal(experiments['rate'][0], 0.1 * np.arange(5))
+    np.testing.assert_array_equal(experiments['extent'][1], [0.4, 0.4, 0.4])
+    
+    page, next_offset = results_storage.read_summary_lines(str(summary_path), data_offset, number_of_lines=4)
+    assert page.splitlines() == rows[:4]
+    page, next_offset = results_storage.read_summary_lines(str(summary_path), next_offset, number_of_lines=4)
+    assert page.splitlines() == rows[4:]
+    assert next_offset is None
+
+
+def test_open_atomically_keeps_the_previous_file_when_interrupted(tmp_path):
+    """Test that a file written with open_atomically is replaced once complete, and kept unchanged if the writing fails."""
+    path = str(tmp_path / "directory" / "state.json")
+    with results_storage.open_atomically(path) as file:
+        file.write("first")
+    
+    try:
+        with results_storage.open_atomically(path) as file:
+            file.write("partial")
+            raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+    
+    with open(path) as file:
+        assert file.read() == "first"
+    assert os.listdir(tmp_path / "directory") == ["state.json"]
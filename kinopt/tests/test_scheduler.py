@@ -0,0 +1,45 @@
+import os
+import json
+from kinopt.src import scheduler
+
+
+DATA_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+
+def create_manifest():
+    """Create a manifest with a valid dataset, a dataset with a missing file and one model."""
+    files = [os.path.join(DATA_DIRECTORY, file_name) for file_name in ("data_kamal_heating_rate_5C_per_min.txt", "data_kamal_heating_rate_10C_per_min.txt")]
+    return {"name": "batch",
+            "datasets": [{"name": "kamal", "data": {"files": files, "has_header": True, "decimation": {"number_of_points": 200}}},
+                         {"name": "missing", "data": {"files": [os.path.join(DATA_DIRECTORY, "missing.txt")], "has_header": True}}],
+            "models": [{"name": "nth_order",
+                        "optimization": {"rate": {"law": "rate_for_nth_order", "initial_guess": {"A1": 1e5, "E1": 60000, "n": 1.5}},
+                                         "local_optimization": {"method": "Nelder-Mead", "parameters": {"maxiter": 20}},
+                                         "cost_function": {"function": "rss_mean"}}}]}
+
+
+def test_create_jobs_combines_datasets_and_models():
+    """Test that a job is created for each dataset and model, with the sections of both."""
+    jobs = scheduler.create_jobs(create_manifest())
+    
+    assert list(jobs) == ["kamal__nth_order", "missing__nth_order"]
+    assert jobs["kamal__nth_order"]['optimization']['rate']['law'] == "rate_for_nth_order"
+    assert jobs["kamal__nth_order"]['data']['has_header']
+
+
+def test_batch_retries_failed_jobs_and_resumes(tmp_path):
+    """Test that failed jobs are retried, that the state is saved and that a new run only runs the jobs that aren't done."""
+    batch_scheduler = scheduler.BatchScheduler(create_manifest(), str(tmp_path), workers=2, timeout=60, retries=1, poll_interval=0.01)
+    state = batch_scheduler.run()
+    
+    assert state["kamal__nth_order"]['status'] == "done"
+    assert os.path.exists(state["kamal__nth_order"]['results_path'])
+    assert state["missing__nth_order"]['status'] == "failed"
+    assert state["missing__nth_order"]['attempts'] == 2
+    with open(batch_scheduler.state_path, 'r') as file:
+        assert json.load(file) == state
+    
+    # Resuming with more retries only runs the failed job again
+    state = scheduler.BatchScheduler(create_manifest(), str(tmp_path), workers=2, timeout=60, retries=2, poll_interval=0.01).run()
+    assert state["kamal__nth_order"]['attempts'] == 1
+    assert state["missing__nth_order"]['attempts'] == 3
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+from scipy import signal
+from kinopt.src import smoothing
+
+
+def create_noisy_experiments():
+    """Create experiments of different lengths with a noisy peak of rate and a noisy extent."""
+    rng = np.random.default_rng(0)
+    times = [np.linspace(0, 100, number_of_points) for number_of_points in (3000, 1200, 500)]
+    true_rates = [np.exp(-((time - 50) / 8) ** 2) for time in times]
+    rates = [rate + rng.normal(0, 0.03, len(rate)) for rate in true_rates]
+    extents = [np.cumsum(rate) / np.sum(rate) + rng.normal(0, 0.01, len(rate)) for rate in true_rates]
+    return times, true_rates, rates, extents
+
+
+def test_batched_savitzky_golay_filter_matches_scipy():
+    """Test that the filter applied to all experiments at once matches scipy's savgol_filter applied to each experiment."""
+    _, _, rates, _ = create_noisy_experiments()
+    flat_values, starts, lengths = smoothing.get_segments(rates)
+    
+    smoothed_values = smoothing.savitzky_golay_filter_batch(flat_values, starts, lengths, 31, 3)
+    expected_values = np.concatenate([signal.savgol_filter(rate, 31, 3, mode='interp') for rate in rates])
+    
+    assert np.allclose(smoothed_values, expected_values)
+
+
+def test_savitzky_golay_smoothing_with_automatic_window_reduces_noise():
+    """Test that the window selected by generalized cross-validation reduces the error to the noiseless data."""
+    _, true_rates, rates, _ = create_noisy_experiments()
+    
+    smoothed_rates, window_lengths = smoothing.savitzky_golay_smoothing(rates)
+    
+    assert all(window_length % 2 == 1 for window_length in window_lengths)
+    for smoothed_rate, true_rate, rate in zip(smoothed_rates, true_rates, rates):
+        assert len(smoothed_rate) == len(rate)
+        assert np.sqrt(np.mean((smoothed_rate - true_rate)**2)) < 0.3 * np.sqrt(np.mean((rate - true_rate)**2))
+
+
+def test_smooth_experiments_constraints_and_report():
+    """Test that smoothed rates are non-negative, smoothed extents are non-decreasing and timings are reported."""
+    times, _, rates, extents = create_noisy_experiments()
+    
+    new_times, new_temperatures, new_rates, new_extents, report = smoothing.smooth_experiments(times, times, rates, extents)
+    
+    assert all(np.all(rate >= 0) for rate in new_rates)
+    assert all(np.all(np.diff(extent) >= 0) for extent in new_extents)
+    assert set(report.timings) == {'savgol', 'constraints'}
+    assert report.number_of_points == 4700
+    assert "Smoothing (savgol)" in report.to_text()
+    
+    with pytest.raises(ValueError):
+        smoothing.smooth_experiments(times, times, rates, extents, method='lowess')
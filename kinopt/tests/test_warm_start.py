@@ -0,0 +1,52 @@
+import numpy as np
+from kinopt.src import results_database
+from kinopt.src import warm_start
+
+
+def get_metadata(x, nfev, warm_start_run_id=None):
+    """Describe a fictive optimization of a rate law with two parameters."""
+    return {"files": ["a.txt"],
+            "rate": {"law": "rate_for_nth_order", "initial_guess": {"A1": "1", "E1": "1"}, "results": {"A1": x[0], "E1": x[1]}},
+            "global_optimization": {"method": "differential_evolution", "parameters": {}},
+            "cost_function": {"function": "rss_mean", "parameters": {}},
+            "results": {"fun": 1.0, "mean_rss": 1.0, "total_optimization_time": nfev / 100, "nfev": nfev, "nit": 10},
+            "warm_start": {"run_id": warm_start_run_id} if warm_start_run_id is not None else None}
+
+
+def test_propose_warm_start_and_measure_savings(tmp_path):
+    """
+    Test that a previous run on the same data gives the initial guess, bounds and population, that the warm start 
+    only matches the laws, parameters and data it was proposed for, and that the savings are measured.
+    """
+    database_path = str(tmp_path / "results.sqlite")
+    time = np.linspace(0, 1000, 100)
+    experiments = {"time": [time], "temperature": [300 + 0.1 * time], "rate": [np.ones(100)], "extent": [time / 1000]}
+    other_experiments = dict(experiments, temperature=[500 + 0.1 * time])
+    laws = {"rate": "rate_for_nth_order", "vitrification": None, "coupling": None, "tg": None}
+    parameter_names = {"rate": ["A1", "E1"]}
+    
+    assert warm_start.propose_warm_start(database_path, laws, parameter_names, experiments) is None
+    run_id = results_database.add_run(database_path, get_metadata([2.0, 100.0], 1000), experiments)
+    
+    proposed_warm_start = warm_start.propose_warm_start(database_path, laws, parameter_names, experiments, bounds=[(0, 10), (0, 1000)])
+    assert proposed_warm_start.run_ids == [run_id]
+    np.testing.assert_array_equal(proposed_warm_start.initial_guess, [2.0, 100.0])
+    assert proposed_warm_start.bounds == [(1.0, 3.0), (50.0, 150.0)]
+    assert proposed_warm_start.matches(dict(laws, vitrification=''), parameter_names, experiments)
+    assert not proposed_warm_start.matches(dict(laws, rate="rate_for_kamal"), parameter_names, experiments)
+    assert not proposed_warm_start.matches(laws, {"rate": ["A1", "n"]}, experiments)
+    assert not proposed_warm_start.matches(laws, parameter_names, other_experiments)
+    assert warm_start.propose_warm_start(database_path, laws, parameter_names, other_experiments) is None
+    assert warm_start.propose_warm_start(database_path, dict(laws, tg="tg_dibenedetto"), parameter_names, experiments) is None
+    
+    args_dict = warm_start.apply_warm_start("differential_evolution", {"bounds": [(0, 10), (0, 1000)], "popsize": 5}, proposed_warm_start, seed=0)
+    assert args_dict['bounds'] == [(1.0, 3.0), (50.0, 150.0)]
+    assert args_dict['init'].shape == (10, 2)
+    np.testing.assert_array_equal(args_dict['init'][0], [2.0, 100.0])
+    assert np.all((args_dict['init'] >= [1.0, 50.0]) & (args_dict['init'] <= [3.0, 150.0]))
+    
+    results_database.add_run(database_path, get_metadata([2.0, 100.0], 250, run_id), experiments)
+    savings = warm_start.get_warm_start_savings(database_path)
+    assert len(savings) == 1
+    assert savings[0]['mean_nfev_cold'] == 1000 and savings[0]['mean_nfev_warm'] == 250
+    assert np.isclose(savings[0]['evaluation_savings'], 0.75)